@@ -202,6 +202,9 @@ def pyrogram_api():
             get_media_group
             get_chat_history
             get_chat_history_count
+            export_chat_history
+            broadcast_message
+            parse_template
             read_chat_history
             send_poll
             vote_poll
@@ -433,6 +436,7 @@ def pyrogram_api():
         Advanced
             invoke
             resolve_peer
+            resolve_peers
             save_file
         """
     )
@@ -541,6 +545,8 @@ def pyrogram_api():
             Giveaway
             GiveawayLaunched
             GiveawayResult
+            BroadcastResult
+            TextTemplate
             MessageStory
             WebPage
             WebPageEmpty
@@ -615,6 +621,7 @@ def pyrogram_api():
         Pyromod
             Identifier
             Listener
+            ListenerRegistry
         """,
         bot="""
         Bot
@@ -719,6 +726,14 @@ def pyrogram_api():
             InputContactMessageContent
             InputInvoiceMessageContent
         """,
+        compact="""
+        Compact records
+            CompactUser
+            CompactChat
+            CompactChatMember
+            CompactMessage
+            CompactDialog
+        """,
         authorization="""
         Authorization
             ActiveSession
@@ -58,9 +58,11 @@ def start():
         f_all.write("exceptions = {\n")
 
         count = 0
+        tables = []
 
         for i in files:
             code, name = re.search(r"(\d+)_([A-Z_]+)", i).groups()
+            module = "{}_{}".format(name.lower(), code)
 
             f_all.write("    {}: {{\n".format(code))
 
@@ -144,10 +146,35 @@ def start():
 
                 f_class.write(class_template)
 
+            tables.append((module, code, super_class, sub_classes))
+
             f_all.write("    },\n")
 
         f_all.write("}\n")
 
+    # Error code -> (generic class, {error id -> class}), with the classes already resolved,
+    # so that raising an error is just a couple of dict lookups
+    with open("{}/table.py".format(DEST), "w", encoding="utf-8") as f_table:
+        f_table.write(notice + "\n\n")
+
+        for module, _, _, _ in tables:
+            f_table.write("from . import {}\n".format(module))
+
+        f_table.write("\ntable = {\n")
+
+        for module, code, super_class, sub_classes in tables:
+            f_table.write("    {}: (\n".format(code))
+            f_table.write("        {}.{},\n".format(module, super_class))
+            f_table.write("        {\n")
+
+            for sub_class, error_id, _ in sub_classes:
+                f_table.write('            "{}": {}.{},\n'.format(error_id, module, sub_class))
+
+            f_table.write("        },\n")
+            f_table.write("    ),\n")
+
+        f_table.write("}\n")
+
     with open("{}/all.py".format(DEST), encoding="utf-8") as f:
         content = f.read()
 
@@ -26,6 +26,7 @@ import platform
 import re
 import shutil
 import sys
+import time
 from concurrent.futures.thread import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from hashlib import sha256
@@ -52,18 +53,21 @@ from pyrogram.errors import (
     PersistentTimestampOutdated,
 )
 from pyrogram.handlers.handler import Handler
+from pyrogram.handlers.process_pool import ProcessPool
 from pyrogram.methods import Methods
-from pyrogram.session import Auth, Session
+from pyrogram.session import Auth, Scheduler, Session, SessionPool
 from pyrogram.storage import FileStorage, MemoryStorage, Storage
-from pyrogram.types import User, TermsOfService
+from pyrogram.types import ListenerRegistry, User, TermsOfService
 from pyrogram.utils import ainput
 from .connection import Connection
 from .connection.transport import TCPAbridged
 from .dispatcher import Dispatcher
 from .file_id import FileId, FileType, ThumbnailSource
+from .metrics import Metrics
+from .watchdog import Watchdog
 from .mime_types import mime_types
 from .parser import Parser
-from .session.internals import MsgId
+from .session.internals import DataCenter, MsgId
 
 log = logging.getLogger(__name__)
 MONGO_AVAIL = False
@@ -221,6 +225,48 @@ class Client(Methods):
         client_platform (:obj:`~pyrogram.enums.ClientPlatform`, *optional*):
             The platform where this client is running.
             Defaults to 'other'
+
+        reuse_parsed_peers (``bool``, *optional*):
+            Pass True to reuse the :obj:`~pyrogram.types.User` and :obj:`~pyrogram.types.Chat` objects parsed from
+            previous updates when Telegram sends the same, unchanged, user or chat again.
+            Within a single batch of updates or messages these objects are always shared.
+            Defaults to False.
+
+        warm_dc_keys (``bool``, *optional*):
+            Pass True to create and store, in the background, the auth keys for all the data centers other than the
+            account one, as soon as the client is started. The first download, inline message edit or business
+            message pin on a foreign data center won't have to wait for an auth key exchange.
+            Defaults to False.
+
+        connections (``int``, *optional*):
+            Number of connections to open to the account data center, sharing the same auth key.
+            Requests are spread across them by load, so that slow or large responses don't hold back the others.
+            Only the first connection receives updates.
+            Defaults to 1.
+
+        priority_lane (``bool``, *optional*):
+            Pass True to open one more connection, reserved to small interactive requests such as sending messages
+            or answering callback queries.
+            Defaults to False.
+
+        scheduler (:obj:`~pyrogram.session.Scheduler`, *optional*):
+            Pass a scheduler instance to pace the requests with per-method and per-chat rate limits, learned from
+            the flood waits received, instead of only reacting to them.
+            Defaults to None (no client-side rate limits).
+
+        compress_requests (``bool``, *optional*):
+            Pass True to send large requests (e.g. long texts, many inline results or contacts) gzip-compressed.
+            Requests that don't shrink enough, like file parts, are sent as they are.
+            Defaults to False.
+
+        process_workers (``int``, *optional*):
+            Number of worker processes running the handlers decorated with
+            :func:`~pyrogram.handlers.run_in_process`. The processes are only started when first needed.
+            Defaults to ``os.cpu_count()``.
+
+        watchdog (:obj:`~pyrogram.watchdog.Watchdog`, *optional*):
+            Pass a Watchdog to report handlers blocking the event loop or running for too long.
+            Defaults to None (no watchdog).
     """
 
     APP_VERSION = f"Pyrogram {__version__}"
@@ -242,6 +288,10 @@ class Client(Methods):
 
     MAX_CONCURRENT_TRANSMISSIONS = 1
     MAX_CACHE_SIZE = 10000
+    PEERS_CACHE_SIZE = 1000
+
+    # Interval of seconds after which an unchanged peer is written to the storage again
+    STORED_PEERS_REFRESH_INTERVAL = 60 * 60
 
     mimetypes = MimeTypes()
     mimetypes.readfp(StringIO(mime_types))
@@ -280,6 +330,14 @@ class Client(Methods):
         client_platform: "enums.ClientPlatform" = enums.ClientPlatform.OTHER,
         max_message_cache_size: int = MAX_CACHE_SIZE,
         max_business_user_connection_cache_size: int = MAX_CACHE_SIZE,
+        reuse_parsed_peers: bool = False,
+        warm_dc_keys: bool = False,
+        connections: int = 1,
+        priority_lane: bool = False,
+        scheduler: "Scheduler" = None,
+        compress_requests: bool = False,
+        process_workers: int = None,
+        watchdog: "Watchdog" = None,
     ):
         super().__init__()
 
@@ -317,8 +375,17 @@ class Client(Methods):
         self.max_business_user_connection_cache_size = (
             max_business_user_connection_cache_size
         )
+        self.reuse_parsed_peers = reuse_parsed_peers
+        self.warm_dc_keys = warm_dc_keys
+        self.connections = connections
+        self.priority_lane = priority_lane
+        self.scheduler = scheduler
+        self.compress_requests = compress_requests
+        self.process_workers = process_workers
+        self.watchdog = watchdog
 
         self.executor = ThreadPoolExecutor(self.workers, thread_name_prefix="Handler")
+        self.process_pool = ProcessPool(self)
 
         if storage:
             self.storage = storage
@@ -340,6 +407,7 @@ class Client(Methods):
         self.connection_factory = Connection
         self.protocol_factory = TCPAbridged
 
+        self.metrics = Metrics()
         self.dispatcher = Dispatcher(self)
 
         self.rnd_id = MsgId
@@ -351,6 +419,9 @@ class Client(Methods):
         self.media_sessions = {}
         self.media_sessions_lock = asyncio.Lock()
 
+        self.dc_auth_key_locks = {}
+        self.dc_keys_warmer_task = None
+
         self.save_file_semaphore = asyncio.Semaphore(self.max_concurrent_transmissions)
         self.get_file_semaphore = asyncio.Semaphore(self.max_concurrent_transmissions)
 
@@ -367,6 +438,10 @@ class Client(Methods):
         self.business_user_connection_cache = Cache(
             self.max_business_user_connection_cache_size
         )
+        self.parsed_peers_cache = ParsedPeersCache(
+            self.PEERS_CACHE_SIZE, self.reuse_parsed_peers
+        )
+        self.stored_peers_cache = Cache(self.PEERS_CACHE_SIZE)
 
         # Sometimes, for some reason, the server will stop sending updates and will only respond to pings.
         # This watchdog will invoke updates.GetState in order to wake up the server and enable it sending updates again
@@ -375,7 +450,8 @@ class Client(Methods):
         self.updates_watchdog_event = asyncio.Event()
         self.last_update_time = datetime.now()
         self.listeners = {
-            listener_type: [] for listener_type in pyrogram.enums.ListenerTypes
+            listener_type: ListenerRegistry()
+            for listener_type in pyrogram.enums.ListenerTypes
         }
         self.loop = asyncio.get_event_loop()
 
@@ -413,6 +489,29 @@ class Client(Methods):
             ):
                 await self.invoke(raw.functions.updates.GetState())
 
+    async def dc_keys_warmer(self):
+        config = await self.invoke(raw.functions.help.GetConfig())
+        home_dc_id = await self.storage.dc_id()
+        known_dc_ids = DataCenter.TEST if await self.storage.test_mode() else DataCenter.PROD
+
+        dc_ids = sorted(
+            {
+                option.id
+                for option in config.dc_options
+                if not (option.cdn or option.media_only or option.tcpo_only)
+                and option.id in known_dc_ids
+                and option.id != home_dc_id
+            }
+        )
+
+        for dc_id in dc_ids:
+            try:
+                await self.get_dc_auth_key(dc_id)
+            except Exception as e:
+                log.warning("Unable to create the auth key for DC%s: %s", dc_id, e)
+
+        log.info("Auth keys ready for DCs: %s", dc_ids)
+
     async def authorize(self) -> User:
         if self.bot_token:
             return await self.sign_in_bot(self.bot_token)
@@ -589,6 +688,8 @@ class Client(Methods):
         is_min = False
         parsed_peers = []
         usernames = []
+        stored_peers = {}
+        now = time.monotonic()
 
         for peer in peers:
             if getattr(peer, "min", False):
@@ -597,6 +698,7 @@ class Client(Methods):
 
             username = None
             phone_number = None
+            peer_usernames = []
 
             if isinstance(peer, raw.types.User):
                 peer_id = peer.id
@@ -608,7 +710,7 @@ class Client(Methods):
                 )
                 if peer.usernames is not None and len(peer.usernames) > 1:
                     for uname in peer.usernames:
-                        usernames.append((peer_id, uname.username.lower()))
+                        peer_usernames.append((peer_id, uname.username.lower()))
                 phone_number = peer.phone
                 peer_type = "bot" if peer.bot else "user"
             elif isinstance(peer, (raw.types.Chat, raw.types.ChatForbidden)):
@@ -625,7 +727,7 @@ class Client(Methods):
                 )
                 if peer.usernames is not None and len(peer.usernames) > 1:
                     for uname in peer.usernames:
-                        usernames.append((peer_id, uname.username.lower()))
+                        peer_usernames.append((peer_id, uname.username.lower()))
                 peer_type = "channel" if peer.broadcast else "supergroup"
             elif isinstance(peer, raw.types.ChannelForbidden):
                 peer_id = utils.get_channel_id(peer.id)
@@ -634,12 +736,32 @@ class Client(Methods):
             else:
                 continue
 
-            parsed_peers.append(
-                (peer_id, access_hash, peer_type, username, phone_number)
-            )
+            parsed_peer = (peer_id, access_hash, peer_type, username, phone_number)
 
-        await self.storage.update_peers(parsed_peers)
-        await self.storage.update_usernames(usernames)
+            # Skip peers that were recently written with the very same values. Rows are still refreshed from time
+            # to time, because storages expire usernames that haven't been updated for a while.
+            stored = stored_peers.get(peer_id) or self.stored_peers_cache[peer_id]
+
+            if (
+                stored is not None
+                and stored[0] == (parsed_peer, peer_usernames)
+                and now - stored[1] < self.STORED_PEERS_REFRESH_INTERVAL
+            ):
+                continue
+
+            stored_peers[peer_id] = ((parsed_peer, peer_usernames), now)
+            parsed_peers.append(parsed_peer)
+            usernames.extend(peer_usernames)
+
+        if parsed_peers:
+            await self.storage.update_peers(parsed_peers)
+
+        if usernames:
+            await self.storage.update_usernames(usernames)
+
+        # Only once written: peers whose write failed must not be skipped next time
+        for peer_id, stored in stored_peers.items():
+            self.stored_peers_cache[peer_id] = stored
 
         return is_min
 
@@ -847,6 +969,8 @@ class Client(Methods):
     async def load_session(self):
         await self.storage.open()
 
+        self.stored_peers_cache = Cache(self.PEERS_CACHE_SIZE)
+
         session_empty = any(
             [
                 await self.storage.test_mode() is None,
@@ -1217,6 +1341,27 @@ class Client(Methods):
                 shutil.move(temp_file_path, file_path)
                 return file_path
 
+    async def create_session(self) -> SessionPool:
+        return SessionPool(
+            self,
+            await self.storage.dc_id(),
+            await self.storage.auth_key(),
+            await self.storage.test_mode(),
+            self.connections,
+            self.priority_lane,
+        )
+
+    async def get_dc_auth_key(self, dc_id: int) -> bytes:
+        """Get the stored auth key for a foreign DC, creating and storing a new one if missing."""
+        async with self.dc_auth_key_locks.setdefault(dc_id, asyncio.Lock()):
+            auth_key = await self.storage.dc_auth_key(dc_id)
+
+            if auth_key is None:
+                auth_key = await Auth(self, dc_id, await self.storage.test_mode()).create()
+                await self.storage.dc_auth_key(dc_id, auth_key)
+
+            return auth_key
+
     async def get_file(
         self,
         file_id: FileId,
@@ -1274,7 +1419,7 @@ class Client(Methods):
                 self,
                 dc_id,
                 (
-                    await Auth(self, dc_id, await self.storage.test_mode()).create()
+                    await self.get_dc_auth_key(dc_id)
                     if dc_id != await self.storage.dc_id()
                     else await self.storage.auth_key()
                 ),
@@ -1465,3 +1610,34 @@ class Cache:
         if len(self.store) > self.capacity:
             for _ in range(self.capacity // 2 + 1):
                 del self.store[next(iter(self.store))]
+
+
+class ParsedPeersCache(Cache):
+    """Cache of the users and chats parsed from raw peers, keyed by peer id.
+
+    An entry is reused when the same raw object is parsed again, which is the case for every message of a batch
+    sharing the same sender or chat. When *reuse* is True, an entry is also reused for an equal raw object coming
+    from a later batch.
+    """
+
+    def __init__(self, capacity: int, reuse: bool = False):
+        super().__init__(capacity)
+        self.reuse = reuse
+
+    def get(self, key, raw_peer, parse: Callable):
+        entry = self.store.get(key, None)
+
+        if entry is not None:
+            cached_raw_peer, parsed = entry
+
+            if cached_raw_peer is raw_peer:
+                return parsed
+
+            if self.reuse and cached_raw_peer == raw_peer:
+                self.store[key] = (raw_peer, parsed)
+                return parsed
+
+        parsed = parse()
+        self[key] = (raw_peer, parsed)
+
+        return parsed
@@ -42,6 +42,153 @@ class Proxy(TypedDict):
     password: Optional[str]
 
 
+class TCPProtocol(asyncio.BufferedProtocol):
+    """Receive data straight into a reusable buffer and hand it out to :obj:`TCP` in exact-sized reads.
+
+    A single timer checks for idle connections, instead of wrapping every read in a timeout.
+    """
+
+    MIN_READ_SIZE = 64 * 1024
+
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+        self.loop = asyncio.get_event_loop()
+
+        self.transport: Optional[asyncio.Transport] = None
+
+        self.buffer = bytearray(self.MIN_READ_SIZE)
+        self.start = 0
+        self.end = 0
+
+        self.waiter: Optional[asyncio.Future] = None
+        self.waiting_for = 0
+        self.last_activity = 0.0
+        self.idle_timer: Optional[asyncio.TimerHandle] = None
+
+        self.write_waiter: Optional[asyncio.Future] = None
+        self.is_paused = False
+
+        self.closed = self.loop.create_future()
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        if exc is not None:
+            log.info("Connection lost: %s %s", type(exc).__name__, exc)
+
+        if not self.closed.done():
+            self.closed.set_result(None)
+
+        if self.idle_timer is not None:
+            self.idle_timer.cancel()
+            self.idle_timer = None
+
+        self._wake_up()
+
+        if self.write_waiter is not None and not self.write_waiter.done():
+            self.write_waiter.set_result(None)
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        if self.start == self.end:
+            self.start = self.end = 0
+
+        if len(self.buffer) - self.end < self.MIN_READ_SIZE:
+            size = self.end - self.start
+            capacity = max(size + self.MIN_READ_SIZE, self.waiting_for)
+
+            if capacity > len(self.buffer):
+                # Never resize the buffer in place: a previously returned view might still be alive
+                buffer = bytearray(max(capacity, len(self.buffer) * 2))
+                buffer[:size] = self.buffer[self.start : self.end]
+                self.buffer = buffer
+            else:
+                self.buffer[:size] = self.buffer[self.start : self.end]
+
+            self.start, self.end = 0, size
+
+        return memoryview(self.buffer)[self.end :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self.end += nbytes
+        self.last_activity = self.loop.time()
+
+        if self.end - self.start >= self.waiting_for:
+            self._wake_up()
+
+    def eof_received(self) -> bool:
+        return False
+
+    def pause_writing(self) -> None:
+        self.is_paused = True
+
+    def resume_writing(self) -> None:
+        self.is_paused = False
+
+        if self.write_waiter is not None and not self.write_waiter.done():
+            self.write_waiter.set_result(None)
+
+    def _wake_up(self) -> None:
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    def _check_idle(self) -> None:
+        self.idle_timer = None
+
+        if self.waiter is None or self.waiter.done():
+            return
+
+        deadline = self.last_activity + self.timeout
+
+        if self.loop.time() >= deadline:
+            self.waiter.set_exception(asyncio.TimeoutError())
+        else:
+            self.idle_timer = self.loop.call_at(deadline, self._check_idle)
+
+    async def read(self, length: int) -> Optional[bytes]:
+        if self.end - self.start < length:
+            self.waiting_for = length
+            self.last_activity = self.loop.time()
+
+            try:
+                while self.end - self.start < length:
+                    if self.closed.done():
+                        return None
+
+                    self.waiter = self.loop.create_future()
+
+                    if self.idle_timer is None:
+                        self.idle_timer = self.loop.call_at(
+                            self.last_activity + self.timeout, self._check_idle
+                        )
+
+                    try:
+                        await self.waiter
+                    except asyncio.TimeoutError:
+                        return None
+            finally:
+                self.waiter = None
+                self.waiting_for = 0
+
+        data = bytes(memoryview(self.buffer)[self.start : self.start + length])
+        self.start += length
+
+        return data
+
+    async def write(self, data: bytes) -> None:
+        if self.transport is None or self.closed.done() or self.transport.is_closing():
+            raise OSError("Connection is closed")
+
+        self.transport.write(data)
+
+        # Only wait when the transport buffer is above its high-water mark
+        while self.is_paused and not self.closed.done():
+            if self.write_waiter is None or self.write_waiter.done():
+                self.write_waiter = self.loop.create_future()
+
+            await asyncio.shield(self.write_waiter)
+
+
 class TCP:
     TIMEOUT = 10
 
@@ -49,10 +196,8 @@ class TCP:
         self.ipv6 = ipv6
         self.proxy = proxy
 
-        self.reader: Optional[asyncio.StreamReader] = None
-        self.writer: Optional[asyncio.StreamWriter] = None
+        self.protocol: Optional[TCPProtocol] = None
 
-        self.lock = asyncio.Lock()
         self.loop = asyncio.get_event_loop()
 
     async def _connect_via_proxy(self, destination: Tuple[str, int]) -> None:
@@ -92,16 +237,18 @@ class TCP:
 
         sock.setblocking(False)
 
-        self.reader, self.writer = await asyncio.open_connection(sock=sock)
+        await self.loop.create_connection(lambda: self.protocol, sock=sock)
 
     async def _connect_via_direct(self, destination: Tuple[str, int]) -> None:
         host, port = destination
         family = socket.AF_INET6 if self.ipv6 else socket.AF_INET
-        self.reader, self.writer = await asyncio.open_connection(
-            host=host, port=port, family=family
+        await self.loop.create_connection(
+            lambda: self.protocol, host=host, port=port, family=family
         )
 
     async def _connect(self, destination: Tuple[str, int]) -> None:
+        self.protocol = TCPProtocol(TCP.TIMEOUT)
+
         if self.proxy:
             await self._connect_via_proxy(destination)
         else:
@@ -116,41 +263,27 @@ class TCP:
             raise TimeoutError("Connection timed out")
 
     async def close(self) -> None:
-        if self.writer is None:
+        if self.protocol is None or self.protocol.transport is None:
             return None
 
         try:
-            self.writer.close()
-            await asyncio.wait_for(self.writer.wait_closed(), TCP.TIMEOUT)
+            self.protocol.transport.close()
+            await asyncio.wait_for(asyncio.shield(self.protocol.closed), TCP.TIMEOUT)
         except Exception as e:
             log.info("Close exception: %s %s", type(e).__name__, e)
 
     async def send(self, data: bytes) -> None:
-        if self.writer is None:
+        if self.protocol is None or self.protocol.transport is None:
             return None
 
-        async with self.lock:
-            try:
-                self.writer.write(data)
-                await self.writer.drain()
-            except Exception as e:
-                log.info("Send exception: %s %s", type(e).__name__, e)
-                raise OSError(e)
+        try:
+            await self.protocol.write(data)
+        except Exception as e:
+            log.info("Send exception: %s %s", type(e).__name__, e)
+            raise OSError(e)
 
     async def recv(self, length: int = 0) -> Optional[bytes]:
-        data = b""
-
-        while len(data) < length:
-            try:
-                chunk = await asyncio.wait_for(
-                    self.reader.read(length - len(data)), TCP.TIMEOUT
-                )
-            except (OSError, asyncio.TimeoutError):
-                return None
-            else:
-                if chunk:
-                    data += chunk
-                else:
-                    return None
+        if self.protocol is None:
+            return None
 
-        return data
+        return await self.protocol.read(length)
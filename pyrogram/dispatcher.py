@@ -20,11 +20,14 @@
 import asyncio
 import inspect
 import logging
+import time
 from collections import OrderedDict
+from contextlib import nullcontext
 
 import pyrogram
 from pyrogram import raw, types, utils
 from pyrogram.handlers.handler import Handler
+from pyrogram.metrics import TimedQueue
 from pyrogram.handlers import (
     BotBusinessConnectHandler,
     BotBusinessMessageHandler,
@@ -126,7 +129,8 @@ class Dispatcher:
         self.locks_list = []
         self.error_handlers = []
 
-        self.updates_queue = asyncio.Queue()
+        self.updates_queue = TimedQueue(client.metrics, "updates_queue_wait")
+        client.metrics.add_gauge("updates_queue_depth", self.updates_queue.qsize)
         self.groups = OrderedDict()
 
         self.conversation_handler = ConversationHandler()
@@ -310,6 +314,9 @@ class Dispatcher:
         }
 
     async def start(self):
+        if self.client.watchdog is not None:
+            self.client.watchdog.start(self.client)
+
         if not self.client.no_updates:
             for _ in range(self.client.workers):
                 self.locks_list.append(asyncio.Lock())
@@ -334,9 +341,13 @@ class Dispatcher:
             self.handler_worker_tasks.clear()
             self.groups.clear()
             self.error_handlers.clear()
+            self.client.process_pool.stop()
 
             log.info("Stopped %s HandlerTasks", self.client.workers)
 
+        if self.client.watchdog is not None:
+            await self.client.watchdog.stop()
+
     def add_handler(self, handler, group: int):
         async def fn():
             for lock in self.locks_list:
@@ -415,7 +426,7 @@ class Dispatcher:
                             if parsed_update is not None:
                                 if isinstance(
                                     handler, handler_type
-                                ) and await handler.check(self.client, parsed_update):
+                                ) and await self._check(handler, parsed_update):
                                     await self._execute_callback(handler, parsed_update)
                                     break
                             elif isinstance(handler, RawUpdateHandler):
@@ -458,10 +469,32 @@ class Dispatcher:
         if not handled_error:
             log.exception("Unhandled exception: %s", exception)
 
+    def _watch(self, kind: str, handler: Handler, update):
+        if self.client.watchdog is None:
+            return nullcontext()
+
+        return self.client.watchdog.watch(kind, handler, update)
+
+    async def _check(self, handler: Handler, update: types.Update):
+        with self._watch("filter", handler, update):
+            return await handler.check(self.client, update)
+
     async def _execute_callback(self, handler: Handler, *args):
-        if inspect.iscoroutinefunction(handler.callback):
-            await handler.callback(self.client, *args)
-        else:
-            await self.client.loop.run_in_executor(
-                self.client.executor, handler.callback, self.client, *args
+        start = time.perf_counter()
+
+        try:
+            with self._watch("handler", handler, args[0]):
+                if inspect.iscoroutinefunction(handler.callback):
+                    await handler.callback(self.client, *args)
+                else:
+                    await self.client.loop.run_in_executor(
+                        self.client.executor, handler.callback, self.client, *args
+                    )
+        finally:
+            callback = getattr(handler, "original_callback", handler.callback)
+
+            self.client.metrics.observe(
+                "handler_time",
+                time.perf_counter() - start,
+                getattr(callback, "__qualname__", repr(callback)),
             )
@@ -17,14 +17,69 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
 
+import atexit
+import queue
 import re
+import threading
 from datetime import datetime
-from importlib import import_module
 from typing import Type, Union
 
 from pyrogram import __version__, raw
 from pyrogram.raw.core import TLObject
-from .exceptions.all import exceptions
+
+VALUE_RE = re.compile(r"_(\d+)")
+
+
+class UnknownErrorsWriter:
+    """Appends unknown errors to a file from a background thread, in batches.
+
+    Raising an unknown error only enqueues a line, so that no file is opened on the event loop.
+    """
+
+    def __init__(self, path: str = "unknown_errors.txt"):
+        self.path = path
+        self.queue = queue.SimpleQueue()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def write(self, line: str):
+        self.queue.put(line)
+
+        if self.thread is None:
+            with self.lock:
+                if self.thread is None:
+                    self.thread = threading.Thread(target=self.run, name="UnknownErrorsWriter", daemon=True)
+                    self.thread.start()
+                    atexit.register(self.stop)
+
+    def run(self):
+        running = True
+
+        while running:
+            lines = [self.queue.get()]
+
+            # Take whatever else piled up in the meantime and write it all at once
+            while True:
+                try:
+                    lines.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if None in lines:
+                running = False
+                lines = [line for line in lines if line is not None]
+
+            if lines:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.writelines(lines)
+
+    def stop(self):
+        self.queue.put(None)
+        self.thread.join(5)
+
+
+unknown_errors_writer = UnknownErrorsWriter()
+table = None
 
 
 class RPCError(Exception):
@@ -57,8 +112,7 @@ class RPCError(Exception):
             self.value = value
 
         if is_unknown:
-            with open("unknown_errors.txt", "a", encoding="utf-8") as f:
-                f.write(f"{datetime.now()}\t{value}\t{rpc_name}\n")
+            unknown_errors_writer.write(f"{datetime.now()}\t{value}\t{rpc_name}\n")
 
     @staticmethod
     def raise_it(rpc_error: "raw.types.RpcError", rpc_type: Type[TLObject]):
@@ -70,7 +124,13 @@ class RPCError(Exception):
         if is_signed:
             error_code = -error_code
 
-        if error_code not in exceptions:
+        global table
+
+        if table is None:
+            # Imported here, the exception classes themselves depend on this module
+            from .exceptions.table import table
+
+        if error_code not in table:
             raise UnknownError(
                 value=f"[{error_code} {error_message}]",
                 rpc_name=rpc_name,
@@ -78,24 +138,28 @@ class RPCError(Exception):
                 is_signed=is_signed,
             )
 
-        error_id = re.sub(r"_\d+", "_X", error_message)
+        error_class, error_classes = table[error_code]
+
+        # Most messages carry no value and are looked up as they are
+        value = VALUE_RE.search(error_message)
+
+        if value is None:
+            error_id = error_message
+        else:
+            error_id = VALUE_RE.sub("_X", error_message)
+            value = value.group(1)
 
-        if error_id not in exceptions[error_code]:
-            raise getattr(
-                import_module("pyrogram.errors"), exceptions[error_code]["_"]
-            )(
+        if error_id not in error_classes:
+            raise error_class(
                 value=f"[{error_code} {error_message}]",
                 rpc_name=rpc_name,
                 is_unknown=True,
                 is_signed=is_signed,
             )
 
-        value = re.search(r"_(\d+)", error_message)
-        value = value.group(1) if value is not None else value
-
-        raise getattr(
-            import_module("pyrogram.errors"), exceptions[error_code][error_id]
-        )(value=value, rpc_name=rpc_name, is_unknown=False, is_signed=is_signed)
+        raise error_classes[error_id](
+            value=value, rpc_name=rpc_name, is_unknown=False, is_signed=is_signed
+        )
 
 
 class UnknownError(RPCError):
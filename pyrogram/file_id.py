@@ -22,12 +22,14 @@ import logging
 import struct
 from enum import IntEnum
 from io import BytesIO
-from typing import List
-
 from pyrogram.raw.core import Bytes, String
 
 log = logging.getLogger(__name__)
 
+# Encoded zero runs and their decoded form, by length
+ZERO_RUNS = [bytes((0, n)) for n in range(256)]
+ZEROS = [bytes(n) for n in range(256)]
+
 
 def b64_encode(s: bytes) -> str:
     """Encode bytes into a URL-safe Base64 string without padding
@@ -65,23 +67,31 @@ def rle_encode(s: bytes) -> bytes:
     Returns:
         ``bytes``: The encoded bytes
     """
-    r: List[int] = []
-    n: int = 0
+    parts = s.split(b"\x00")
 
-    for b in s:
-        if not b:
-            n += 1
-        else:
+    if len(parts) == 1:
+        return s
+
+    r = []
+    n = 0
+
+    # Each empty part between two separators is one more zero in the current run
+    for part in parts:
+        if part:
             if n:
-                r.extend((0, n))
+                r.append(ZERO_RUNS[n])
                 n = 0
 
-            r.append(b)
+            r.append(part)
+
+        n += 1
+
+    n -= 1
 
     if n:
-        r.extend((0, n))
+        r.append(ZERO_RUNS[n])
 
-    return bytes(r)
+    return b"".join(r)
 
 
 def rle_decode(s: bytes) -> bytes:
@@ -94,21 +104,19 @@ def rle_decode(s: bytes) -> bytes:
     Returns:
         ``bytes``: The decoded bytes
     """
-    r: List[int] = []
-    z: bool = False
+    parts = s.split(b"\x00")
 
-    for b in s:
-        if not b:
-            z = True
-            continue
+    if len(parts) == 1:
+        return s
 
-        if z:
-            r.extend((0,) * b)
-            z = False
-        else:
-            r.append(b)
+    r = [parts[0]]
+
+    # Every part after a zero starts with the length of the zero run
+    for part in parts[1:]:
+        if part:
+            r += (ZEROS[part[0]], part[1:])
 
-    return bytes(r)
+    return b"".join(r)
 
 
 class FileType(IntEnum):
@@ -20,6 +20,7 @@
 from .bot_business_connect_handler import BotBusinessConnectHandler
 from .bot_business_message_handler import BotBusinessMessageHandler
 from .callback_query_handler import CallbackQueryHandler
+from .callback_query_router import CallbackQueryRouter
 from .chat_join_request_handler import ChatJoinRequestHandler
 from .chat_member_updated_handler import ChatMemberUpdatedHandler
 from .conversation_handler import ConversationHandler
@@ -40,12 +41,14 @@ from .story_handler import StoryHandler
 from .message_reaction_updated_handler import MessageReactionUpdatedHandler
 from .message_reaction_count_updated_handler import MessageReactionCountUpdatedHandler
 from .pre_checkout_query_handler import PreCheckoutQueryHandler
+from .process_pool import run_in_process
 from .shipping_query_handler import ShippingQueryHandler
 
 __all__ = [
     "BotBusinessConnectHandler",
     "BotBusinessMessageHandler",
     "CallbackQueryHandler",
+    "CallbackQueryRouter",
     "ChatJoinRequestHandler",
     "ChatMemberUpdatedHandler",
     "ConversationHandler",
@@ -68,4 +71,5 @@ __all__ = [
     "MessageReactionCountUpdatedHandler",
     "PreCheckoutQueryHandler",
     "ShippingQueryHandler",
+    "run_in_process",
 ]
@@ -0,0 +1,283 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import re
+from collections import OrderedDict
+from typing import Dict, List, Optional, Pattern, Union
+
+import pyrogram
+from pyrogram.filters import Filter
+from pyrogram.types import CallbackQuery
+
+META_CHARS = set(".^$*+?{}[]|()")
+OPTIONAL_QUANTIFIERS = set("*?{")
+
+
+def literal_prefix(pattern: Pattern) -> Optional[str]:
+    """The literal text every match of a ``^`` anchored pattern starts with, or None if there's none."""
+    if (
+        not isinstance(pattern.pattern, str)
+        or pattern.flags & (re.IGNORECASE | re.MULTILINE | re.VERBOSE)
+        or not pattern.pattern.startswith("^")
+    ):
+        return None
+
+    source = pattern.pattern
+    depth = 0
+    escaped = False
+    in_class = False
+
+    # Alternatives at the top level would make the anchor apply to the first one only
+    for char in source:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return None
+
+    prefix = []
+    i = 1
+
+    while i < len(source):
+        char = source[i]
+
+        if char == "\\":
+            if i + 1 >= len(source) or source[i + 1].isalnum():
+                break
+
+            char = source[i + 1]
+            i += 1
+        elif char in META_CHARS:
+            # A quantifier that allows zero repetitions makes the previous character optional
+            if char in OPTIONAL_QUANTIFIERS and prefix:
+                prefix.pop()
+
+            break
+
+        prefix.append(char)
+        i += 1
+
+    return "".join(prefix) or None
+
+
+def refers_to_group_numbers(pattern: Pattern) -> bool:
+    """Whether the pattern uses numeric backreferences or conditionals, which can't be joined with other patterns."""
+    source = pattern.pattern
+
+    # Conditionals may refer to groups by name too, checking those one by one as well costs little
+    if "(?(" in source:
+        return True
+
+    escaped = False
+
+    for char in source:
+        if escaped:
+            if char in "123456789":
+                return True
+
+            escaped = False
+        elif char == "\\":
+            escaped = True
+
+    return False
+
+
+class Route(Filter):
+    """A filter that passes callback queries whose data matches the pattern of this route."""
+
+    def __init__(self, router: "CallbackQueryRouter", pattern: Pattern, index: int):
+        self.router = router
+        self.p = pattern
+        self.index = index
+
+    async def __call__(self, client: "pyrogram.Client", query: CallbackQuery):
+        matches = self.router.resolve(query.data).get(self)
+
+        if matches is None:
+            return False
+
+        query.matches = matches
+
+        return True
+
+
+def search(pattern: Pattern, data: Union[str, bytes]) -> Optional[re.Match]:
+    try:
+        return pattern.search(data)
+    except TypeError:
+        # Text pattern and bytes data, or the other way around
+        return None
+
+
+class TrieNode:
+    __slots__ = ("children", "routes")
+
+    def __init__(self):
+        self.children = {}
+        self.routes = []
+
+
+class CallbackQueryRouter:
+    """Route callback queries to handlers by their data, without checking every handler's regular expression.
+
+    Routes are filters made with :meth:`route` and used with :meth:`~pyrogram.Client.on_callback_query` or
+    :obj:`~pyrogram.handlers.CallbackQueryHandler`, in place of :meth:`~pyrogram.filters.regex`. The data of a query
+    is looked up once for all the routes of a router: patterns anchored to a literal prefix (e.g. ``r"^buy:(\\d+)"``)
+    are kept in a prefix tree walked along the data, the others are combined into a single regular expression. Bytes
+    patterns and the ones referring to their groups by number (e.g. ``r"(\\w)\\1"``) are checked one by one.
+    These only narrow down the routes worth checking: each route still passes exactly the queries
+    :meth:`~pyrogram.filters.regex` would, so routes can be combined with other filters and used in any group.
+    As with :meth:`~pyrogram.filters.regex`, the matches are stored in the ``matches`` field of the query, with
+    the parsed fields available as ``query.matches[0].group(...)``.
+
+    Parameters:
+        cache_size (``int``, *optional*):
+            How many distinct callback data to remember the route of.
+            Defaults to 1024.
+
+    Example:
+        .. code-block:: python
+
+            from pyrogram.handlers import CallbackQueryRouter
+
+            router = CallbackQueryRouter()
+
+            @app.on_callback_query(router.route(r"^buy:(?P<item>\\w+)"))
+            async def buy(client, query):
+                await query.answer(f"Buying {query.matches[0]['item']}")
+
+            @app.on_callback_query(router.route(r"page=(\\d+)"))
+            async def page(client, query):
+                ...
+    """
+
+    def __init__(self, cache_size: int = 1024):
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.routes: List[Route] = []
+        self.trie = TrieNode()
+        self.other_routes: List[Route] = []
+        self.combined: Optional[Pattern] = None
+        self.single_routes: List[Route] = []
+
+    def route(self, pattern: Union[str, Pattern], flags: int = 0) -> Route:
+        """Create a route for a regular expression, matched against the data of callback queries.
+
+        Parameters:
+            pattern (``str`` | ``Pattern``):
+                The regex pattern as string or as pre-compiled pattern.
+
+            flags (``int``, *optional*):
+                Regex flags.
+
+        Returns:
+            :obj:`~pyrogram.filters.Filter`: The filter to register the handler of this route with.
+        """
+        pattern = pattern if isinstance(pattern, Pattern) else re.compile(pattern, flags)
+        route = Route(self, pattern, len(self.routes))
+        prefix = literal_prefix(pattern)
+
+        self.routes.append(route)
+        self.cache.clear()
+
+        if prefix is None and (not isinstance(pattern.pattern, str) or refers_to_group_numbers(pattern)):
+            # Bytes patterns can't be joined with text ones, and joined patterns have their groups renumbered
+            self.single_routes.append(route)
+        elif prefix is None:
+            self.other_routes.append(route)
+            self.combined = self.combine(self.other_routes)
+        else:
+            node = self.trie
+
+            for char in prefix:
+                node = node.children.setdefault(char, TrieNode())
+
+            node.routes.append(route)
+
+        return route
+
+    @staticmethod
+    def combine(routes: List[Route]) -> Optional[Pattern]:
+        scoped_flags = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s", re.VERBOSE: "x"}
+
+        try:
+            return re.compile(
+                "|".join(
+                    "(?{}:{})".format(
+                        "".join(v for k, v in scoped_flags.items() if route.p.flags & k) or "-i",
+                        route.p.pattern,
+                    )
+                    for route in routes
+                )
+            )
+        except re.error:
+            # E.g. the same group name in more patterns
+            return None
+
+    def resolve(self, data: Union[str, bytes]) -> Dict[Route, List[re.Match]]:
+        """Find the routes the given callback data matches, along with their matches."""
+        if not data:
+            return {}
+
+        try:
+            result = self.cache[data]
+        except KeyError:
+            result = self.cache[data] = self.find(data)
+
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        else:
+            self.cache.move_to_end(data)
+
+        return result
+
+    def find(self, data: Union[str, bytes]) -> Dict[Route, List[re.Match]]:
+        candidates = []
+
+        if isinstance(data, str):
+            node = self.trie
+
+            for char in data:
+                node = node.children.get(char)
+
+                if node is None:
+                    break
+
+                candidates.extend(node.routes)
+
+        # No alternative of the combined expression matching means none of its routes does
+        if self.other_routes and (self.combined is None or search(self.combined, data)):
+            candidates.extend(self.other_routes)
+
+        candidates.extend(self.single_routes)
+
+        return {
+            route: list(route.p.finditer(data))
+            for route in sorted(candidates, key=lambda r: r.index)
+            if search(route.p, data)
+        }
@@ -0,0 +1,238 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import asyncio
+import copyreg
+import functools
+import inspect
+import io
+import logging
+import multiprocessing
+import os
+import pickle
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
+
+import pyrogram
+from pyrogram.types import Object
+
+log = logging.getLogger(__name__)
+
+# Callbacks waiting for or running in a process, per worker process
+PENDING_PER_WORKER = 2
+
+
+def rebuild_match(pattern, string, pos, endpos, regs):
+    # Searching again within the same bounds as the filter finds the same match: the first one (match, search), a
+    # later one (finditer) or, if the groups differ, the one spanning all of it (fullmatch)
+    for match in pattern.finditer(string, pos, endpos):
+        if match.regs == regs:
+            return match
+
+        if match.start() > regs[0][0]:
+            break
+
+    match = pattern.fullmatch(string, pos, endpos)
+
+    return match if match is not None and match.regs == regs else None
+
+
+def reduce_match(match):
+    return rebuild_match, (match.re, match.string, match.pos, match.endpos, match.regs)
+
+
+def dumps(obj) -> bytes:
+    """Pickle updates, including the regex matches filters store in them."""
+    file = io.BytesIO()
+    pickler = pickle.Pickler(file, pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    pickler.dispatch_table[re.Match] = reduce_match
+    pickler.dump(obj)
+
+    return file.getvalue()
+
+
+class RecordedCall:
+    """Result of a method called on a :class:`ClientProxy`, awaiting it gives None."""
+
+    def __await__(self):
+        return
+        yield
+
+
+class ClientProxy:
+    """Stand-in for the Client in callbacks running in another process.
+
+    Client methods called on it, directly or through the bound methods of the update, are recorded instead and
+    carried out by the actual Client once the callback returns. Their results are therefore always None.
+    """
+
+    def __init__(self, name: str, me: Optional["pyrogram.types.User"]):
+        self.name = name
+        self.me = me
+        self.calls = []
+
+    def __getattr__(self, name: str):
+        if name.startswith("_") or not callable(getattr(pyrogram.Client, name, None)):
+            raise AttributeError(f"'{name}' is not available in callbacks running in a process")
+
+        def method(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return RecordedCall()
+
+        return method
+
+
+def init_worker():
+    # For the bound methods of updates, which look for the current event loop
+    asyncio.set_event_loop(asyncio.new_event_loop())
+
+
+def run_callback(callback: Callable, name: str, me: Optional["pyrogram.types.User"], payload: bytes):
+    proxy = ClientProxy(name, me)
+    args = pickle.loads(payload)
+    error = None
+
+    for arg in args:
+        if isinstance(arg, Object):
+            arg.bind(proxy)
+
+    try:
+        callback.__wrapped__(proxy, *args)
+    except Exception as e:
+        error = e
+
+    return proxy.calls, error
+
+
+class ProcessPool:
+    """The worker processes of a Client running the callbacks decorated with :func:`run_in_process`."""
+
+    def __init__(self, client: "pyrogram.Client"):
+        self.client = client
+        self.workers = client.process_workers or os.cpu_count() or 1
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.semaphore: Optional[asyncio.Semaphore] = None
+
+    def start(self):
+        # Forking would copy the running event loop and the locks held by the client threads (handlers, crypto,
+        # watchdog, ...) into the workers, where they may never be released
+        self.executor = ProcessPoolExecutor(
+            self.workers, mp_context=multiprocessing.get_context("spawn"), initializer=init_worker
+        )
+        self.semaphore = asyncio.Semaphore(self.workers * PENDING_PER_WORKER)
+
+    def stop(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+            self.semaphore = None
+
+    async def run(self, callback: Callable, timeout: Optional[float], *args):
+        if self.executor is None:
+            self.start()
+
+        loop = self.client.loop
+        semaphore = self.semaphore
+        payload = dumps(args)
+
+        # Bound the callbacks queued in the pool, so that a flood of updates waits here instead
+        await semaphore.acquire()
+
+        try:
+            future = self.executor.submit(run_callback, callback, self.client.name, self.client.me, payload)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        def release(_):
+            # The slot is freed when the process is done with the callback, even if it was given up on before
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(semaphore.release)
+
+        future.add_done_callback(release)
+
+        try:
+            calls, error = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"{callback.__qualname__} didn't finish within {timeout} seconds") from None
+
+        for name, call_args, call_kwargs in calls:
+            result = getattr(self.client, name)(*call_args, **call_kwargs)
+
+            if inspect.isawaitable(result):
+                await result
+
+        if error is not None:
+            raise error
+
+
+def run_in_process(callback: Callable = None, *, timeout: Optional[float] = None):
+    """Decorator to run a synchronous handler in a worker process instead of a thread.
+
+    CPU-bound callbacks (image manipulation, OCR, building reports, ...) running in threads hold the GIL and slow
+    down the whole client. Decorated callbacks run in a pool of :obj:`~pyrogram.Client` ``process_workers``
+    processes instead. The update is pickled and sent to the process, and the client methods called there, either
+    directly or through bound methods such as :meth:`~pyrogram.types.Message.reply`, are sent back and carried out
+    by the client once the callback returns, in the same order. Because of that, they always return None in the
+    callback.
+
+    The callback must be a function defined at module level, so that the worker processes, started fresh rather than
+    forked, can import it. For the same reason, each worker process imports the main module of your program again:
+    the code creating and running the client must be under an ``if __name__ == "__main__":`` guard, otherwise every
+    worker starts a client of its own.
+    Apply this decorator before (i.e. below) the handler decorator.
+
+    Parameters:
+        timeout (``float``, *optional*):
+            Seconds to wait for the callback to finish before raising :obj:`TimeoutError`, in which case the calls it
+            makes are discarded. A callback already running isn't interrupted and keeps its worker busy.
+            Defaults to None (no timeout).
+
+    Example:
+        .. code-block:: python
+
+            from pyrogram import Client, filters
+            from pyrogram.handlers import run_in_process
+
+            app = Client("my_account")
+
+            @app.on_message(filters.photo)
+            @run_in_process(timeout=60)
+            def ocr(client, message):
+                message.reply(extract_text(message.photo))
+
+            # Worker processes import this module too, they must not run the client
+            if __name__ == "__main__":
+                app.run()
+    """
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            raise TypeError("Only synchronous callbacks can run in a process")
+
+        # The wrapper takes the place of the function in its module, which is how the processes find the function
+        @functools.wraps(func)
+        async def wrapper(client: "pyrogram.Client", *args):
+            await client.process_pool.run(wrapper, timeout, *args)
+
+        return wrapper
+
+    return decorator if callback is None else decorator(callback)
@@ -19,8 +19,9 @@
 
 from .invoke import Invoke
 from .resolve_peer import ResolvePeer
+from .resolve_peers import ResolvePeers
 from .save_file import SaveFile
 
 
-class Advanced(Invoke, ResolvePeer, SaveFile):
+class Advanced(Invoke, ResolvePeer, ResolvePeers, SaveFile):
     pass
@@ -79,12 +79,15 @@ class Invoke:
                 takeout_id=self.takeout_id, query=query
             )
 
-        r = await self.session.invoke(
-            query,
-            retries,
-            timeout,
-            (sleep_threshold if sleep_threshold is not None else self.sleep_threshold),
-        )
+        if sleep_threshold is None:
+            sleep_threshold = self.sleep_threshold
+
+        if self.scheduler is not None:
+            r = await self.scheduler.invoke(
+                self.session, query, retries, timeout, sleep_threshold
+            )
+        else:
+            r = await self.session.invoke(query, retries, timeout, sleep_threshold)
 
         await self.fetch_peers(getattr(r, "users", []))
         await self.fetch_peers(getattr(r, "chats", []))
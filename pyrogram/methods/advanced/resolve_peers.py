@@ -0,0 +1,144 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import asyncio
+import logging
+from typing import Iterable, List, Optional, Union
+
+import pyrogram
+from pyrogram import raw, utils
+from pyrogram.errors import BadRequest
+
+log = logging.getLogger(__name__)
+
+
+BATCH_SIZE = 200
+
+
+async def invoke_batch(client: "pyrogram.Client", function, ids: list):
+    try:
+        r = await client.invoke(function(id=ids))
+    except BadRequest as e:
+        # A single invalid id fails the whole batch: split it to find the valid ones
+        if len(ids) == 1:
+            log.debug("Unable to fetch %s: %s", ids[0], e)
+            return
+
+        await invoke_batch(client, function, ids[: len(ids) // 2])
+        await invoke_batch(client, function, ids[len(ids) // 2 :])
+    else:
+        # Users are returned as a plain list, chats and channels are stored by Client.invoke
+        if isinstance(r, list):
+            await client.fetch_peers(r)
+
+
+async def fetch_peers_by_ids(client: "pyrogram.Client", peer_ids: List[int]):
+    batches = {
+        raw.functions.users.GetUsers: [],
+        raw.functions.messages.GetChats: [],
+        raw.functions.channels.GetChannels: [],
+    }
+
+    for peer_id in peer_ids:
+        try:
+            peer_type = utils.get_peer_type(peer_id)
+        except ValueError:
+            continue
+
+        if peer_type == "user":
+            batches[raw.functions.users.GetUsers].append(
+                raw.types.InputUser(user_id=peer_id, access_hash=0)
+            )
+        elif peer_type == "chat":
+            batches[raw.functions.messages.GetChats].append(-peer_id)
+        else:
+            batches[raw.functions.channels.GetChannels].append(
+                raw.types.InputChannel(
+                    channel_id=utils.get_channel_id(peer_id), access_hash=0
+                )
+            )
+
+    for function, ids in batches.items():
+        for i in range(0, len(ids), BATCH_SIZE):
+            await invoke_batch(client, function, ids[i : i + BATCH_SIZE])
+
+
+class ResolvePeers:
+    async def resolve_peers(
+        self: "pyrogram.Client",
+        peer_ids: Iterable[Union[int, str]],
+        workers: int = 8,
+    ) -> List[Optional[Union[raw.base.InputPeer, raw.base.InputUser, raw.base.InputChannel]]]:
+        """Get the InputPeer of many peer ids at once.
+
+        Known peers are fetched from the storage with a single query. Unknown ids are grouped by type and
+        fetched with a few batched requests, and usernames or phone numbers are resolved concurrently.
+
+        .. note::
+
+            This is a utility method intended to be used **only** when working with raw
+            :obj:`functions <pyrogram.api.functions>`, or to warm up the peers storage.
+
+        .. include:: /_includes/usable-by/users-bots.rst
+
+        Parameters:
+            peer_ids (Iterable of ``int`` | ``str``):
+                The peer ids you want to extract the InputPeer from.
+                Each can be a direct id (int), a username (str) or a phone number (str) or *t.me/<username>* link.
+
+            workers (``int``, *optional*):
+                Maximum amount of usernames and phone numbers resolved at the same time.
+                Defaults to 8.
+
+        Returns:
+            List of ``InputPeer``: The resolved peers, in the same order as *peer_ids*.
+            Peers that couldn't be resolved are None.
+
+        Example:
+            .. code-block:: python
+
+                peers = await app.resolve_peers([12345678, -1001234567890, "pyrogramchat"])
+        """
+        if not self.is_connected:
+            raise ConnectionError("Client has not been started yet")
+
+        peer_ids = list(peer_ids)
+        ids = list({peer_id for peer_id in peer_ids if isinstance(peer_id, int)})
+
+        peers = await self.storage.get_peers_by_ids(ids)
+        missing = [peer_id for peer_id in ids if peer_id not in peers]
+
+        if missing:
+            await fetch_peers_by_ids(self, missing)
+            peers.update(await self.storage.get_peers_by_ids(missing))
+
+        semaphore = asyncio.Semaphore(max(workers, 1))
+
+        async def resolve(peer_id: str):
+            async with semaphore:
+                try:
+                    peers[peer_id] = await self.resolve_peer(peer_id)
+                except (KeyError, ValueError, BadRequest) as e:
+                    log.debug("Unable to resolve %s: %s", peer_id, e)
+
+        await asyncio.gather(
+            *(resolve(peer_id) for peer_id in set(peer_ids) if isinstance(peer_id, str))
+        )
+
+        return [peers.get(peer_id) for peer_id in peer_ids]
@@ -18,7 +18,6 @@
 #  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
 
 import pyrogram
-from pyrogram.session import Session
 
 
 class Connect:
@@ -41,12 +40,7 @@ class Connect:
 
         await self.load_session()
 
-        self.session = Session(
-            self,
-            await self.storage.dc_id(),
-            await self.storage.auth_key(),
-            await self.storage.test_mode(),
-        )
+        self.session = await self.create_session()
 
         await self.session.start()
 
@@ -51,4 +51,7 @@ class Initialize:
 
         self.updates_watchdog_task = asyncio.create_task(self.updates_watchdog())
 
+        if self.warm_dc_keys:
+            self.dc_keys_warmer_task = asyncio.create_task(self.dc_keys_warmer())
+
         self.is_initialized = True
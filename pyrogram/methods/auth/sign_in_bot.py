@@ -23,7 +23,7 @@ import pyrogram
 from pyrogram import raw
 from pyrogram import types
 from pyrogram.errors import UserMigrate
-from pyrogram.session import Session, Auth
+from pyrogram.session import Auth
 
 log = logging.getLogger(__name__)
 
@@ -64,12 +64,7 @@ class SignInBot:
                         self, await self.storage.dc_id(), await self.storage.test_mode()
                     ).create()
                 )
-                self.session = Session(
-                    self,
-                    await self.storage.dc_id(),
-                    await self.storage.auth_key(),
-                    await self.storage.test_mode(),
-                )
+                self.session = await self.create_session()
 
                 await self.session.start()
             else:
@@ -17,6 +17,7 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
 
+import asyncio
 import logging
 
 import pyrogram
@@ -45,6 +46,16 @@ class Terminate:
             await self.invoke(raw.functions.account.FinishTakeoutSession())
             log.info("Takeout session %s finished", self.takeout_id)
 
+        if self.dc_keys_warmer_task is not None:
+            self.dc_keys_warmer_task.cancel()
+
+            try:
+                await self.dc_keys_warmer_task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+            self.dc_keys_warmer_task = None
+
         await self.storage.save()
         await self.dispatcher.stop()
 
@@ -33,6 +33,7 @@ async def get_chunk(
     filter: "enums.ChatMembersFilter",
     limit: int,
     query: str,
+    compact: bool = False,
 ):
     is_queryable = filter in [
         enums.ChatMembersFilter.SEARCH,
@@ -57,6 +58,11 @@ async def get_chunk(
     users = {u.id: u for u in r.users}
     chats = {c.id: c for c in r.chats}
 
+    if compact:
+        return [
+            types.CompactChatMember._parse(member, users, chats) for member in members
+        ]
+
     return [types.ChatMember._parse(client, member, users, chats) for member in members]
 
 
@@ -67,7 +73,10 @@ class GetChatMembers:
         query: str = "",
         limit: int = 0,
         filter: "enums.ChatMembersFilter" = enums.ChatMembersFilter.SEARCH,
-    ) -> Optional[AsyncGenerator["types.ChatMember", None]]:
+        compact: bool = False,
+    ) -> Optional[
+        AsyncGenerator[Union["types.ChatMember", "types.CompactChatMember"], None]
+    ]:
         """Get the members list of a chat.
 
         A chat can be either a basic group, a supergroup or a channel.
@@ -94,8 +103,14 @@ class GetChatMembers:
                 Filter used to select the kind of members you want to retrieve. Only applicable for supergroups
                 and channels.
 
+            compact (``bool``, *optional*):
+                Pass True to get lightweight :obj:`~pyrogram.types.CompactChatMember` records built directly from the
+                raw participants, which is considerably faster and lighter when scanning large groups.
+                Defaults to False.
+
         Returns:
-            ``Generator``: On success, a generator yielding :obj:`~pyrogram.types.ChatMember` objects is returned.
+            ``Generator``: On success, a generator yielding :obj:`~pyrogram.types.ChatMember` objects
+            (or :obj:`~pyrogram.types.CompactChatMember` records in compact mode) is returned.
 
         Example:
             .. code-block:: python
@@ -127,7 +142,10 @@ class GetChatMembers:
             users = {i.id: i for i in r.users}
 
             for member in members:
-                yield types.ChatMember._parse(self, member, users, {})
+                if compact:
+                    yield types.CompactChatMember._parse(member, users, {})
+                else:
+                    yield types.ChatMember._parse(self, member, users, {})
 
             return
 
@@ -144,6 +162,7 @@ class GetChatMembers:
                 filter=filter,
                 limit=limit,
                 query=query,
+                compact=compact,
             )
 
             if not members:
@@ -17,7 +17,7 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
 
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Optional, Union
 
 import pyrogram
 from pyrogram import types, raw, utils
@@ -26,8 +26,8 @@ from pyrogram.errors import ChannelPrivate, PeerIdInvalid
 
 class GetDialogs:
     async def get_dialogs(
-        self: "pyrogram.Client", limit: int = 0
-    ) -> Optional[AsyncGenerator["types.Dialog", None]]:
+        self: "pyrogram.Client", limit: int = 0, compact: bool = False
+    ) -> Optional[AsyncGenerator[Union["types.Dialog", "types.CompactDialog"], None]]:
         """Get a user's dialogs sequentially.
 
         .. include:: /_includes/usable-by/users.rst
@@ -37,8 +37,14 @@ class GetDialogs:
                 Limits the number of dialogs to be retrieved.
                 By default, no limit is applied and all dialogs are returned.
 
+            compact (``bool``, *optional*):
+                Pass True to get lightweight :obj:`~pyrogram.types.CompactDialog` records built directly from the raw
+                dialogs. Top messages are not parsed and dialogs of chats missing from the response are skipped.
+                Defaults to False.
+
         Returns:
-            ``Generator``: A generator yielding :obj:`~pyrogram.types.Dialog` objects.
+            ``Generator``: A generator yielding :obj:`~pyrogram.types.Dialog` objects
+            (or :obj:`~pyrogram.types.CompactDialog` records in compact mode).
 
         Example:
             .. code-block:: python
@@ -70,37 +76,58 @@ class GetDialogs:
             users = {i.id: i for i in r.users}
             chats = {i.id: i for i in r.chats}
 
-            messages = {}
-
-            for message in r.messages:
-                if isinstance(message, raw.types.MessageEmpty):
-                    continue
-
-                chat_id = utils.get_peer_id(message.peer_id)
-                try:
-                    messages[chat_id] = await types.Message._parse(
-                        self, message, users, chats
+            if compact:
+                messages = {
+                    utils.get_peer_id(message.peer_id): message
+                    for message in r.messages
+                    if not isinstance(message, raw.types.MessageEmpty)
+                }
+
+                dialogs = [
+                    types.CompactDialog._parse(dialog, messages, users, chats)
+                    for dialog in r.dialogs
+                    if isinstance(dialog, raw.types.Dialog)
+                ]
+
+                # A peer missing from the users and chats of the response leaves nothing to continue from
+                dialogs = [dialog for dialog in dialogs if dialog.chat is not None]
+            else:
+                messages = {}
+
+                for message in r.messages:
+                    if isinstance(message, raw.types.MessageEmpty):
+                        continue
+
+                    chat_id = utils.get_peer_id(message.peer_id)
+                    try:
+                        messages[chat_id] = await types.Message._parse(
+                            self, message, users, chats
+                        )
+                    except (ChannelPrivate, PeerIdInvalid):
+                        continue
+
+                dialogs = []
+
+                for dialog in r.dialogs:
+                    if not isinstance(dialog, raw.types.Dialog):
+                        continue
+
+                    dialogs.append(
+                        types.Dialog._parse(self, dialog, messages, users, chats)
                     )
-                except (ChannelPrivate, PeerIdInvalid):
-                    continue
-
-            dialogs = []
-
-            for dialog in r.dialogs:
-                if not isinstance(dialog, raw.types.Dialog):
-                    continue
-
-                dialogs.append(
-                    types.Dialog._parse(self, dialog, messages, users, chats)
-                )
 
             if not dialogs:
                 return
 
             last = dialogs[-1]
 
-            offset_id = last.top_message.id
-            offset_date = utils.datetime_to_timestamp(last.top_message.date)
+            if compact:
+                offset_id = last.top_message_id
+                offset_date = utils.datetime_to_timestamp(last.top_message_date) or 0
+            else:
+                offset_id = last.top_message.id
+                offset_date = utils.datetime_to_timestamp(last.top_message.date)
+
             offset_peer = await self.resolve_peer(last.chat.id)
 
             for dialog in dialogs:
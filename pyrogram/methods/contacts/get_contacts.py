@@ -18,7 +18,7 @@
 #  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
 
 import logging
-from typing import List
+from typing import List, Union
 
 import pyrogram
 from pyrogram import raw
@@ -28,13 +28,22 @@ log = logging.getLogger(__name__)
 
 
 class GetContacts:
-    async def get_contacts(self: "pyrogram.Client") -> List["types.User"]:
+    async def get_contacts(
+        self: "pyrogram.Client", compact: bool = False
+    ) -> List[Union["types.User", "types.CompactUser"]]:
         """Get contacts from your Telegram address book.
 
         .. include:: /_includes/usable-by/users.rst
 
+        Parameters:
+            compact (``bool``, *optional*):
+                Pass True to get lightweight :obj:`~pyrogram.types.CompactUser` records built directly from the raw
+                objects, instead of full :obj:`~pyrogram.types.User` objects.
+                Defaults to False.
+
         Returns:
-            List of :obj:`~pyrogram.types.User`: On success, a list of users is returned.
+            List of :obj:`~pyrogram.types.User` | List of :obj:`~pyrogram.types.CompactUser`: On success, a list of
+            users is returned.
 
         Example:
             .. code-block:: python
@@ -43,4 +52,8 @@ class GetContacts:
                 print(contacts)
         """
         contacts = await self.invoke(raw.functions.contacts.GetContacts(hash=0))
+
+        if compact:
+            return types.List(types.CompactUser._parse(user) for user in contacts.users)
+
         return types.List(types.User._parse(self, user) for user in contacts.users)
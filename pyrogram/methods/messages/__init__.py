@@ -31,6 +31,9 @@ from .edit_message_caption import EditMessageCaption
 from .edit_message_media import EditMessageMedia
 from .edit_message_reply_markup import EditMessageReplyMarkup
 from .edit_message_text import EditMessageText
+from .export_chat_history import ExportChatHistory
+from .broadcast_message import BroadcastMessage
+from .parse_template import ParseTemplate
 from .forward_media_group import ForwardMediaGroup
 from .forward_messages import ForwardMessages
 from .get_available_effects import GetAvailableEffects
@@ -115,6 +118,9 @@ class Messages(
     RetractVote,
     DownloadMedia,
     GetChatHistory,
+    ExportChatHistory,
+    BroadcastMessage,
+    ParseTemplate,
     SendCachedMedia,
     GetChatHistoryCount,
     ReadChatHistory,
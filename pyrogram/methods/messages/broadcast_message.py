@@ -0,0 +1,279 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import asyncio
+import logging
+import os
+from typing import Iterable, List, Optional, Union
+
+import pyrogram
+from pyrogram import enums, raw, types, utils
+from pyrogram.errors import FloodWait, FloodPremiumWait, RPCError
+from pyrogram.session import Scheduler
+from pyrogram.session.scheduler import TokenBucket
+from .export_chat_history import load_checkpoint, save_checkpoint
+
+log = logging.getLogger(__name__)
+
+
+class BroadcastMessage:
+    async def broadcast_message(
+        self: "pyrogram.Client",
+        chat_ids: Iterable[Union[int, str]],
+        text: str = None,
+        parse_mode: Optional["enums.ParseMode"] = None,
+        entities: List["types.MessageEntity"] = None,
+        disable_web_page_preview: bool = None,
+        from_chat_id: Union[int, str] = None,
+        message_id: int = None,
+        drop_author: bool = True,
+        disable_notification: bool = None,
+        protect_content: bool = None,
+        allow_paid_broadcast: bool = None,
+        reply_markup: "types.InlineKeyboardMarkup" = None,
+        workers: int = 16,
+        rate: float = 25,
+        checkpoint_path: str = None,
+    ) -> "types.BroadcastResult":
+        """Send the same message to many chats.
+
+        The message content is built only once: text entities are parsed and the reply markup is serialized a
+        single time, and messages to copy are forwarded server-side, without downloading and uploading the media
+        again. To broadcast new media, send it to a chat first (e.g. "me") and broadcast it from there.
+
+        Recipients are served by *workers* concurrent tasks, paced at *rate* messages per second. Flood waits
+        pause every worker for the required time. Delivery errors (e.g. blocked bot, deleted account, unknown
+        chat, network errors that outlast the session retries) are collected per recipient instead of being raised.
+
+        If *checkpoint_path* is given, the progress is saved to it after every recipient, so that an interrupted
+        broadcast can be resumed by calling this method again with the same recipients. Even if the process is
+        killed, only the messages being sent at that moment (up to *workers*) may be sent again on resume. The
+        file is removed once the broadcast is complete.
+
+        .. include:: /_includes/usable-by/users-bots.rst
+
+        Parameters:
+            chat_ids (Iterable of ``int`` | ``str``):
+                Unique identifiers (int) or usernames (str) of the target chats.
+
+            text (``str``, *optional*):
+                Text of the message to be sent.
+                Required, unless *from_chat_id* and *message_id* are passed.
+
+            parse_mode (:obj:`~pyrogram.enums.ParseMode`, *optional*):
+                By default, texts are parsed using both Markdown and HTML styles.
+                You can combine both syntaxes together.
+
+            entities (List of :obj:`~pyrogram.types.MessageEntity`):
+                List of special entities that appear in message text, which can be specified instead of *parse_mode*.
+
+            disable_web_page_preview (``bool``, *optional*):
+                Disables link previews for links in this message.
+
+            from_chat_id (``int`` | ``str``, *optional*):
+                Unique identifier (int) or username (str) of the chat of the message to broadcast.
+
+            message_id (``int``, *optional*):
+                Identifier of the message to broadcast.
+
+            drop_author (``bool``, *optional*):
+                Pass False to forward the message, instead of sending a copy of it.
+                Defaults to True.
+
+            disable_notification (``bool``, *optional*):
+                Sends the messages silently.
+                Users will receive a notification with no sound.
+
+            protect_content (``bool``, *optional*):
+                Protects the contents of the sent messages from forwarding and saving.
+
+            allow_paid_broadcast (``bool``, *optional*):
+                Pass True to allow up to 1000 messages per second, ignoring broadcasting limits for a fee
+                of 0.1 Telegram Stars per message. The relevant Stars will be withdrawn from the bot's balance.
+                Raise *rate* accordingly.
+
+            reply_markup (:obj:`~pyrogram.types.InlineKeyboardMarkup`, *optional*):
+                An inline keyboard attached to the text messages.
+
+            workers (``int``, *optional*):
+                Number of messages being sent at the same time.
+                Defaults to 16.
+
+            rate (``float``, *optional*):
+                Maximum amount of messages sent per second.
+                Defaults to 25.
+
+            checkpoint_path (``str``, *optional*):
+                Path of the checkpoint file used to resume an interrupted broadcast.
+
+        Returns:
+            :obj:`~pyrogram.types.BroadcastResult`: The amount of messages sent and the recipients that failed.
+
+        Example:
+            .. code-block:: python
+
+                result = await app.broadcast_message(user_ids, "**Hello** everyone!", checkpoint_path="news.json")
+                print(result.sent_count, result.failed)
+
+                # Copy a photo, uploaded once to Saved Messages
+                photo = await app.send_photo("me", "photo.jpg")
+                await app.broadcast_message(user_ids, from_chat_id="me", message_id=photo.id)
+        """
+        chat_ids = list(chat_ids)
+
+        if from_chat_id is not None and message_id is not None:
+            from_peer = await self.resolve_peer(from_chat_id)
+
+            def build(peer):
+                return raw.functions.messages.ForwardMessages(
+                    to_peer=peer,
+                    from_peer=from_peer,
+                    id=[message_id],
+                    random_id=[self.rnd_id()],
+                    silent=disable_notification or None,
+                    noforwards=protect_content,
+                    allow_paid_floodskip=allow_paid_broadcast,
+                    drop_author=drop_author or None,
+                )
+        elif text is not None:
+            message, entities = (
+                await utils.parse_text_entities(self, text, parse_mode, entities)
+            ).values()
+            markup = await reply_markup.write(self) if reply_markup else None
+
+            def build(peer):
+                return raw.functions.messages.SendMessage(
+                    peer=peer,
+                    message=message,
+                    entities=entities,
+                    no_webpage=disable_web_page_preview or None,
+                    silent=disable_notification or None,
+                    random_id=self.rnd_id(),
+                    reply_markup=markup,
+                    noforwards=protect_content,
+                    allow_paid_floodskip=allow_paid_broadcast,
+                )
+        else:
+            raise ValueError("Pass either text or both from_chat_id and message_id")
+
+        state = (checkpoint_path and load_checkpoint(checkpoint_path)) or {
+            "next": 0,
+            "done": [],
+            "sent": 0,
+            "failed": [],
+        }
+
+        if state["next"]:
+            log.info("Resuming broadcast from recipient %s of %s", state["next"], len(chat_ids))
+
+        done = set(state["done"])
+        failed = {chat_id: error for chat_id, error in state["failed"]}
+        queue = asyncio.Queue()
+
+        for i in range(state["next"], len(chat_ids)):
+            if i not in done:
+                queue.put_nowait(i)
+
+        bucket = TokenBucket(rate, min(rate, workers))
+
+        # Writes are serialized and run in the executor; a worker skips its own when a later one already covered it
+        write_lock = asyncio.Lock()
+        changes = written = 0
+        writing = None
+
+        async def checkpoint():
+            nonlocal changes, written, writing
+
+            if not checkpoint_path:
+                return
+
+            changes += 1
+            target = changes
+
+            async with write_lock:
+                if written >= target:
+                    return
+
+                # Let the write of a cancelled worker finish in its thread, before replacing the file again
+                if writing is not None:
+                    await asyncio.wait([writing])
+
+                written = changes
+                snapshot = dict(state, done=sorted(done), failed=list(failed.items()))
+                writing = self.loop.run_in_executor(self.executor, save_checkpoint, checkpoint_path, snapshot)
+
+                await asyncio.shield(writing)
+
+        async def deliver(chat_id: Union[int, str]):
+            while True:
+                await bucket.acquire(Scheduler.BULK)
+
+                try:
+                    await self.invoke(build(await self.resolve_peer(chat_id)), sleep_threshold=0)
+                except (FloodWait, FloodPremiumWait) as e:
+                    log.info("Broadcast paused for %s seconds", e.value)
+                    bucket.pause(e.value)
+                except RPCError as e:
+                    failed[chat_id] = e.ID or type(e).__name__
+                    return
+                except (KeyError, ValueError):
+                    failed[chat_id] = "PEER_ID_INVALID"
+                    return
+                except (OSError, TimeoutError, asyncio.TimeoutError) as e:
+                    # The session already retried the request, don't let it stop the other recipients
+                    failed[chat_id] = type(e).__name__
+                    return
+                else:
+                    state["sent"] += 1
+                    return
+
+        async def worker():
+            while True:
+                try:
+                    i = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                await deliver(chat_ids[i])
+
+                # Keep the lowest index not yet delivered, plus the ones delivered after it
+                done.add(i)
+
+                while state["next"] in done:
+                    done.remove(state["next"])
+                    state["next"] += 1
+
+                # Wait for it before taking the next recipient, as a killed process skips the finally below
+                await checkpoint()
+
+        with Scheduler.priority(Scheduler.BULK):
+            tasks = [asyncio.create_task(worker()) for _ in range(max(workers, 1))]
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            await checkpoint()
+
+        if checkpoint_path:
+            os.remove(checkpoint_path)
+
+        return types.BroadcastResult(sent_count=state["sent"], failed=failed)
@@ -0,0 +1,239 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import asyncio
+import json
+import logging
+import os
+from typing import Union, Optional, List
+
+import pyrogram
+from pyrogram import raw, types, utils
+
+log = logging.getLogger(__name__)
+
+
+def load_checkpoint(path: str) -> Optional[dict]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_checkpoint(path: str, state: dict):
+    temp_path = path + ".temp"
+
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+
+    os.replace(temp_path, path)
+
+
+def split_ranges(min_id: int, max_id: int, shard_size: int) -> List[List[int]]:
+    ranges = []
+    hi = max_id
+
+    # Each range is stored as [lowest id, highest id, next offset_id] and ranges are laid out
+    # newest first, so that an interrupted export has the most recent history written already.
+    while hi > min_id:
+        lo = max(min_id + 1, hi - shard_size + 1)
+        ranges.append([lo, hi, hi + 1])
+        hi = lo - 1
+
+    return ranges
+
+
+class ExportChatHistory:
+    async def export_chat_history(
+        self: "pyrogram.Client",
+        chat_id: Union[int, str],
+        path: str,
+        checkpoint_path: str = None,
+        workers: int = 4,
+        shard_size: int = 5000,
+        min_id: int = 0,
+        max_id: int = 0,
+    ) -> int:
+        """Export a chat history to a file, fetching several ranges of message ids concurrently.
+
+        The message id space is split into shards using the *min_id* and *max_id* bounds of
+        :obj:`~pyrogram.raw.functions.messages.GetHistory` and the shards are downloaded by multiple workers at
+        the same time. Messages are streamed to *path* as newline-delimited JSON (one message per line, in no
+        particular order) and the progress of every shard is saved to a checkpoint file, so that an interrupted
+        export can be resumed by calling this method again with the same arguments.
+
+        When the client is started with ``takeout=True`` requests are sent through the takeout session, which is
+        less prone to flood limits.
+
+        .. include:: /_includes/usable-by/users.rst
+
+        Parameters:
+            chat_id (``int`` | ``str``):
+                Unique identifier (int) or username (str) of the target chat.
+                For your personal cloud (Saved Messages) you can simply use "me" or "self".
+                For a contact that exists in your Telegram address book you can use his phone number (str).
+
+            path (``str``):
+                Path of the output file. Messages are appended to it when resuming an export.
+
+            checkpoint_path (``str``, *optional*):
+                Path of the checkpoint file.
+                Defaults to *path* + ".checkpoint". The file is removed once the export is complete.
+
+            workers (``int``, *optional*):
+                Number of shards fetched concurrently.
+                Defaults to 4.
+
+            shard_size (``int``, *optional*):
+                Amount of message ids covered by each shard.
+                Defaults to 5000.
+
+            min_id (``int``, *optional*):
+                Export only messages with an id greater than min_id.
+
+            max_id (``int``, *optional*):
+                Export only messages with an id lower than or equal to max_id.
+                Defaults to the id of the latest message in the chat.
+
+        Returns:
+            ``int``: The amount of messages written to the output file by this call.
+
+        Example:
+            .. code-block:: python
+
+                count = await app.export_chat_history("pyrogramchat", "history.jsonl", workers=8)
+                print(count)
+        """
+        checkpoint_path = checkpoint_path or path + ".checkpoint"
+        peer = await self.resolve_peer(chat_id)
+
+        state = load_checkpoint(checkpoint_path)
+
+        if state is None:
+            if not max_id:
+                r = await self.invoke(
+                    raw.functions.messages.GetHistory(
+                        peer=peer,
+                        offset_id=0,
+                        offset_date=0,
+                        add_offset=0,
+                        limit=1,
+                        max_id=0,
+                        min_id=0,
+                        hash=0,
+                    ),
+                    sleep_threshold=60,
+                )
+
+                max_id = r.messages[0].id if r.messages else 0
+
+            state = {"ranges": split_ranges(min_id, max_id, shard_size)}
+            mode = "w"
+        else:
+            log.info(
+                "Resuming export of %s: %s shards left", chat_id, len(state["ranges"])
+            )
+            mode = "a"
+
+        save_checkpoint(checkpoint_path, state)
+
+        queue = asyncio.Queue()
+
+        for shard in state["ranges"]:
+            queue.put_nowait(shard)
+
+        exported = 0
+        # Pages are written in the order they are fetched, each before the checkpoint that counts it as done
+        write_lock = asyncio.Lock()
+
+        with open(path, mode, encoding="utf-8") as file:
+
+            def write(messages: List["types.Message"], checkpoint: dict):
+                file.write(
+                    "".join(
+                        json.dumps(m, default=types.Object.default, ensure_ascii=False) + "\n"
+                        for m in messages
+                        if not m.empty
+                    )
+                )
+                file.flush()
+
+                save_checkpoint(checkpoint_path, checkpoint)
+
+            async def save(messages: List["types.Message"]):
+                # A copy, as the workers keep updating the state while it's written in another thread
+                checkpoint = {"ranges": [shard[:] for shard in state["ranges"]]}
+
+                async with write_lock:
+                    await self.loop.run_in_executor(self.executor, write, messages, checkpoint)
+
+            async def worker():
+                nonlocal exported
+
+                while True:
+                    try:
+                        shard = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+
+                    lo, _, offset_id = shard
+
+                    while True:
+                        r = await self.invoke(
+                            raw.functions.messages.GetHistory(
+                                peer=peer,
+                                offset_id=offset_id,
+                                offset_date=0,
+                                add_offset=0,
+                                limit=100,
+                                max_id=0,
+                                min_id=lo - 1,
+                                hash=0,
+                            ),
+                            sleep_threshold=60,
+                        )
+
+                        if not r.messages:
+                            break
+
+                        messages = await utils.parse_messages(self, r, replies=0)
+
+                        exported += sum(not m.empty for m in messages)
+                        offset_id = shard[2] = r.messages[-1].id
+
+                        if offset_id <= lo:
+                            break
+
+                        await save(messages)
+
+                    state["ranges"].remove(shard)
+                    await save(messages if r.messages else [])
+
+            tasks = [self.loop.create_task(worker()) for _ in range(max(1, workers))]
+
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        os.remove(checkpoint_path)
+
+        return exported
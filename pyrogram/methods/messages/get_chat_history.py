@@ -34,6 +34,7 @@ async def get_chunk(
     from_date: datetime = utils.zero_datetime(),
     min_id: int = 0,
     max_id: int = 0,
+    compact: bool = False,
 ):
     messages = await client.invoke(
         raw.functions.messages.GetHistory(
@@ -49,6 +50,9 @@ async def get_chunk(
         sleep_threshold=60,
     )
 
+    if compact:
+        return [types.CompactMessage._parse(message) for message in messages.messages]
+
     return await utils.parse_messages(client, messages, replies=0)
 
 
@@ -62,7 +66,8 @@ class GetChatHistory:
         offset_date: datetime = utils.zero_datetime(),
         min_id: int = 0,
         max_id: int = 0,
-    ) -> Optional[AsyncGenerator["types.Message", None]]:
+        compact: bool = False,
+    ) -> Optional[AsyncGenerator[Union["types.Message", "types.CompactMessage"], None]]:
         """Get messages from a chat history.
 
         The messages are returned in reverse chronological order.
@@ -96,8 +101,14 @@ class GetChatHistory:
             max_id: (``int``, *optional*):
                 The maximum message id. you will not get any message which have id greater than max_id.
 
+            compact (``bool``, *optional*):
+                Pass True to get lightweight :obj:`~pyrogram.types.CompactMessage` records built directly from the raw
+                messages. Users, chats, media and entities are not parsed and no additional requests are made.
+                Defaults to False.
+
         Returns:
-            ``Generator``: A generator yielding :obj:`~pyrogram.types.Message` objects.
+            ``Generator``: A generator yielding :obj:`~pyrogram.types.Message` objects
+            (or :obj:`~pyrogram.types.CompactMessage` records in compact mode).
 
         Example:
             .. code-block:: python
@@ -119,6 +130,7 @@ class GetChatHistory:
                 from_date=offset_date,
                 min_id=min_id,
                 max_id=max_id,
+                compact=compact,
             )
 
             if not messages:
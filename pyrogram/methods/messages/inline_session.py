@@ -17,51 +17,175 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
 
+import asyncio
+import logging
+import time
+
 import pyrogram
 from pyrogram import raw
-from pyrogram.errors import AuthBytesInvalid
+from pyrogram.errors import AuthBytesInvalid, AuthKeyUnregistered, Unauthorized
 from pyrogram.session import Session
-from pyrogram.session.auth import Auth
 
+log = logging.getLogger(__name__)
 
-async def get_session(client: "pyrogram.Client", dc_id: int):
-    if dc_id == await client.storage.dc_id():
-        return client
 
-    async with client.media_sessions_lock:
-        if client.media_sessions.get(dc_id):
-            return client.media_sessions[dc_id]
+class InlineSession:
+    """A long-lived session to a foreign DC, used to edit inline and business messages.
 
-        session = client.media_sessions[dc_id] = Session(
-            client,
-            dc_id,
-            await Auth(client, dc_id, await client.storage.test_mode()).create(),
-            await client.storage.test_mode(),
-            is_media=True,
-        )
+    The auth key is persisted in the storage and the authorization is imported only
+    when the server reports it as unregistered. The session is closed after being
+    idle for :attr:`IDLE_TIMEOUT` seconds.
+    """
 
-        await session.start()
+    IDLE_TIMEOUT = 5 * 60
+    START_TIMEOUT = 30
 
-        if dc_id == await client.storage.dc_id():
-            return session
+    def __init__(self, client: "pyrogram.Client", dc_id: int):
+        self.client = client
+        self.dc_id = dc_id
 
-        for _ in range(3):
-            exported_auth = await client.invoke(
-                raw.functions.auth.ExportAuthorization(dc_id=dc_id)
-            )
+        self.session = None
+        self.authorization = 0
+        self.is_authorized = False
+        self.authorization_lock = asyncio.Lock()
+
+        self.pending = 0
+        self.last_used = time.monotonic()
+        self.idle_handle = None
+
+        self.loop = asyncio.get_event_loop()
+
+    async def start(self):
+        test_mode = await self.client.storage.test_mode()
+        auth_key = await self.client.storage.dc_auth_key(self.dc_id)
+
+        if auth_key is not None:
+            self.session = Session(self.client, self.dc_id, auth_key, test_mode, is_media=True)
 
             try:
-                await session.invoke(
-                    raw.functions.auth.ImportAuthorization(
-                        id=exported_auth.id, bytes=exported_auth.bytes
-                    )
+                await asyncio.wait_for(self.session.start(), self.START_TIMEOUT)
+            # The server answers an unknown key with a transport error, surfacing as Unauthorized
+            # or, depending on timing, as a timeout (a different class than TimeoutError before 3.11)
+            except (Unauthorized, OSError, TimeoutError, asyncio.TimeoutError) as e:
+                log.warning("Stored auth key for DC%s was rejected (%s), creating a new one", self.dc_id, e)
+
+                await self.close_session()
+                await self.client.storage.dc_auth_key(self.dc_id, None)
+
+                auth_key = None
+            else:
+                # A stored key is assumed to be authorized until proven otherwise
+                self.is_authorized = True
+
+        if auth_key is None:
+            auth_key = await self.client.get_dc_auth_key(self.dc_id)
+
+            self.session = Session(self.client, self.dc_id, auth_key, test_mode, is_media=True)
+            await self.session.start()
+
+        self.idle_handle = self.loop.call_later(self.IDLE_TIMEOUT, self.check_idle)
+
+    async def stop(self):
+        if self.idle_handle is not None:
+            self.idle_handle.cancel()
+            self.idle_handle = None
+
+        await self.close_session()
+
+    async def close_session(self):
+        try:
+            await self.session.stop()
+        except Exception as e:
+            log.debug("Error while stopping DC%s session: %s", self.dc_id, e)
+
+    async def authorize(self, authorization: int):
+        async with self.authorization_lock:
+            # Another request already imported the authorization meanwhile
+            if self.is_authorized and self.authorization != authorization:
+                return
+
+            for _ in range(3):
+                exported_auth = await self.client.invoke(
+                    raw.functions.auth.ExportAuthorization(dc_id=self.dc_id)
                 )
-            except AuthBytesInvalid:
-                continue
+
+                try:
+                    await self.session.invoke(
+                        raw.functions.auth.ImportAuthorization(
+                            id=exported_auth.id, bytes=exported_auth.bytes
+                        )
+                    )
+                except AuthBytesInvalid:
+                    continue
+                else:
+                    break
             else:
-                break
-        else:
-            await session.stop()
-            raise AuthBytesInvalid
+                raise AuthBytesInvalid
+
+            self.authorization += 1
+            self.is_authorized = True
+
+    async def invoke(self, query: "raw.core.TLObject", *args, **kwargs):
+        self.pending += 1
+
+        try:
+            authorization = self.authorization
+
+            if not self.is_authorized:
+                await self.authorize(authorization)
+
+            try:
+                return await self.session.invoke(query, *args, **kwargs)
+            except AuthKeyUnregistered:
+                log.info("Importing authorization for DC%s", self.dc_id)
+
+                await self.authorize(authorization)
+
+                return await self.session.invoke(query, *args, **kwargs)
+        finally:
+            self.pending -= 1
+            self.last_used = time.monotonic()
+
+    def check_idle(self):
+        idle_at = self.last_used + self.IDLE_TIMEOUT
+
+        if self.pending or idle_at > time.monotonic():
+            self.idle_handle = self.loop.call_at(
+                self.loop.time() + max(idle_at - time.monotonic(), 1), self.check_idle
+            )
+            return
+
+        self.idle_handle = None
+        self.loop.create_task(self.close())
+
+    async def close(self):
+        async with self.client.media_sessions_lock:
+            # The session may have been handed out again while waiting for the lock
+            if self.pending or time.monotonic() - self.last_used < self.IDLE_TIMEOUT:
+                self.idle_handle = self.loop.call_later(self.IDLE_TIMEOUT, self.check_idle)
+                return
+
+            if self.client.media_sessions.get(self.dc_id) is self:
+                del self.client.media_sessions[self.dc_id]
+
+        log.info("Closing idle session to DC%s", self.dc_id)
+
+        await self.stop()
+
+
+async def get_session(client: "pyrogram.Client", dc_id: int):
+    if dc_id == await client.storage.dc_id():
+        return client
+
+    async with client.media_sessions_lock:
+        session = client.media_sessions.get(dc_id)
+
+        if session is None:
+            session = InlineSession(client, dc_id)
+            await session.start()
+
+            client.media_sessions[dc_id] = session
+
+        session.last_used = time.monotonic()
 
         return session
@@ -0,0 +1,64 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from typing import Optional
+
+import pyrogram
+from pyrogram import enums, types
+
+
+class ParseTemplate:
+    async def parse_template(
+        self: "pyrogram.Client",
+        text: str,
+        parse_mode: Optional["enums.ParseMode"] = None,
+    ) -> "types.TextTemplate":
+        """Parse a formatted text once, to send it many times with different values.
+
+        The markup is parsed and user mentions are resolved only once. The returned template, as it is or rendered
+        with :meth:`~pyrogram.types.TextTemplate.format`, can be passed as the text or caption of any method that
+        sends or edits messages, which will then skip parsing altogether.
+
+        Replacement fields use the :meth:`str.format` syntax and can only appear in the text, not in the urls
+        of links.
+
+        .. include:: /_includes/usable-by/users-bots.rst
+
+        Parameters:
+            text (``str``):
+                The formatted text, e.g. "Hi **{name}**, you have {count} new messages".
+
+            parse_mode (:obj:`~pyrogram.enums.ParseMode`, *optional*):
+                By default, texts are parsed using both Markdown and HTML styles.
+                You can combine both syntaxes together.
+
+        Returns:
+            :obj:`~pyrogram.types.TextTemplate`: The parsed template.
+
+        Example:
+            .. code-block:: python
+
+                template = await app.parse_template("Hi **{name}**, you have {count} new messages")
+
+                for user in users:
+                    await app.send_message(user.id, template.format(name=user.first_name, count=user.count))
+        """
+        parsed = await self.parser.parse(text, parse_mode)
+
+        return types.TextTemplate(text=parsed["message"], entities=parsed["entities"])
@@ -43,10 +43,7 @@ class GetListenerMatchingWithData:
         Returns:
             :obj:`~pyrogram.types.Listener`: On success, a Listener is returned.
         """
-        matching = []
-        for listener in self.listeners[listener_type]:
-            if listener.identifier.matches(data):
-                matching.append(listener)
+        matching = self.listeners[listener_type].match(data)
 
         # in case of multiple matching listeners, the most specific should be returned
         def count_populated_attributes(listener_item: Listener):
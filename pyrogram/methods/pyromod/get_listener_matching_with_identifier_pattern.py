@@ -47,10 +47,7 @@ class GetListenerMatchingWithIdentifierPattern:
         Returns:
             :obj:`~pyrogram.types.Listener`: On success, a Listener is returned.
         """
-        matching = []
-        for listener in self.listeners[listener_type]:
-            if pattern.matches(listener.identifier):
-                matching.append(listener)
+        matching = self.listeners[listener_type].match_pattern(pattern)
 
         # in case of multiple matching listeners, the most specific should be returned
 
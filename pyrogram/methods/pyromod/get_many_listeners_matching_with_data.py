@@ -43,8 +43,4 @@ class GetManyListenersMatchingWithData:
         Returns:
             List of :obj:`~pyrogram.types.Listener`: On success, a list of Listener is returned.
         """
-        listeners = []
-        for listener in self.listeners[listener_type]:
-            if listener.identifier.matches(data):
-                listeners.append(listener)
-        return listeners
+        return self.listeners[listener_type].match(data)
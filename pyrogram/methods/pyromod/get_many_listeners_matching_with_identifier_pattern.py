@@ -47,8 +47,4 @@ class GetManyListenersMatchingWithIdentifierPattern:
         Returns:
             List of :obj:`~pyrogram.types.Listener`: On success, a list of Listener is returned.
         """
-        listeners = []
-        for listener in self.listeners[listener_type]:
-            if pattern.matches(listener.identifier):
-                listeners.append(listener)
-        return listeners
+        return self.listeners[listener_type].match_pattern(pattern)
@@ -23,7 +23,7 @@ from pyrogram.types import Listener
 
 class RemoveListener:
     def remove_listener(self: "pyrogram.Client", listener: Listener):
-        """Removes a listener from the :meth:`~pyrogram.Client.listeners` dictionary.
+        """Removes a listener from the :meth:`~pyrogram.Client.listeners` registries.
 
         .. include:: /_includes/usable-by/users-bots.rst
 
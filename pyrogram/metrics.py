@@ -0,0 +1,184 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import asyncio
+import logging
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Optional
+
+log = logging.getLogger(__name__)
+
+
+class Histogram:
+    """Distribution of observed values (in seconds, for timings) over fixed buckets."""
+
+    __slots__ = ("counts", "count", "sum", "max")
+
+    # Upper bounds of the buckets, the last one counting everything above
+    BOUNDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.BOUNDS, value)] += 1
+        self.count += 1
+        self.sum += value
+
+        if value > self.max:
+            self.max = value
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "buckets": dict(zip(self.BOUNDS + (float("inf"),), self.counts)),
+        }
+
+
+class Metrics:
+    """Counters and timings of a Client's internals, available as :obj:`~pyrogram.Client` ``metrics``.
+
+    Metrics are grouped by name and then by label (the RPC method, the session or the handler they are about):
+
+    - ``rpc_latency``: Histograms of the time taken by RPC calls, by method.
+    - ``rpc_in_flight``: RPC requests waiting for a response, by session.
+    - ``flood_waits``: FloodWait errors, by method.
+    - ``flood_wait_seconds``: Histograms of the time FloodWait errors asked to wait, by method.
+    - ``bytes_sent`` and ``bytes_received``: Traffic by session.
+    - ``reconnects``: Restarts after connection losses, by session.
+    - ``updates_queue_depth``: Updates waiting to be dispatched.
+    - ``updates_queue_wait``: Histogram of the time updates spent waiting to be dispatched.
+    - ``handler_time``: Histograms of the time taken by handlers, by callback.
+
+    Sessions are labelled by their DC, followed by ``:media`` or ``:cdn`` for media and CDN sessions.
+
+    Example:
+        .. code-block:: python
+
+            snapshot = app.metrics.snapshot()
+            print(snapshot["rpc_latency"]["messages.SendMessage"]["count"])
+
+            def export(name, label, value):
+                collector.record(name, label, value)
+
+            app.metrics.add_callback(export)
+    """
+
+    def __init__(self):
+        self.histograms: Dict[str, Dict[Optional[str], Histogram]] = {}
+        self.counters: Dict[str, Dict[Optional[str], int]] = {}
+        self.gauges: Dict[str, Callable[[], float]] = {}
+        self.callbacks = []
+
+    def observe(self, name: str, value: float, label: str = None):
+        """Record a value in the histogram of a metric."""
+        histograms = self.histograms.setdefault(name, {})
+        histogram = histograms.get(label)
+
+        if histogram is None:
+            histogram = histograms[label] = Histogram()
+
+        histogram.observe(value)
+
+        if self.callbacks:
+            self.notify(name, label, value)
+
+    def increment(self, name: str, label: str = None, value: int = 1):
+        """Add a value (negative to subtract) to the counter of a metric."""
+        counters = self.counters.setdefault(name, {})
+        counters[label] = counters.get(label, 0) + value
+
+        if self.callbacks:
+            self.notify(name, label, counters[label])
+
+    def add_gauge(self, name: str, function: Callable[[], float]):
+        """Register a metric read by calling a function when a snapshot is taken."""
+        self.gauges[name] = function
+
+    def add_callback(self, callback: Callable):
+        """Register a function called with *(name, label, value)* for every observed value and updated counter.
+
+        Callbacks run in the event loop, synchronously: they should only hand over the values (e.g. to a queue or a
+        collector client buffer). Errors raised by callbacks are logged and ignored.
+        """
+        self.callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable):
+        """Unregister a function previously registered with :meth:`add_callback`."""
+        self.callbacks.remove(callback)
+
+    def notify(self, name: str, label: Optional[str], value: float):
+        for callback in self.callbacks:
+            try:
+                callback(name, label, value)
+            except Exception as e:
+                log.exception(e)
+
+    def snapshot(self) -> dict:
+        """Get the current values of all metrics.
+
+        Returns:
+            ``dict``: The metrics by name. Metrics with labels map them to their values, histograms are dicts with
+            the *count*, *sum* and *max* of the observed values and the *buckets* count by upper bound.
+        """
+        snapshot = {}
+
+        for name, values in self.counters.items():
+            snapshot[name] = self.unlabelled(dict(values))
+
+        for name, values in self.histograms.items():
+            snapshot[name] = self.unlabelled(
+                {label: histogram.snapshot() for label, histogram in values.items()}
+            )
+
+        for name, function in self.gauges.items():
+            snapshot[name] = function()
+
+        return snapshot
+
+    @staticmethod
+    def unlabelled(values: dict):
+        if len(values) == 1 and None in values:
+            return values[None]
+
+        return values
+
+
+class TimedQueue(asyncio.Queue):
+    """Queue reporting the time each item waited in it to a metric."""
+
+    def __init__(self, metrics: Metrics, name: str):
+        super().__init__()
+        self.metrics = metrics
+        self.name = name
+
+    def _put(self, item):
+        self._queue.append((time.perf_counter(), item))
+
+    def _get(self):
+        put_time, item = self._queue.popleft()
+        self.metrics.observe(self.name, time.perf_counter() - put_time)
+
+        return item
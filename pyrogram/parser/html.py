@@ -40,7 +40,9 @@ class Parser(HTMLParser):
 
         self.client = client
 
-        self.text = ""
+        # Text chunks and their total length in UTF-16 code units, which entity offsets are expressed in
+        self.text = []
+        self.length = 0
         self.entities = []
         self.tag_entities = {}
 
@@ -87,26 +89,26 @@ class Parser(HTMLParser):
         if tag not in self.tag_entities:
             self.tag_entities[tag] = []
 
-        self.tag_entities[tag].append(entity(offset=len(self.text), length=0, **extra))
+        self.tag_entities[tag].append(entity(offset=self.length, length=0, **extra))
 
     def handle_data(self, data):
         data = html.unescape(data)
 
-        for entities in self.tag_entities.values():
-            for entity in entities:
-                entity.length += len(data)
-
-        self.text += data
+        self.text.append(data)
+        self.length += utils.utf16_len(data)
 
     def handle_endtag(self, tag):
         try:
-            self.entities.append(self.tag_entities[tag].pop())
+            entity = self.tag_entities[tag].pop()
         except (KeyError, IndexError):
             line, offset = self.getpos()
             offset += 1
 
             log.debug("Unmatched closing tag </%s> at line %s:%s", tag, line, offset)
         else:
+            entity.length = self.length - entity.offset
+            self.entities.append(entity)
+
             if not self.tag_entities[tag]:
                 self.tag_entities.pop(tag)
 
@@ -124,7 +126,7 @@ class HTML:
         text = re.sub(r"\s*(</[\w</>]*>)\s*$", r"\1", text)
 
         parser = Parser(self.client)
-        parser.feed(utils.add_surrogates(text))
+        parser.feed(text)
         parser.close()
 
         if parser.tag_entities:
@@ -151,7 +153,7 @@ class HTML:
         entities = list(filter(lambda x: x.length > 0, entities))
 
         return {
-            "message": utils.remove_surrogates(parser.text),
+            "message": "".join(parser.text),
             "entities": sorted(entities, key=lambda e: e.offset) or None,
         }
 
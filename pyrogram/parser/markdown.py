@@ -65,6 +65,22 @@ URL_MARKUP = '<a href="{}">{}</a>'
 EMOJI_MARKUP = "<emoji id={}>{}</emoji>"
 FIXED_WIDTH_DELIMS = [CODE_DELIM, PRE_DELIM]
 CODE_TAG_RE = re.compile(r"<code>.*?</code>")
+CODE_SECTION = "{{CODE_SECTION_{}}}"
+CODE_SECTION_RE = re.compile(r"\{CODE_SECTION_(\d+)\}")
+
+# Code sections already written in HTML, or Markdown delimiters. Code sections are matched first, so that the
+# delimiters inside them are left alone.
+TOKEN_RE = re.compile(f"({CODE_TAG_RE.pattern})|{MARKDOWN_RE.pattern}")
+
+DELIM_TAGS = {
+    BOLD_DELIM: "b",
+    ITALIC_DELIM: "i",
+    UNDERLINE_DELIM: "u",
+    STRIKE_DELIM: "s",
+    CODE_DELIM: "code",
+    PRE_DELIM: "pre",
+    SPOILER_DELIM: "spoiler",
+}
 
 
 class Markdown:
@@ -112,86 +128,95 @@ class Markdown:
 
         return "\n".join(result)
 
+    @staticmethod
+    def url_markup(match: re.Match) -> str:
+        is_emoji, text_url, url = match.groups()
+
+        if is_emoji:
+            return EMOJI_MARKUP.format(url.lstrip("tg://emoji?id="), text_url)
+
+        return URL_MARKUP.format(url, text_url)
+
     async def parse(self, text: str, strict: bool = False):
         if strict:
             text = html.escape(text)
         text = self.blockquote_parser(text)
 
+        # Translate to HTML in a single pass over the text, collecting the pieces of the result
+        pieces = []
+        code_sections = []
         delims = set()
         is_fixed_width = False
+        position = 0
+        # Languages of opening PRE_DELIMs are translated like the rest of the text, until the end of their line
+        languages = 0
+        language_end = -1
+
+        while True:
+            match = TOKEN_RE.search(text, position)
+
+            if match is None:
+                break
+
+            start, end = match.span()
+            code_section, delim = match.groups()
 
-        placeholders = {}
-        for i, code_section in enumerate(CODE_TAG_RE.findall(text)):
-            placeholder = f"{{CODE_SECTION_{i}}}"
-            placeholders[placeholder] = code_section
-            text = text.replace(code_section, placeholder, 1)
+            if languages and language_end < start:
+                pieces.append(text[position:language_end] + '">' * languages)
+                position = language_end
+                languages = 0
 
-        for i, match in enumerate(re.finditer(MARKDOWN_RE, text)):
-            start, _ = match.span()
-            delim = match.group(1)
-            full = match.group(0)
+            pieces.append(text[position:start])
+            position = end
+
+            # Code sections are put aside and only restored once links are done
+            if code_section is not None:
+                pieces.append(CODE_SECTION.format(len(code_sections)))
+                code_sections.append(code_section)
+                continue
 
             if delim in FIXED_WIDTH_DELIMS:
                 is_fixed_width = not is_fixed_width
 
             if is_fixed_width and delim not in FIXED_WIDTH_DELIMS:
+                pieces.append(delim)
                 continue
 
-            if delim == BOLD_DELIM:
-                tag = "b"
-            elif delim == ITALIC_DELIM:
-                tag = "i"
-            elif delim == UNDERLINE_DELIM:
-                tag = "u"
-            elif delim == STRIKE_DELIM:
-                tag = "s"
-            elif delim == CODE_DELIM:
-                tag = "code"
-            elif delim == PRE_DELIM:
-                tag = "pre"
-            elif delim == SPOILER_DELIM:
-                tag = "spoiler"
-            else:
-                continue
+            tag = DELIM_TAGS[delim]
 
-            if delim not in delims:
-                delims.add(delim)
-                tag = OPENING_TAG.format(tag)
-            else:
+            if delim in delims:
                 delims.remove(delim)
-                tag = CLOSING_TAG.format(tag)
-
-            if delim == PRE_DELIM and delim in delims:
-                delim_and_language = text[text.find(PRE_DELIM) :].split("\n")[0]
-                language = delim_and_language[len(PRE_DELIM) :]
-                text = utils.replace_once(
-                    text, delim_and_language, f'<pre language="{language}">', start
-                )
+                pieces.append(CLOSING_TAG.format(tag))
                 continue
 
-            text = utils.replace_once(text, delim, tag, start)
+            delims.add(delim)
 
-        for i, match in enumerate(re.finditer(URL_RE, text)):
-            start, _ = match.span()
-            is_emoji, text_url, url = match.groups()
-            full = match.group(0)
-
-            if not is_emoji and text_url:
-                text = utils.replace_once(
-                    text, full, URL_MARKUP.format(url, text_url), start
-                )
+            if delim == PRE_DELIM:
+                # The rest of the line is the language
+                line_end = text.find("\n", end)
+                language_end = len(text) if line_end == -1 else line_end
+                languages += 1
+                pieces.append('<pre language="')
                 continue
 
-            if is_emoji:
-                emoji = text_url
-                emoji_id = url.lstrip("tg://emoji?id=")
-                text = utils.replace_once(
-                    text, full, EMOJI_MARKUP.format(emoji_id, emoji), start
-                )
-                continue
+            pieces.append(OPENING_TAG.format(tag))
+
+        if languages:
+            pieces.append(text[position:language_end] + '">' * languages)
+            position = language_end
+
+        pieces.append(text[position:])
+        text = URL_RE.sub(self.url_markup, "".join(pieces))
 
-        for placeholder, code_section in placeholders.items():
-            text = text.replace(placeholder, code_section)
+        if code_sections:
+            text = CODE_SECTION_RE.sub(
+                lambda m: (
+                    code_sections[int(m.group(1))]
+                    if int(m.group(1)) < len(code_sections)
+                    else m.group()
+                ),
+                text,
+            )
 
         return await self.html.parse(text)
 
@@ -34,6 +34,14 @@ def add_surrogates(text):
     )
 
 
+def utf16_len(text):
+    # Length in UTF-16 code units: SMP code points count twice
+    if text.isascii():
+        return len(text)
+
+    return len(text.encode("utf-16-le", "surrogatepass")) // 2
+
+
 def remove_surrogates(text):
     # Replace each surrogate pair with a SMP code point
     return text.encode("utf-16", "surrogatepass").decode("utf-16")
@@ -29,12 +29,14 @@ from .tl_object import TLObject
 class GzipPacked(TLObject):
     ID = 0x3072CFA1
 
-    __slots__ = ["packed_data"]
+    __slots__ = ["packed_data", "compressed_data"]
 
     QUALNAME = "GzipPacked"
 
-    def __init__(self, packed_data: TLObject):
+    def __init__(self, packed_data: TLObject, compressed_data: bytes = None):
         self.packed_data = packed_data
+        # Optionally, the already compressed packed_data, to avoid compressing it again on every write
+        self.compressed_data = compressed_data
 
     @staticmethod
     def read(data: BytesIO, *args: Any) -> "GzipPacked":
@@ -46,6 +48,9 @@ class GzipPacked(TLObject):
 
         b.write(Int(self.ID, False))
 
-        b.write(Bytes(compress(self.packed_data.write())))
+        if self.compressed_data is None:
+            self.compressed_data = compress(self.packed_data.write())
+
+        b.write(Bytes(self.compressed_data))
 
         return b.getvalue()
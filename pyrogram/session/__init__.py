@@ -18,6 +18,8 @@
 #  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
 
 from .auth import Auth
+from .scheduler import Scheduler
 from .session import Session
+from .session_pool import SessionPool
 
-__all__ = ["Auth", "Session"]
+__all__ = ["Auth", "Scheduler", "Session", "SessionPool"]
@@ -23,7 +23,7 @@ import time
 from hashlib import sha1
 from io import BytesIO
 from os import urandom
-from typing import Optional
+from typing import Optional, Tuple
 
 import pyrogram
 from pyrogram import raw
@@ -50,6 +50,8 @@ class Auth:
 
         self.connection: Optional[Connection] = None
 
+        self.loop = asyncio.get_event_loop()
+
     @staticmethod
     def pack(data: TLObject) -> bytes:
         return bytes(8) + Long(MsgId()) + Int(len(data.write())) + data.write()
@@ -59,6 +61,51 @@ class Auth:
         b.seek(20)  # Skip auth_key_id (8), message_id (8) and message_length (4)
         return TLObject.read(b)
 
+    @staticmethod
+    def encrypt_pq_inner_data(
+        pq_bytes: bytes,
+        nonce: int,
+        server_nonce: int,
+        new_nonce: int,
+        public_key_fingerprint: int,
+    ) -> Tuple[int, int, bytes]:
+        # CPU-bound: run in an executor to keep the event loop responsive
+        pq = int.from_bytes(pq_bytes, "big")
+        log.debug("Start PQ factorization: %s", pq)
+        start = time.time()
+        g = prime.decompose(pq)
+        p, q = sorted((g, pq // g))  # p < q
+        log.debug(
+            "Done PQ factorization (%ss): %s %s",
+            round(time.time() - start, 3),
+            p,
+            q,
+        )
+
+        data = raw.types.PQInnerData(
+            pq=pq_bytes,
+            p=p.to_bytes(4, "big"),
+            q=q.to_bytes(4, "big"),
+            nonce=nonce,
+            server_nonce=server_nonce,
+            new_nonce=new_nonce,
+        ).write()
+
+        sha = sha1(data).digest()
+        padding = urandom(-(len(data) + len(sha)) % 255)
+        data_with_hash = sha + data + padding
+
+        return p, q, rsa.encrypt(data_with_hash, public_key_fingerprint)
+
+    @staticmethod
+    def compute_dh_keys(g: int, g_a: int, dh_prime: int) -> Tuple[bytes, bytes]:
+        # CPU-bound: run in an executor to keep the event loop responsive
+        b = int.from_bytes(urandom(256), "big")
+        g_b = pow(g, b, dh_prime).to_bytes(256, "big")
+        auth_key = pow(g_a, b, dh_prime).to_bytes(256, "big")
+
+        return g_b, auth_key
+
     async def invoke(self, data: TLObject):
         data = self.pack(data)
         await self.connection.send(data)
@@ -111,36 +158,19 @@ class Auth:
                 else:
                     raise Exception("Public key not found")
 
-                # Step 3
-                pq = int.from_bytes(res_pq.pq, "big")
-                log.debug("Start PQ factorization: %s", pq)
-                start = time.time()
-                g = prime.decompose(pq)
-                p, q = sorted((g, pq // g))  # p < q
-                log.debug(
-                    "Done PQ factorization (%ss): %s %s",
-                    round(time.time() - start, 3),
-                    p,
-                    q,
-                )
-
-                # Step 4
+                # Step 3; Step 4
                 server_nonce = res_pq.server_nonce
                 new_nonce = int.from_bytes(urandom(32), "little", signed=True)
 
-                data = raw.types.PQInnerData(
-                    pq=res_pq.pq,
-                    p=p.to_bytes(4, "big"),
-                    q=q.to_bytes(4, "big"),
-                    nonce=nonce,
-                    server_nonce=server_nonce,
-                    new_nonce=new_nonce,
-                ).write()
-
-                sha = sha1(data).digest()
-                padding = urandom(-(len(data) + len(sha)) % 255)
-                data_with_hash = sha + data + padding
-                encrypted_data = rsa.encrypt(data_with_hash, public_key_fingerprint)
+                p, q, encrypted_data = await self.loop.run_in_executor(
+                    None,
+                    self.encrypt_pq_inner_data,
+                    res_pq.pq,
+                    nonce,
+                    server_nonce,
+                    new_nonce,
+                    public_key_fingerprint,
+                )
 
                 log.debug("Done encrypt data with RSA")
 
@@ -191,8 +221,10 @@ class Auth:
 
                 # Step 6
                 g = server_dh_inner_data.g
-                b = int.from_bytes(urandom(256), "big")
-                g_b = pow(g, b, dh_prime).to_bytes(256, "big")
+                g_a = int.from_bytes(server_dh_inner_data.g_a, "big")
+                g_b, auth_key = await self.loop.run_in_executor(
+                    None, self.compute_dh_keys, g, g_a, dh_prime
+                )
 
                 retry_id = 0
 
@@ -219,8 +251,6 @@ class Auth:
                 # TODO: Handle "auth_key_aux_hash" if the previous step fails
 
                 # Step 7; Step 8
-                g_a = int.from_bytes(server_dh_inner_data.g_a, "big")
-                auth_key = pow(g_a, b, dh_prime).to_bytes(256, "big")
                 server_nonce = server_nonce.to_bytes(16, "little", signed=True)
 
                 # TODO: Handle errors
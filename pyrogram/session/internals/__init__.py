@@ -20,5 +20,7 @@
 from .data_center import DataCenter
 from .msg_factory import MsgFactory
 from .msg_id import MsgId
+from .msg_id_window import MsgIdWindow
+from .timer_wheel import TimerWheel
 
-__all__ = ["DataCenter", "MsgFactory", "MsgId"]
+__all__ = ["DataCenter", "MsgFactory", "MsgId", "MsgIdWindow", "TimerWheel"]
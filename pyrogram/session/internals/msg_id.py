@@ -26,9 +26,11 @@ log = logging.getLogger(__name__)
 class MsgId:
     last_time = 0
     offset = 0
+    server_time_offset = 0
 
     def __new__(cls) -> int:
-        now = int(time.time())
+        # Never go back in time, even when the server time offset is decreased
+        now = max(int(time.time() + cls.server_time_offset), cls.last_time)
         cls.offset = (cls.offset + 4) if now == cls.last_time else 0
         msg_id = (now * 2**32) + cls.offset
         cls.last_time = now
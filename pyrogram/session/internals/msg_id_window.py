@@ -0,0 +1,87 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+from collections import deque
+
+from pyrogram.errors import SecurityCheckMismatch
+
+
+class MsgIdWindow:
+    """Bounded replay-protection window for the msg_ids received in a session.
+
+    The last ``size`` msg_ids are kept in insertion order, with a set for O(1)
+    membership checks. Evicted msg_ids raise the floor under which any msg_id is
+    rejected. The server time offset is refreshed from every accepted msg_id.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+
+        self.msg_ids = deque()
+        self.msg_ids_set = set()
+        self.floor = 0
+
+        self.server_time_offset = 0.0
+
+    def __len__(self) -> int:
+        return len(self.msg_ids)
+
+    def __contains__(self, msg_id: int) -> bool:
+        return msg_id in self.msg_ids_set
+
+    def check(self, msg_id: int, time_offset: float = 0):
+        if not self.msg_ids:
+            return
+
+        if msg_id <= self.floor:
+            raise SecurityCheckMismatch("The msg_id is lower than all the stored values")
+
+        if msg_id in self.msg_ids_set:
+            raise SecurityCheckMismatch("The msg_id is equal to any of the stored values")
+
+        time_diff = msg_id / 2**32 - (time.time() + time_offset)
+
+        if time_diff > 30:
+            raise SecurityCheckMismatch(
+                "The msg_id belongs to over 30 seconds in the future. "
+                "Most likely the client time has to be synchronized."
+            )
+
+        if time_diff < -300:
+            raise SecurityCheckMismatch(
+                "The msg_id belongs to over 300 seconds in the past. "
+                "Most likely the client time has to be synchronized."
+            )
+
+    def add(self, msg_id: int):
+        if len(self.msg_ids) >= self.size:
+            evicted = self.msg_ids.popleft()
+            self.msg_ids_set.discard(evicted)
+            self.floor = max(self.floor, evicted)
+
+        self.msg_ids.append(msg_id)
+        self.msg_ids_set.add(msg_id)
+
+        self.server_time_offset = (msg_id >> 32) - time.time()
+
+    def clear(self):
+        self.msg_ids.clear()
+        self.msg_ids_set.clear()
+        self.floor = 0
@@ -0,0 +1,100 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import math
+from typing import Any, Callable, Dict, List
+
+
+class TimerWheel:
+    """Hashed timer wheel driving many coarse-grained timeouts with a single loop timer.
+
+    Timers fire on the first tick at or after their deadline, so the precision is
+    bound to ``resolution`` seconds.
+    """
+
+    def __init__(self, resolution: float = 0.5, slots: int = 128):
+        self.resolution = resolution
+        self.slots = slots
+
+        # Each slot maps a timer key to [remaining rounds, callback]
+        self.wheel = [{} for _ in range(slots)]  # type: List[Dict[Any, list]]
+        self.timers = {}  # type: Dict[Any, int]
+        self.position = 0
+
+        self.handle = None  # type: asyncio.TimerHandle
+        self.next_tick = 0.0
+
+        self.loop = asyncio.get_event_loop()
+
+    def __len__(self) -> int:
+        return len(self.timers)
+
+    def __contains__(self, key) -> bool:
+        return key in self.timers
+
+    def add(self, key, timeout: float, callback: Callable[[], Any]):
+        self.cancel(key)
+
+        if self.handle is None:
+            self.next_tick = self.loop.time() + self.resolution
+            self.handle = self.loop.call_at(self.next_tick, self.tick)
+
+        # The first tick may come earlier than a full resolution, hence the extra one
+        ticks = max(math.ceil(timeout / self.resolution), 0) + 1
+        slot = (self.position + ticks) % self.slots
+
+        self.wheel[slot][key] = [(ticks - 1) // self.slots, callback]
+        self.timers[key] = slot
+
+    def cancel(self, key):
+        slot = self.timers.pop(key, None)
+
+        if slot is not None:
+            del self.wheel[slot][key]
+
+    def tick(self):
+        self.position = (self.position + 1) % self.slots
+        expired = []
+
+        for key, timer in self.wheel[self.position].items():
+            if timer[0]:
+                timer[0] -= 1
+            else:
+                expired.append((key, timer[1]))
+
+        for key, callback in expired:
+            self.cancel(key)
+            callback()
+
+        if self.timers:
+            self.next_tick += self.resolution
+            self.handle = self.loop.call_at(self.next_tick, self.tick)
+        else:
+            self.handle = None
+
+    def clear(self):
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+
+        for slot in self.wheel:
+            slot.clear()
+
+        self.timers.clear()
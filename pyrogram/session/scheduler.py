@@ -0,0 +1,304 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import logging
+from contextvars import ContextVar
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from pyrogram import raw
+from pyrogram.errors import FloodWait, FloodPremiumWait
+from pyrogram.raw.core import TLObject
+
+log = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket handing out tokens to the waiters in priority order.
+
+    A ``rate`` of None means unlimited: the bucket then only blocks while paused.
+    """
+
+    MIN_RATE_FACTOR = 0.1
+    DECREASE_FACTOR = 0.8
+    INCREASE_FACTOR = 1.01
+
+    def __init__(self, rate: Optional[float], capacity: float = 1):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = self.capacity
+
+        self.loop = asyncio.get_event_loop()
+        self.updated = self.loop.time()
+        self.paused_until = 0.0
+
+        self.waiters = []  # type: List[Tuple[int, int, asyncio.Future]]
+        self.counter = itertools.count()
+        self.handle = None  # type: Optional[asyncio.TimerHandle]
+
+    @property
+    def is_idle(self) -> bool:
+        self.refill()
+        return (
+            not self.waiters
+            and self.loop.time() >= self.paused_until
+            and self.tokens >= self.capacity
+            and self.rate == self.base_rate
+        )
+
+    def refill(self):
+        now = self.loop.time()
+
+        if self.rate is not None:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+
+            # Slowly go back to the configured rate after a flood wait, as if a request was made every time a token
+            # was due, whether or not the bucket is used
+            recovered = now - max(self.updated, self.paused_until)
+
+            if self.rate < self.base_rate and recovered > 0:
+                self.rate = min(self.base_rate, self.rate * self.INCREASE_FACTOR ** (recovered * self.rate))
+
+        self.updated = now
+
+    def try_take(self) -> bool:
+        if self.loop.time() < self.paused_until:
+            return False
+
+        if self.rate is None:
+            return True
+
+        self.refill()
+
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+
+        return True
+
+    async def acquire(self, priority: int):
+        if not self.waiters and self.try_take():
+            return
+
+        future = self.loop.create_future()
+        heapq.heappush(self.waiters, (priority, next(self.counter), future))
+        self.schedule()
+
+        await future
+
+    def wake(self):
+        self.handle = None
+
+        while self.waiters:
+            future = self.waiters[0][2]
+
+            # Cancelled waiters are discarded lazily
+            if future.done():
+                heapq.heappop(self.waiters)
+                continue
+
+            if not self.try_take():
+                break
+
+            heapq.heappop(self.waiters)
+            future.set_result(None)
+
+        self.schedule()
+
+    def schedule(self):
+        if self.handle is not None or not self.waiters:
+            return
+
+        delay = self.paused_until - self.loop.time()
+
+        if self.rate is not None:
+            delay = max(delay, (1 - self.tokens) / self.rate)
+
+        self.handle = self.loop.call_later(max(delay, 0), self.wake)
+
+    def pause(self, seconds: float):
+        self.paused_until = max(self.paused_until, self.loop.time() + seconds)
+
+        if self.rate is not None:
+            self.tokens = 0
+            self.rate = max(
+                self.base_rate * self.MIN_RATE_FACTOR, self.rate * self.DECREASE_FACTOR
+            )
+
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+
+        self.schedule()
+
+
+class Scheduler:
+    """Client-side flood control in front of :meth:`~pyrogram.Client.invoke`.
+
+    Requests are grouped in method families, each with a global token bucket and,
+    optionally, one token bucket per peer. A ``FLOOD_WAIT`` pauses only the bucket
+    it belongs to and lowers its rate, which then slowly recovers. Requests waiting
+    for a token are served by priority: see :meth:`priority`.
+
+    Parameters:
+        limits (``dict``, *optional*):
+            Family name to ``(global rate, private chat rate, group rate)`` in requests per second,
+            overriding the :attr:`LIMITS` defaults. Use None for no limit.
+    """
+
+    INTERACTIVE = 0
+    DEFAULT = 1
+    BULK = 2
+
+    FAMILIES = {
+        raw.functions.messages.SendMessage: "send",
+        raw.functions.messages.SendMedia: "send",
+        raw.functions.messages.SendMultiMedia: "send",
+        raw.functions.messages.ForwardMessages: "send",
+        raw.functions.messages.SendInlineBotResult: "send",
+        raw.functions.messages.EditMessage: "edit",
+        raw.functions.messages.EditInlineBotMessage: "edit",
+        raw.functions.messages.DeleteMessages: "delete",
+        raw.functions.channels.DeleteMessages: "delete",
+    }
+
+    LIMITS = {
+        "send": (30, 1, 20 / 60),
+        "edit": (30, 1, 20 / 60),
+        "delete": (30, None, None),
+    }
+
+    MAX_PEER_BUCKETS = 10000
+
+    priority_var = ContextVar("priority", default=DEFAULT)
+
+    def __init__(self, limits: Dict[str, Tuple[Optional[float], ...]] = None):
+        self.limits = {**self.LIMITS, **(limits or {})}
+
+        self.buckets = {}  # type: Dict[Hashable, TokenBucket]
+
+    @classmethod
+    @contextlib.contextmanager
+    def priority(cls, priority: int):
+        """Set the priority of the requests made within this context.
+
+        Example:
+            .. code-block:: python
+
+                with Scheduler.priority(Scheduler.BULK):
+                    for user_id in user_ids:
+                        await app.send_message(user_id, "Hi")
+        """
+        token = cls.priority_var.set(priority)
+
+        try:
+            yield
+        finally:
+            cls.priority_var.reset(token)
+
+    @staticmethod
+    def unwrap(query: TLObject) -> TLObject:
+        while isinstance(
+            query, (raw.functions.InvokeWithoutUpdates, raw.functions.InvokeWithTakeout)
+        ):
+            query = query.query
+
+        return query
+
+    @staticmethod
+    def get_peer_key(peer) -> Optional[Tuple[str, int]]:
+        if isinstance(peer, (raw.types.InputPeerUser, raw.types.InputPeerUserFromMessage)):
+            return "user", peer.user_id
+
+        if isinstance(peer, raw.types.InputPeerChat):
+            return "group", peer.chat_id
+
+        if isinstance(peer, (raw.types.InputPeerChannel, raw.types.InputPeerChannelFromMessage)):
+            return "group", peer.channel_id
+
+        if isinstance(peer, raw.types.InputPeerSelf):
+            return "user", 0
+
+        return None
+
+    def get_bucket(self, key: Hashable, rate: Optional[float], capacity: float = 1) -> TokenBucket:
+        bucket = self.buckets.get(key)
+
+        if bucket is None:
+            if len(self.buckets) >= self.MAX_PEER_BUCKETS:
+                self.buckets = {k: b for k, b in self.buckets.items() if not b.is_idle}
+
+            bucket = self.buckets[key] = TokenBucket(rate, capacity)
+
+        return bucket
+
+    def get_buckets(self, query: TLObject) -> List[TokenBucket]:
+        query = self.unwrap(query)
+
+        family = self.FAMILIES.get(type(query), query.QUALNAME)
+        global_rate, user_rate, group_rate = (tuple(self.limits.get(family, ())) + (None,) * 3)[:3]
+
+        # Global buckets allow bursts of one second worth of requests
+        buckets = [self.get_bucket((family,), global_rate, global_rate or 1)]
+        peer_key = self.get_peer_key(getattr(query, "peer", None) or getattr(query, "to_peer", None))
+
+        if peer_key is not None:
+            rate = user_rate if peer_key[0] == "user" else group_rate
+
+            if rate is not None:
+                # The most specific bucket comes first: it's the one paused by flood waits
+                buckets.insert(0, self.get_bucket((family, *peer_key), rate))
+
+        return buckets
+
+    async def invoke(
+        self,
+        session,
+        query: TLObject,
+        retries: int,
+        timeout: float,
+        sleep_threshold: float,
+    ):
+        buckets = self.get_buckets(query)
+        priority = self.priority_var.get()
+
+        while True:
+            for bucket in buckets:
+                await bucket.acquire(priority)
+
+            try:
+                # Flood waits are handled here, so that only this bucket waits
+                return await session.invoke(query, retries, timeout, 0)
+            except (FloodWait, FloodPremiumWait) as e:
+                amount = e.value
+                buckets[0].pause(amount)
+
+                if amount > sleep_threshold >= 0:
+                    raise
+
+                log.warning(
+                    'Waiting for %s seconds before continuing (required by "%s")',
+                    amount,
+                    ".".join(self.unwrap(query).QUALNAME.split(".")[1:]),
+                )
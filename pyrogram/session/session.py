@@ -18,9 +18,10 @@
 #  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
 
 import asyncio
-import bisect
+import gzip
 import logging
 import os
+import time
 from hashlib import sha1
 from io import BytesIO
 from typing import Optional
@@ -41,16 +42,20 @@ from pyrogram.errors import (
     Unauthorized,
 )
 from pyrogram.raw.all import layer
-from pyrogram.raw.core import TLObject, MsgContainer, Int, FutureSalts
-from .internals import MsgId, MsgFactory
+from pyrogram.raw.core import TLObject, Message, MsgContainer, Int, FutureSalts, GzipPacked
+from .internals import MsgId, MsgFactory, MsgIdWindow, TimerWheel
 
 log = logging.getLogger(__name__)
 
 
 class Result:
-    def __init__(self):
-        self.value = None
-        self.event = asyncio.Event()
+    """An in-flight request, indexed by the msg_id of its latest message."""
+
+    __slots__ = ("message", "future")
+
+    def __init__(self, message: Message):
+        self.message = message
+        self.future = asyncio.get_event_loop().create_future()
 
 
 class Session:
@@ -61,6 +66,12 @@ class Session:
     ACKS_THRESHOLD = 10
     PING_INTERVAL = 5
     STORED_MSG_IDS_MAX_SIZE = 500
+    GZIP_THRESHOLD = 1024
+    GZIP_MAX_RATIO = 0.9
+    GZIP_SKIP = (
+        raw.functions.upload.SaveFilePart,
+        raw.functions.upload.SaveBigFilePart,
+    )
 
     TRANSPORT_ERRORS = {
         404: "auth key not found",
@@ -76,6 +87,7 @@ class Session:
         test_mode: bool,
         is_media: bool = False,
         is_cdn: bool = False,
+        no_updates: bool = False,
     ):
         self.client = client
         self.dc_id = dc_id
@@ -83,6 +95,13 @@ class Session:
         self.test_mode = test_mode
         self.is_media = is_media
         self.is_cdn = is_cdn
+        self.no_updates = no_updates
+        self.compress_requests = (
+            getattr(client, "compress_requests", False) and not is_media
+        )
+
+        self.metrics = client.metrics
+        self.label = f"{dc_id}:cdn" if is_cdn else f"{dc_id}:media" if is_media else str(dc_id)
 
         self.connection: Optional[Connection] = None
 
@@ -96,8 +115,9 @@ class Session:
         self.pending_acks = set()
 
         self.results = {}
+        self.timers = TimerWheel()
 
-        self.stored_msg_ids = []
+        self.stored_msg_ids = MsgIdWindow(self.STORED_MSG_IDS_MAX_SIZE)
 
         self.ping_task = None
         self.ping_task_event = asyncio.Event()
@@ -105,10 +125,14 @@ class Session:
         self.recv_task = None
 
         self.is_started = asyncio.Event()
+        # Set by a final stop, after which requests fail instead of waiting for the session to start again
+        self.is_stopped = False
 
         self.loop = asyncio.get_event_loop()
 
     async def start(self):
+        self.is_stopped = False
+
         while True:
             self.connection = self.client.connection_factory(
                 dc_id=self.dc_id,
@@ -130,23 +154,26 @@ class Session:
                 )
 
                 if not self.is_cdn:
-                    await self.send(
-                        raw.functions.InvokeWithLayer(
-                            layer=layer,
-                            query=raw.functions.InitConnection(
-                                api_id=await self.client.storage.api_id(),
-                                app_version=self.client.app_version,
-                                device_model=self.client.device_model,
-                                system_version=self.client.system_version,
-                                system_lang_code=self.client.lang_code,
-                                lang_code=self.client.lang_code,
-                                lang_pack="",
-                                query=raw.functions.help.GetConfig(),
-                            ),
+                    query = raw.functions.InvokeWithLayer(
+                        layer=layer,
+                        query=raw.functions.InitConnection(
+                            api_id=await self.client.storage.api_id(),
+                            app_version=self.client.app_version,
+                            device_model=self.client.device_model,
+                            system_version=self.client.system_version,
+                            system_lang_code=self.client.lang_code,
+                            lang_code=self.client.lang_code,
+                            lang_pack="",
+                            query=raw.functions.help.GetConfig(),
                         ),
-                        timeout=self.START_TIMEOUT,
                     )
 
+                    # The first query decides whether the server subscribes the session to updates
+                    if self.no_updates:
+                        query = raw.functions.InvokeWithoutUpdates(query=query)
+
+                    await self.send(query, timeout=self.START_TIMEOUT)
+
                 self.ping_task = self.loop.create_task(self.ping_worker())
 
                 log.info("Session initialized: Layer %s", layer)
@@ -160,7 +187,7 @@ class Session:
                 await self.stop()
                 raise e
             except (OSError, RPCError):
-                await self.stop()
+                await self.stop(restart=True)
             except Exception as e:
                 await self.stop()
                 raise e
@@ -171,8 +198,9 @@ class Session:
 
         log.info("Session started")
 
-    async def stop(self):
+    async def stop(self, restart: bool = False):
         self.is_started.clear()
+        self.is_stopped = not restart
 
         self.stored_msg_ids.clear()
 
@@ -188,7 +216,16 @@ class Session:
         if self.recv_task:
             await self.recv_task
 
-        if not self.is_media and callable(self.client.disconnect_handler):
+        # Pending requests survive a restart and are sent again on the new connection
+        if not restart:
+            for result in self.results.values():
+                if not result.future.done():
+                    result.future.set_exception(ConnectionError("Session stopped"))
+
+        if (
+            not (self.is_media or self.no_updates)
+            and callable(self.client.disconnect_handler)
+        ):
             try:
                 await self.client.disconnect_handler(self.client)
             except Exception as e:
@@ -197,9 +234,25 @@ class Session:
         log.info("Session stopped")
 
     async def restart(self):
-        await self.stop()
+        self.metrics.increment("reconnects", self.label)
+
+        pending = list(self.results.values())
+
+        await self.stop(restart=True)
         await self.start()
 
+        # Same session, same msg_ids: the server answers requests it has already
+        # processed instead of executing them twice.
+        for result in pending:
+            if self.results.get(result.message.msg_id) is result:
+                try:
+                    await self.send_message(result.message)
+                except OSError:
+                    break
+
+        if pending:
+            log.info("Resent %s pending requests", len(pending))
+
     async def handle_packet(self, packet):
         try:
             data = await self.loop.run_in_executor(
@@ -227,39 +280,13 @@ class Session:
                     self.pending_acks.add(msg.msg_id)
 
             try:
-                if len(self.stored_msg_ids) > Session.STORED_MSG_IDS_MAX_SIZE:
-                    del self.stored_msg_ids[: Session.STORED_MSG_IDS_MAX_SIZE // 2]
-
-                if self.stored_msg_ids:
-                    if msg.msg_id < self.stored_msg_ids[0]:
-                        raise SecurityCheckMismatch(
-                            "The msg_id is lower than all the stored values"
-                        )
-
-                    if msg.msg_id in self.stored_msg_ids:
-                        raise SecurityCheckMismatch(
-                            "The msg_id is equal to any of the stored values"
-                        )
-
-                    time_diff = (msg.msg_id - MsgId()) / 2**32
-
-                    if time_diff > 30:
-                        raise SecurityCheckMismatch(
-                            "The msg_id belongs to over 30 seconds in the future. "
-                            "Most likely the client time has to be synchronized."
-                        )
-
-                    if time_diff < -300:
-                        raise SecurityCheckMismatch(
-                            "The msg_id belongs to over 300 seconds in the past. "
-                            "Most likely the client time has to be synchronized."
-                        )
+                self.stored_msg_ids.check(msg.msg_id, MsgId.server_time_offset)
             except SecurityCheckMismatch as e:
                 log.info("Discarding packet: %s", e)
                 await self.connection.close()
                 return
             else:
-                bisect.insort(self.stored_msg_ids, msg.msg_id)
+                self.stored_msg_ids.add(msg.msg_id)
 
             if isinstance(
                 msg.body, (raw.types.MsgDetailedInfo, raw.types.MsgNewDetailedInfo)
@@ -281,12 +308,14 @@ class Session:
             elif isinstance(msg.body, raw.types.Pong):
                 msg_id = msg.body.msg_id
             else:
-                if self.client is not None:
+                # Updates reaching a session that opted out would be delivered twice
+                if self.client is not None and not self.no_updates:
                     self.loop.create_task(self.client.handle_updates(msg.body))
 
-            if msg_id in self.results:
-                self.results[msg_id].value = getattr(msg.body, "result", msg.body)
-                self.results[msg_id].event.set()
+            result = self.results.get(msg_id)
+
+            if result is not None and not result.future.done():
+                result.future.set_result(getattr(msg.body, "result", msg.body))
 
         if len(self.pending_acks) >= self.ACKS_THRESHOLD:
             log.debug("Sending %s acks", len(self.pending_acks))
@@ -353,23 +382,12 @@ class Session:
 
                 break
 
+            self.metrics.increment("bytes_received", self.label, len(packet))
             self.loop.create_task(self.handle_packet(packet))
 
         log.info("NetworkTask stopped")
 
-    async def send(
-        self,
-        data: TLObject,
-        wait_response: bool = True,
-        timeout: float = WAIT_TIMEOUT,
-        retry: int = 0,
-    ):
-        message = self.msg_factory(data)
-        msg_id = message.msg_id
-
-        if wait_response:
-            self.results[msg_id] = Result()
-
+    async def send_message(self, message: Message):
         log.debug("Sent: %s", message)
 
         payload = await self.loop.run_in_executor(
@@ -382,58 +400,102 @@ class Session:
             self.auth_key_id,
         )
 
-        try:
-            await self.connection.send(payload)
-        except OSError as e:
-            self.results.pop(msg_id, None)
-            raise e
+        await self.connection.send(payload)
+        self.metrics.increment("bytes_sent", self.label, len(payload))
 
-        if wait_response:
-            try:
-                await asyncio.wait_for(self.results[msg_id].event.wait(), timeout)
-            except asyncio.TimeoutError:
-                pass
+    async def send(
+        self,
+        data: TLObject,
+        wait_response: bool = True,
+        timeout: float = WAIT_TIMEOUT,
+        retry: int = 0,
+    ):
+        if not wait_response:
+            return await self.send_message(self.msg_factory(data))
 
-            result = self.results.pop(msg_id).value
+        body = data
 
-            if result is None:
-                raise TimeoutError("Request timed out")
+        if self.compress_requests and not isinstance(data, self.GZIP_SKIP):
+            body = await self.compress(data)
 
-            if isinstance(result, raw.types.RpcError):
-                if isinstance(
-                    data,
-                    (
-                        raw.functions.InvokeWithoutUpdates,
-                        raw.functions.InvokeWithTakeout,
-                    ),
-                ):
-                    data = data.query
+        result = Result(self.msg_factory(body))
+        self.results[result.message.msg_id] = result
+        self.timers.add(result, timeout, lambda: self._set_timed_out(result))
+        self.metrics.increment("rpc_in_flight", self.label)
 
-                RPCError.raise_it(result, type(data))
+        try:
+            while True:
+                await self.send_message(result.message)
+
+                value = await result.future
+
+                if isinstance(value, raw.types.RpcError):
+                    while isinstance(
+                        data,
+                        (
+                            raw.functions.InvokeWithoutUpdates,
+                            raw.functions.InvokeWithTakeout,
+                        ),
+                    ):
+                        data = data.query
 
-            if isinstance(result, raw.types.BadMsgNotification):
-                if retry > 1:
-                    raise BadMsgNotification(result.error_code)
+                    RPCError.raise_it(value, type(data))
+
+                if isinstance(value, raw.types.BadMsgNotification):
+                    if retry > 1:
+                        raise BadMsgNotification(value.error_code)
+
+                    retry += 1
+                    self._handle_bad_notification()
+                elif isinstance(value, raw.types.BadServerSalt):
+                    self.salt = value.new_server_salt
+                else:
+                    return value
+
+                # Send the request again as a new message, within the same timeout
+                del self.results[result.message.msg_id]
+                result.message = self.msg_factory(body)
+                result.future = self.loop.create_future()
+                self.results[result.message.msg_id] = result
+        finally:
+            self.timers.cancel(result)
+            self.results.pop(result.message.msg_id, None)
+            self.metrics.increment("rpc_in_flight", self.label, -1)
+
+    async def compress(self, data: TLObject) -> TLObject:
+        serialized = data.write()
+
+        if len(serialized) < self.GZIP_THRESHOLD:
+            return data
+
+        compressed = await self.loop.run_in_executor(
+            pyrogram.crypto_executor, gzip.compress, serialized, 6
+        )
 
-                self._handle_bad_notification()
-                await self.send(data, wait_response, timeout, retry + 1)
+        # Already compressed payloads (e.g. media) would only grow
+        if len(compressed) > len(serialized) * self.GZIP_MAX_RATIO:
+            return data
 
-            if isinstance(result, raw.types.BadServerSalt):
-                self.salt = result.new_server_salt
-                return await self.send(data, wait_response, timeout)
+        return GzipPacked(data, compressed)
 
-            return result
+    @staticmethod
+    def _set_timed_out(result: Result):
+        if not result.future.done():
+            result.future.set_exception(TimeoutError("Request timed out"))
 
     def _handle_bad_notification(self):
-        new_msg_id = MsgId()
-        if self.stored_msg_ids[len(self.stored_msg_ids) - 1] >= new_msg_id:
-            new_msg_id = self.stored_msg_ids[len(self.stored_msg_ids) - 1] + 4
+        # The msg_id was too low or too high: sync our msg_ids with the server time,
+        # as seen in the msg_ids it sent to us.
+        server_time_offset = round(self.stored_msg_ids.server_time_offset)
+
+        if server_time_offset != MsgId.server_time_offset:
             log.debug(
-                "Changing msg_id old=%s new=%s",
-                self.stored_msg_ids[len(self.stored_msg_ids) - 1],
-                new_msg_id,
+                "Changing server time offset old=%s new=%s",
+                MsgId.server_time_offset,
+                server_time_offset,
             )
-        self.stored_msg_ids[len(self.stored_msg_ids) - 1] = new_msg_id
+
+            MsgId.server_time_offset = server_time_offset
 
     async def invoke(
         self,
@@ -447,21 +509,35 @@ class Session:
         except asyncio.TimeoutError:
             pass
 
-        if isinstance(
-            query, (raw.functions.InvokeWithoutUpdates, raw.functions.InvokeWithTakeout)
+        if self.no_updates and not isinstance(query, raw.functions.InvokeWithoutUpdates):
+            query = raw.functions.InvokeWithoutUpdates(query=query)
+
+        inner_query = query
+
+        while isinstance(
+            inner_query,
+            (raw.functions.InvokeWithoutUpdates, raw.functions.InvokeWithTakeout),
         ):
-            inner_query = query.query
-        else:
-            inner_query = query
+            inner_query = inner_query.query
 
         query_name = ".".join(inner_query.QUALNAME.split(".")[1:])
 
         while True:
+            start = time.perf_counter()
+
             try:
-                return await self.send(query, timeout=timeout)
+                try:
+                    return await self.send(query, timeout=timeout)
+                finally:
+                    self.metrics.observe(
+                        "rpc_latency", time.perf_counter() - start, query_name
+                    )
             except (FloodWait, FloodPremiumWait) as e:
                 amount = e.value
 
+                self.metrics.increment("flood_waits", query_name)
+                self.metrics.observe("flood_wait_seconds", amount, query_name)
+
                 if amount > sleep_threshold >= 0:
                     raise
 
@@ -474,7 +550,7 @@ class Session:
 
                 await asyncio.sleep(amount)
             except (OSError, InternalServerError, ServiceUnavailable) as e:
-                if retries == 0:
+                if retries == 0 or self.is_stopped:
                     raise e from None
 
                 (log.warning if retries < 2 else log.info)(
@@ -0,0 +1,118 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-present Dan <https://github.com/delivrance>
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import logging
+
+import pyrogram
+from pyrogram import raw
+from pyrogram.raw.core import TLObject
+from .session import Session
+
+log = logging.getLogger(__name__)
+
+
+class SessionPool:
+    """A group of sessions to the same DC, sharing one auth key, with separate session ids.
+
+    The first session is the only one subscribed to updates. Requests go to the
+    session with the fewest requests in flight, so that a slow or large response
+    doesn't hold back the others. With ``priority_lane``, one extra session is
+    reserved to the small interactive requests listed in :attr:`INTERACTIVE`.
+    """
+
+    INTERACTIVE = (
+        raw.functions.messages.SendMessage,
+        raw.functions.messages.EditMessage,
+        raw.functions.messages.DeleteMessages,
+        raw.functions.messages.ForwardMessages,
+        raw.functions.messages.SendReaction,
+        raw.functions.messages.SetTyping,
+        raw.functions.messages.SetBotCallbackAnswer,
+        raw.functions.messages.SetInlineBotResults,
+        raw.functions.messages.ReadHistory,
+        raw.functions.channels.DeleteMessages,
+        raw.functions.channels.ReadHistory,
+    )
+
+    def __init__(
+        self,
+        client: "pyrogram.Client",
+        dc_id: int,
+        auth_key: bytes,
+        test_mode: bool,
+        connections: int = 1,
+        priority_lane: bool = False,
+    ):
+        self.sessions = [
+            Session(client, dc_id, auth_key, test_mode, no_updates=i > 0)
+            for i in range(max(connections, 1))
+        ]
+
+        self.priority_session = (
+            Session(client, dc_id, auth_key, test_mode, no_updates=True)
+            if priority_lane
+            else None
+        )
+
+    @property
+    def all_sessions(self):
+        if self.priority_session is None:
+            return self.sessions
+
+        return self.sessions + [self.priority_session]
+
+    async def start(self):
+        # The main session first: it's the one creating the connection and receiving updates
+        await self.sessions[0].start()
+        await asyncio.gather(*(session.start() for session in self.all_sessions[1:]))
+
+    async def stop(self):
+        for session in reversed(self.all_sessions):
+            await session.stop()
+
+    def get_session(self, query: TLObject) -> Session:
+        if self.priority_session is not None:
+            inner_query = query
+
+            while isinstance(
+                inner_query,
+                (raw.functions.InvokeWithoutUpdates, raw.functions.InvokeWithTakeout),
+            ):
+                inner_query = inner_query.query
+
+            if isinstance(inner_query, self.INTERACTIVE):
+                return self.priority_session
+
+        if len(self.sessions) == 1:
+            return self.sessions[0]
+
+        # Ties go to the main session, which is the only one with updates
+        return min(self.sessions, key=lambda session: len(session.results))
+
+    async def invoke(
+        self,
+        query: TLObject,
+        retries: int = Session.MAX_RETRIES,
+        timeout: float = Session.WAIT_TIMEOUT,
+        sleep_threshold: float = Session.SLEEP_THRESHOLD,
+    ):
+        return await self.get_session(query).invoke(
+            query, retries, timeout, sleep_threshold
+        )
@@ -22,7 +22,7 @@ import os
 import sqlite3
 from pathlib import Path
 
-from .sqlite_storage import SQLiteStorage
+from .sqlite_storage import SQLiteStorage, DC_AUTH_KEYS_SCHEMA
 
 log = logging.getLogger(__name__)
 
@@ -68,6 +68,12 @@ class FileStorage(SQLiteStorage):
 
             version += 1
 
+        if version == 4:
+            with self.conn:
+                self.conn.executescript(DC_AUTH_KEYS_SCHEMA)
+
+            version += 1
+
         self.version(version)
 
     async def open(self):
@@ -20,7 +20,9 @@
 import asyncio
 import inspect
 import time
-from typing import List, Tuple, Any
+from typing import Any, Dict, List, Tuple
+
+from pyrogram import raw
 
 from .dummy_client import DummyMongoClient
 from pymongo import MongoClient, UpdateOne, DeleteMany
@@ -79,6 +81,7 @@ class MongoStorage(Storage):
         self._session = database["session"]
         self._usernames = database["usernames"]
         self._states = database["update_state"]
+        self._dc_auth_keys = database["dc_auth_keys"]
         self._remove_peers = remove_peers
 
     async def open(self):
@@ -116,6 +119,7 @@ class MongoStorage(Storage):
     async def delete(self):
         try:
             await self._session.delete_one({"_id": 0})
+            await self._dc_auth_keys.delete_many({})
             if self._remove_peers:
                 await self._peer.remove({})
         except Exception as _:
@@ -196,6 +200,16 @@ class MongoStorage(Storage):
             raise KeyError(f"ID not found: {peer_id}")
         return get_input_peer(r["_id"], r["access_hash"], r["type"])
 
+    async def get_peers_by_ids(self, peer_ids: List[int]) -> Dict[int, "raw.base.InputPeer"]:
+        peers = {}
+
+        async for r in self._peer.find(
+            {"_id": {"$in": list(peer_ids)}}, {"_id": 1, "access_hash": 1, "type": 1}
+        ):
+            peers[r["_id"]] = get_input_peer(r["_id"], r["access_hash"], r["type"])
+
+        return peers
+
     async def get_peer_by_username(self, username: str):
         # id, access_hash, type, last_update_on,
         r = await self._peer.find_one(
@@ -235,6 +249,18 @@ class MongoStorage(Storage):
 
         return get_input_peer(r["_id"], r["access_hash"], r["type"])
 
+    async def dc_auth_key(self, dc_id: int, value: bytes = object):
+        if value == object:
+            d = await self._dc_auth_keys.find_one({"_id": dc_id}, {"auth_key": 1})
+            return d["auth_key"] if d else None
+
+        if value is None:
+            await self._dc_auth_keys.delete_one({"_id": dc_id})
+        else:
+            await self._dc_auth_keys.update_one(
+                {"_id": dc_id}, {"$set": {"auth_key": value}}, upsert=True
+            )
+
     async def _get(self):
         attr = inspect.stack()[2].function
         d = await self._session.find_one({"_id": 0}, {attr: 1})
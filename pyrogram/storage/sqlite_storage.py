@@ -20,7 +20,7 @@
 import inspect
 import sqlite3
 import time
-from typing import List, Tuple, Any
+from typing import Any, Dict, List, Tuple
 
 from pyrogram import raw
 from .storage import Storage
@@ -97,6 +97,15 @@ END;
 """
 
 
+DC_AUTH_KEYS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dc_auth_keys
+(
+    dc_id    INTEGER PRIMARY KEY,
+    auth_key BLOB
+);
+"""
+
+
 def get_input_peer(peer_id: int, access_hash: int, peer_type: str):
     if peer_type in ["user", "bot"]:
         return raw.types.InputPeerUser(user_id=peer_id, access_hash=access_hash)
@@ -113,7 +122,7 @@ def get_input_peer(peer_id: int, access_hash: int, peer_type: str):
 
 
 class SQLiteStorage(Storage):
-    VERSION = 4
+    VERSION = 5
     USERNAME_TTL = 8 * 60 * 60
 
     def __init__(self, name: str):
@@ -125,6 +134,7 @@ class SQLiteStorage(Storage):
         with self.conn:
             self.conn.executescript(SCHEMA)
             self.conn.executescript(UNAME_SCHEMA)
+            self.conn.executescript(DC_AUTH_KEYS_SCHEMA)
 
             self.conn.execute("INSERT INTO version VALUES (?)", (self.VERSION,))
 
@@ -190,6 +200,21 @@ class SQLiteStorage(Storage):
 
         return get_input_peer(*r)
 
+    async def get_peers_by_ids(self, peer_ids: List[int]) -> Dict[int, "raw.base.InputPeer"]:
+        peers = {}
+
+        # Stay below the default limit of host parameters in a query
+        for i in range(0, len(peer_ids), 500):
+            chunk = peer_ids[i : i + 500]
+
+            for r in self.conn.execute(
+                f"SELECT id, access_hash, type FROM peers WHERE id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            ):
+                peers[r[0]] = get_input_peer(*r)
+
+        return peers
+
     async def get_peer_by_username(self, username: str):
         r = self.conn.execute(
             "SELECT id, access_hash, type, last_update_on FROM peers WHERE username = ?"
@@ -231,6 +256,23 @@ class SQLiteStorage(Storage):
 
         return get_input_peer(*r)
 
+    async def dc_auth_key(self, dc_id: int, value: bytes = object):
+        if value == object:
+            r = self.conn.execute(
+                "SELECT auth_key FROM dc_auth_keys WHERE dc_id = ?", (dc_id,)
+            ).fetchone()
+
+            return r[0] if r else None
+
+        with self.conn:
+            if value is None:
+                self.conn.execute("DELETE FROM dc_auth_keys WHERE dc_id = ?", (dc_id,))
+            else:
+                self.conn.execute(
+                    "REPLACE INTO dc_auth_keys (dc_id, auth_key) VALUES (?, ?)",
+                    (dc_id, value),
+                )
+
     def _get(self):
         attr = inspect.stack()[2].function
 
@@ -20,7 +20,9 @@
 import base64
 import struct
 from abc import abstractmethod
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+
+from pyrogram import raw
 
 
 class Storage:
@@ -70,12 +72,35 @@ class Storage:
     async def get_peer_by_id(self, peer_id: int):
         raise NotImplementedError
 
+    async def get_peers_by_ids(self, peer_ids: List[int]) -> Dict[int, "raw.base.InputPeer"]:
+        """Get the known peers among the given ids, mapped by id.
+
+        Storages should override this to fetch all the peers with a single query.
+        """
+        peers = {}
+
+        for peer_id in peer_ids:
+            try:
+                peers[peer_id] = await self.get_peer_by_id(peer_id)
+            except KeyError:
+                pass
+
+        return peers
+
     async def get_peer_by_username(self, username: str):
         raise NotImplementedError
 
     async def get_peer_by_phone_number(self, phone_number: str):
         raise NotImplementedError
 
+    async def dc_auth_key(self, dc_id: int, value: bytes = object):
+        """Get, set or delete (with ``None``) the auth key used for a foreign DC.
+
+        Storages that don't override this method don't persist foreign DC keys,
+        and a new key is generated every time a session to that DC is opened.
+        """
+        return None
+
     async def dc_id(self, value: int = object):
         raise NotImplementedError
 
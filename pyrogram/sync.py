@@ -21,36 +21,134 @@ import asyncio
 import functools
 import inspect
 import threading
+from queue import SimpleQueue
 
 from pyrogram import types
 from pyrogram.methods import Methods
 from pyrogram.methods.utilities import idle as idle_module, compose as compose_module
 
+# Items handed over at once from an async generator to the sync code iterating it
+BATCH_SIZE = 100
 
-def async_to_sync(obj, name):
-    function = getattr(obj, name)
-    main_loop = asyncio.get_event_loop()
+# Batches the event loop can produce ahead of a thread iterating an async generator
+MAX_BATCHES = 4
+
+main_loop = asyncio.get_event_loop()
+
+
+class AsyncGenBatcher:
+    """Pull the items of an async generator in batches, without waiting for one while items are at hand."""
+
+    def __init__(self, agen):
+        self.agen = agen
+        self.step = None
+        self.done = False
+
+    async def next_batch(self, size: int) -> list:
+        batch = []
+
+        while len(batch) < size:
+            if self.step is None:
+                self.step = asyncio.ensure_future(self.agen.__anext__())
+
+                # Let the step run up to its first suspension, it's done already if the item was at hand
+                if batch:
+                    await asyncio.sleep(0)
+
+            # The generator has to wait for the next item: hand over those we have first
+            if batch and not self.step.done():
+                break
 
-    def async_to_sync_gen(agen, loop, is_main_thread):
-        async def anext(agen):
             try:
-                return await agen.__anext__(), False
+                batch.append(await self.step)
             except StopAsyncIteration:
-                return None, True
+                self.step = None
+                self.done = True
+                break
+            except Exception:
+                # The failed step is kept, awaiting it again raises for the next batch
+                if batch:
+                    break
 
-        while True:
-            if is_main_thread:
-                item, done = loop.run_until_complete(anext(agen))
+                self.step = None
+                raise
             else:
-                item, done = asyncio.run_coroutine_threadsafe(
-                    anext(agen), loop
-                ).result()
+                self.step = None
 
-            if done:
-                break
+        return batch
+
+    async def aclose(self):
+        if self.step is not None:
+            self.step.cancel()
+
+            # The generator can't be closed while the step is still running it
+            try:
+                await self.step
+            except (asyncio.CancelledError, Exception):
+                pass
+
+            self.step = None
+
+        await self.agen.aclose()
+
+
+class AsyncGenProducer:
+    """Run an async generator on the event loop, ahead of the thread consuming its items."""
+
+    def __init__(self, agen):
+        self.batcher = AsyncGenBatcher(agen)
+        self.queue = SimpleQueue()
+        self.slots = None
+
+    async def run(self):
+        # Bounds the batches produced but not taken yet
+        self.slots = asyncio.Semaphore(MAX_BATCHES)
+
+        try:
+            while not self.batcher.done:
+                await self.slots.acquire()
+                self.queue.put((await self.batcher.next_batch(BATCH_SIZE), None))
+        except Exception as e:
+            self.queue.put(([], e))
+        else:
+            self.queue.put(([], StopAsyncIteration()))
+        finally:
+            await self.batcher.aclose()
 
-            yield item
 
+def async_to_sync_gen(agen, loop, is_main_thread):
+    if is_main_thread:
+        batcher = AsyncGenBatcher(agen)
+
+        try:
+            while not batcher.done:
+                yield from loop.run_until_complete(batcher.next_batch(BATCH_SIZE))
+        finally:
+            if not loop.is_running() and not loop.is_closed():
+                loop.run_until_complete(batcher.aclose())
+    else:
+        producer = AsyncGenProducer(agen)
+        future = asyncio.run_coroutine_threadsafe(producer.run(), loop)
+
+        try:
+            while True:
+                batch, error = producer.queue.get()
+
+                if error is None:
+                    loop.call_soon_threadsafe(producer.slots.release)
+
+                yield from batch
+
+                if isinstance(error, StopAsyncIteration):
+                    break
+
+                if error is not None:
+                    raise error
+        finally:
+            future.cancel()
+
+
+def sync_wrapper(function):
     @functools.wraps(function)
     def async_to_sync_wrap(*args, **kwargs):
         coroutine = function(*args, **kwargs)
@@ -94,19 +192,49 @@ def async_to_sync(obj, name):
                 else:
                     return async_to_sync_gen(coroutine, main_loop, False)
 
-    setattr(obj, name, async_to_sync_wrap)
+    return async_to_sync_wrap
+
+
+def async_to_sync(obj, name):
+    setattr(obj, name, sync_wrapper(getattr(obj, name)))
+
+
+class SyncMethod:
+    """Stand-in for an async method, replaced by its sync-compatible wrapper when first looked up."""
+
+    __slots__ = ("owner", "name", "function")
+
+    def __init__(self, owner, name, function):
+        self.owner = owner
+        self.name = name
+        self.function = function
+
+    def __get__(self, obj, objtype=None):
+        wrapper = sync_wrapper(self.function)
+        setattr(self.owner, self.name, wrapper)
+
+        return wrapper.__get__(obj, objtype)
+
+
+ASYNC_FLAGS = inspect.CO_COROUTINE | inspect.CO_ASYNC_GENERATOR
 
 
 def wrap(source):
-    for name in dir(source):
-        method = getattr(source, name)
+    """Make the public async methods of a class and of its bases usable from sync code, when first looked up."""
+    for klass in source.__mro__:
+        if klass in wrapped or klass is object:
+            continue
+
+        wrapped.add(klass)
+
+        for name, method in list(vars(klass).items()):
+            code = getattr(method, "__code__", None)
+
+            if code is not None and code.co_flags & ASYNC_FLAGS and not name.startswith("_"):
+                setattr(klass, name, SyncMethod(klass, name, method))
 
-        if not name.startswith("_"):
-            if inspect.iscoroutinefunction(method) or inspect.isasyncgenfunction(
-                method
-            ):
-                async_to_sync(source, name)
 
+wrapped = set()
 
 # Wrap all Client's relevant methods
 wrap(Methods)
@@ -23,6 +23,7 @@ from .audio import Audio
 from .available_effect import AvailableEffect
 from .chat_theme import ChatTheme
 from .chat_wallpaper import ChatWallpaper
+from .compact_message import CompactMessage
 from .contact import Contact
 from .contact_registered import ContactRegistered
 from .dice import Dice
@@ -32,6 +33,8 @@ from .game import Game
 from .giveaway import Giveaway
 from .giveaway_launched import GiveawayLaunched
 from .giveaway_result import GiveawayResult
+from .broadcast_result import BroadcastResult
+from .text_template import TextTemplate
 from .location import Location
 from .media_area import MediaArea
 from .media_area_channel_post import MediaAreaChannelPost
@@ -95,12 +98,15 @@ __all__ = [
     "Giveaway",
     "GiveawayLaunched",
     "GiveawayResult",
+    "BroadcastResult",
+    "TextTemplate",
     "Location",
     "MediaArea",
     "MediaAreaChannelPost",
     "MediaAreaCoordinates",
     "Message",
     "MessageEntity",
+    "CompactMessage",
     "MessageOrigin",
     "MessageOriginChannel",
     "MessageOriginChat",
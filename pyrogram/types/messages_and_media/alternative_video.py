@@ -69,6 +69,23 @@ class AlternativeVideo(Object):
 
     """
 
+    _file_id_attributes = ("file_id", "file_unique_id")
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "width",
+        "height",
+        "codec",
+        "duration",
+        "file_name",
+        "mime_type",
+        "file_size",
+        "supports_streaming",
+        "date",
+        "thumbs",
+    )
+
     def __init__(
         self,
         *,
@@ -116,14 +133,14 @@ class AlternativeVideo(Object):
                     media_id=video.id,
                     access_hash=video.access_hash,
                     file_reference=video.file_reference,
-                ).encode()
+                )
                 if video
                 else None
             ),
             file_unique_id=(
                 FileUniqueId(
                     file_unique_type=FileUniqueType.DOCUMENT, media_id=video.id
-                ).encode()
+                )
                 if video
                 else None
             ),
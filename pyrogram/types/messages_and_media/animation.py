@@ -69,6 +69,21 @@ class Animation(Object):
             Animation thumbnails.
     """
 
+    _file_id_attributes = ("file_id", "file_unique_id")
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "file_name",
+        "mime_type",
+        "file_size",
+        "date",
+        "width",
+        "height",
+        "duration",
+        "thumbs",
+    )
+
     def __init__(
         self,
         *,
@@ -111,10 +126,10 @@ class Animation(Object):
                 media_id=animation.id,
                 access_hash=animation.access_hash,
                 file_reference=animation.file_reference,
-            ).encode(),
+            ),
             file_unique_id=FileUniqueId(
                 file_unique_type=FileUniqueType.DOCUMENT, media_id=animation.id
-            ).encode(),
+            ),
             width=getattr(video_attributes, "w", 0),
             height=getattr(video_attributes, "h", 0),
             duration=getattr(video_attributes, "duration", 0),
@@ -151,14 +166,14 @@ class Animation(Object):
                         thumbnail_size=video_size.type,
                         volume_id=0,
                         local_id=0,
-                    ).encode()
+                    )
                     if video
                     else None
                 ),
                 file_unique_id=(
                     FileUniqueId(
                         file_unique_type=FileUniqueType.DOCUMENT, media_id=video.id
-                    ).encode()
+                    )
                     if video
                     else None
                 ),
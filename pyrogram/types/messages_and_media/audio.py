@@ -63,6 +63,21 @@ class Audio(Object):
             Thumbnails of the music file album cover.
     """
 
+    _file_id_attributes = ("file_id", "file_unique_id")
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "duration",
+        "performer",
+        "title",
+        "file_name",
+        "mime_type",
+        "file_size",
+        "date",
+        "thumbs",
+    )
+
     def __init__(
         self,
         *,
@@ -105,10 +120,10 @@ class Audio(Object):
                 media_id=audio.id,
                 access_hash=audio.access_hash,
                 file_reference=audio.file_reference,
-            ).encode(),
+            ),
             file_unique_id=FileUniqueId(
                 file_unique_type=FileUniqueType.DOCUMENT, media_id=audio.id
-            ).encode(),
+            ),
             duration=audio_attributes.duration,
             performer=audio_attributes.performer,
             title=audio_attributes.title,
@@ -0,0 +1,41 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from typing import Dict, Union
+
+from ..object import Object
+
+
+class BroadcastResult(Object):
+    """The outcome of a :meth:`~pyrogram.Client.broadcast_message` call.
+
+    Parameters:
+        sent_count (``int``):
+            Amount of recipients the message was delivered to, including the ones from previous, resumed, calls.
+
+        failed (``dict``):
+            Recipients the message couldn't be delivered to, mapped to the error id
+            (e.g. "USER_IS_BLOCKED" or "PEER_ID_INVALID").
+    """
+
+    def __init__(self, *, sent_count: int, failed: Dict[Union[int, str], str]):
+        super().__init__()
+
+        self.sent_count = sent_count
+        self.failed = failed
@@ -0,0 +1,90 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from pyrogram import raw, utils
+
+
+class CompactMessage(NamedTuple):
+    """A lightweight message record built directly from the raw Telegram object.
+
+    Returned by :meth:`~pyrogram.Client.get_chat_history` when ``compact=True`` is passed, instead of
+    :obj:`~pyrogram.types.Message`.
+
+    Parameters:
+        id (``int``):
+            Unique message identifier inside this chat.
+
+        chat_id (``int``):
+            Identifier of the chat the message belongs to.
+
+        from_id (``int``):
+            Identifier of the sender, if available.
+
+        date (:py:obj:`~datetime.datetime`):
+            Date the message was sent.
+
+        text (``str``):
+            Text or caption of the message.
+
+        reply_to_message_id (``int``):
+            The id of the message this message replies to, if any.
+
+        has_media (``bool``):
+            True, if the message contains media.
+
+        is_service (``bool``):
+            True, if the message is a service message.
+
+        empty (``bool``):
+            True, if the message is empty (deleted or inaccessible).
+    """
+
+    id: int
+    chat_id: Optional[int] = None
+    from_id: Optional[int] = None
+    date: Optional[datetime] = None
+    text: Optional[str] = None
+    reply_to_message_id: Optional[int] = None
+    has_media: bool = False
+    is_service: bool = False
+    empty: bool = False
+
+    @staticmethod
+    def _parse(message: "raw.base.Message") -> "CompactMessage":
+        if isinstance(message, raw.types.MessageEmpty):
+            return CompactMessage(id=message.id, empty=True)
+
+        reply_to = getattr(message, "reply_to", None)
+
+        return CompactMessage(
+            id=message.id,
+            chat_id=utils.get_peer_id(message.peer_id),
+            from_id=(
+                utils.get_peer_id(message.from_id)
+                if message.from_id
+                else utils.get_peer_id(message.peer_id)
+            ),
+            date=utils.timestamp_to_datetime(message.date),
+            text=getattr(message, "message", None),
+            reply_to_message_id=getattr(reply_to, "reply_to_msg_id", None),
+            has_media=getattr(message, "media", None) is not None,
+            is_service=isinstance(message, raw.types.MessageService),
+        )
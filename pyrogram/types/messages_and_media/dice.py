@@ -33,6 +33,11 @@ class Dice(Object):
             Value of the dice, 1-6 for currently supported base emoji.
     """
 
+    __slots__ = (
+        "emoji",
+        "value",
+    )
+
     def __init__(self, *, client: "pyrogram.Client" = None, emoji: str, value: int):
         super().__init__(client)
 
@@ -54,6 +54,18 @@ class Document(Object):
             Document thumbnails as defined by sender.
     """
 
+    _file_id_attributes = ("file_id", "file_unique_id")
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "file_name",
+        "mime_type",
+        "file_size",
+        "date",
+        "thumbs",
+    )
+
     def __init__(
         self,
         *,
@@ -85,10 +97,10 @@ class Document(Object):
                 media_id=document.id,
                 access_hash=document.access_hash,
                 file_reference=document.file_reference,
-            ).encode(),
+            ),
             file_unique_id=FileUniqueId(
                 file_unique_type=FileUniqueType.DOCUMENT, media_id=document.id
-            ).encode(),
+            ),
             file_name=file_name,
             mime_type=document.mime_type,
             file_size=document.size,
@@ -34,6 +34,11 @@ class Location(Object):
             Latitude as defined by sender.
     """
 
+    __slots__ = (
+        "longitude",
+        "latitude",
+    )
+
     def __init__(
         self, *, client: "pyrogram.Client" = None, longitude: float, latitude: float
     ):
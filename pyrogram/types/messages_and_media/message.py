@@ -421,6 +421,116 @@ class Message(Object, Update):
             This field will contain the enumeration type of how the user had joined the chat.
     """
 
+    __slots__ = (
+        "id",
+        "message_thread_id",
+        "business_connection_id",
+        "from_user",
+        "sender_chat",
+        "sender_business_bot",
+        "date",
+        "chat",
+        "forward_origin",
+        "external_reply",
+        "is_topic_message",
+        "reply_to_chat_id",
+        "reply_to_message_id",
+        "reply_to_story_id",
+        "reply_to_story_user_id",
+        "reply_to_story_chat_id",
+        "reply_to_top_message_id",
+        "reply_to_message",
+        "reply_to_story",
+        "mentioned",
+        "empty",
+        "service",
+        "scheduled",
+        "from_scheduled",
+        "media",
+        "edit_date",
+        "edit_hide",
+        "media_group_id",
+        "author_signature",
+        "has_protected_content",
+        "has_media_spoiler",
+        "text",
+        "entities",
+        "caption_entities",
+        "quote",
+        "effect_id",
+        "invert_media",
+        "audio",
+        "document",
+        "photo",
+        "paid_media",
+        "sticker",
+        "animation",
+        "game",
+        "gifted_premium",
+        "giveaway",
+        "giveaway_result",
+        "boosts_applied",
+        "chat_theme_updated",
+        "chat_wallpaper_updated",
+        "contact_registered",
+        "gift_code",
+        "gift",
+        "screenshot_taken",
+        "invoice",
+        "story",
+        "video",
+        "alternative_videos",
+        "voice",
+        "video_note",
+        "web_page_preview",
+        "caption",
+        "contact",
+        "location",
+        "venue",
+        "poll",
+        "dice",
+        "new_chat_members",
+        "chat_joined_by_request",
+        "left_chat_member",
+        "new_chat_title",
+        "new_chat_photo",
+        "delete_chat_photo",
+        "group_chat_created",
+        "supergroup_chat_created",
+        "channel_chat_created",
+        "migrate_to_chat_id",
+        "migrate_from_chat_id",
+        "pinned_message",
+        "game_high_score",
+        "views",
+        "forwards",
+        "via_bot",
+        "outgoing",
+        "matches",
+        "command",
+        "reply_markup",
+        "bot_allowed",
+        "chats_shared",
+        "forum_topic_created",
+        "forum_topic_closed",
+        "forum_topic_reopened",
+        "forum_topic_edited",
+        "general_topic_hidden",
+        "general_topic_unhidden",
+        "giveaway_launched",
+        "video_chat_scheduled",
+        "video_chat_started",
+        "video_chat_ended",
+        "video_chat_members_invited",
+        "web_app_data",
+        "successful_payment",
+        "payment_refunded",
+        "reactions",
+        "chat_join_type",
+        "raw",
+        "topic",
+    )
+
     # TODO: Add game missing field, Also connected_website
 
     def __init__(
@@ -57,6 +57,17 @@ class MessageEntity(Object):
             For :obj:`~pyrogram.enums.MessageEntityType.BLOCKQUOTE` only, whether the blockquote expandable.
     """
 
+    __slots__ = (
+        "type",
+        "offset",
+        "length",
+        "url",
+        "user",
+        "language",
+        "custom_emoji_id",
+        "collapsed",
+    )
+
     def __init__(
         self,
         *,
@@ -109,9 +120,9 @@ class MessageEntity(Object):
         )
 
     async def write(self):
-        args = self.__dict__.copy()
+        args = {attr: getattr(self, attr) for attr in self._attributes()}
 
-        for arg in ("_client", "type", "user"):
+        for arg in ("type", "user"):
             args.pop(arg)
 
         if self.user:
@@ -63,6 +63,19 @@ class Photo(Object):
             Available thumbnails of this photo.
     """
 
+    _file_id_attributes = ("file_id", "file_unique_id")
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "width",
+        "height",
+        "file_size",
+        "date",
+        "ttl_seconds",
+        "thumbs",
+    )
+
     def __init__(
         self,
         *,
@@ -119,10 +132,10 @@ class Photo(Object):
                     thumbnail_size=main.type,
                     volume_id=0,
                     local_id=0,
-                ).encode(),
+                ),
                 file_unique_id=FileUniqueId(
                     file_unique_type=FileUniqueType.DOCUMENT, media_id=photo.id
-                ).encode(),
+                ),
                 width=main.w,
                 height=main.h,
                 file_size=main.size,
@@ -80,6 +80,25 @@ class Sticker(Object):
             Sticker thumbnails in the .webp or .jpg format.
     """
 
+    _file_id_attributes = ("file_id", "file_unique_id")
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "file_name",
+        "mime_type",
+        "file_size",
+        "date",
+        "width",
+        "height",
+        "is_animated",
+        "is_video",
+        "needs_repainting",
+        "emoji",
+        "set_name",
+        "thumbs",
+    )
+
     # TODO: Add mask position
 
     def __init__(
@@ -201,10 +220,10 @@ class Sticker(Object):
                 media_id=sticker.id,
                 access_hash=sticker.access_hash,
                 file_reference=sticker.file_reference,
-            ).encode(),
+            ),
             file_unique_id=FileUniqueId(
                 file_unique_type=FileUniqueType.DOCUMENT, media_id=sticker.id
-            ).encode(),
+            ),
             width=(
                 image_size_attributes.w
                 if image_size_attributes
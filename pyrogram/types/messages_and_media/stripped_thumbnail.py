@@ -30,6 +30,10 @@ class StrippedThumbnail(Object):
             Thumbnail data
     """
 
+    __slots__ = (
+        "data",
+    )
+
     def __init__(self, *, client: "pyrogram.Client" = None, data: bytes):
         super().__init__(client)
 
@@ -0,0 +1,157 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import re
+from bisect import bisect_left
+from itertools import accumulate
+from string import Formatter
+from typing import List, Optional
+
+from pyrogram import raw
+from pyrogram.parser import utils as parser_utils
+from ..object import Object
+
+FIELD_RE = re.compile(r"\{\{|\}\}|\{([^{}]*)\}")
+
+
+class TextTemplate(Object):
+    """A formatted text, parsed once and rendered many times with different values.
+
+    Templates are created with :meth:`~pyrogram.Client.parse_template` and can be passed as the text or caption of
+    any method that sends or edits messages, as they are or rendered with :meth:`format`. The markup is never parsed
+    again, and mentions are resolved only once, when the template is created.
+
+    Parameters:
+        text (``str``):
+            The parsed text, with :meth:`str.format` style replacement fields, e.g. "{name}" or "{0:.2f}".
+
+        entities (List of :obj:`~pyrogram.raw.base.MessageEntity`, *optional*):
+            The entities of the parsed text, with offsets in UTF-16 code units.
+    """
+
+    __slots__ = ("text", "entities", "_fields")
+
+    def __init__(self, *, text: str, entities: Optional[List["raw.base.MessageEntity"]] = None):
+        super().__init__()
+
+        self.text = text
+        self.entities = entities or []
+        self._fields = None
+
+    def _parse_fields(self) -> list:
+        # (literal text before, UTF-16 position, UTF-16 length, replacement)
+        # where replacement is either a brace, for "{{" and "}}", or a (field name, format spec, conversion) tuple
+        fields = []
+        last = 0
+        position = 0
+
+        for match in FIELD_RE.finditer(self.text):
+            start, end = match.span()
+            literal = self.text[last:start]
+            position += parser_utils.utf16_len(literal)
+            field = match.group(1)
+
+            if field is None:
+                replacement = match.group()[0]
+            else:
+                _, name, spec, conversion = next(Formatter().parse(f"{{{field}}}"))
+                replacement = (name, spec, conversion)
+
+            fields.append((literal, position, end - start, replacement))
+            position += end - start
+            last = end
+
+        fields.append((self.text[last:], position, 0, None))
+
+        return fields
+
+    def format(self, *args, **kwargs) -> "TextTemplate":
+        """Render the template, replacing its fields with the given values.
+
+        The values are inserted as they are: they aren't parsed for markup and don't need to be escaped. Entities
+        are shifted and stretched to account for the length of the values.
+
+        Parameters:
+            *args (``Any``, *optional*):
+                Values of the positional fields.
+
+            **kwargs (``Any``, *optional*):
+                Values of the named fields.
+
+        Returns:
+            :obj:`~pyrogram.types.TextTemplate`: The rendered text, ready to be sent.
+
+        Example:
+            .. code-block:: python
+
+                template = await app.parse_template("Hi **{name}**, your order is <b>ready</b>")
+
+                await app.send_message(chat_id, template.format(name="<Bob>"))
+        """
+        if self._fields is None:
+            self._fields = self._parse_fields()
+
+        formatter = Formatter()
+        pieces = []
+        positions = []
+        deltas = []
+        auto_index = 0
+
+        for literal, position, length, replacement in self._fields:
+            pieces.append(literal)
+
+            if replacement is None:
+                continue
+
+            if isinstance(replacement, str):
+                value = replacement
+            else:
+                name, spec, conversion = replacement
+
+                if name == "":
+                    name = str(auto_index)
+                    auto_index += 1
+
+                value = formatter.format_field(
+                    formatter.convert_field(formatter.get_field(name, args, kwargs)[0], conversion),
+                    spec,
+                )
+
+            pieces.append(value)
+            positions.append(position)
+            deltas.append(parser_utils.utf16_len(value) - length)
+
+        shifts = [0, *accumulate(deltas)]
+        entities = []
+
+        for entity in self.entities:
+            start = entity.offset
+            end = start + entity.length
+
+            # Fields starting before the entity move it, the ones starting inside it stretch it
+            start += shifts[bisect_left(positions, start)]
+            end += shifts[bisect_left(positions, end)]
+
+            if end > start:
+                entity = type(entity)(**{attr: getattr(entity, attr) for attr in entity.__slots__})
+                entity.offset = start
+                entity.length = end - start
+                entities.append(entity)
+
+        return TextTemplate(text="".join(pieces), entities=entities)
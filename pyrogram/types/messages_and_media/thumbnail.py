@@ -52,6 +52,16 @@ class Thumbnail(Object):
             File size.
     """
 
+    _file_id_attributes = ("file_id", "file_unique_id")
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "width",
+        "height",
+        "file_size",
+    )
+
     def __init__(
         self,
         *,
@@ -105,10 +115,10 @@ class Thumbnail(Object):
                         thumbnail_size=thumb.type,
                         volume_id=0,
                         local_id=0,
-                    ).encode(),
+                    ),
                     file_unique_id=FileUniqueId(
                         file_unique_type=FileUniqueType.DOCUMENT, media_id=media.id
-                    ).encode(),
+                    ),
                     width=thumb.w,
                     height=thumb.h,
                     file_size=thumb.size,
@@ -45,6 +45,14 @@ class Venue(Object):
 
     """
 
+    __slots__ = (
+        "location",
+        "title",
+        "address",
+        "foursquare_id",
+        "foursquare_type",
+    )
+
     def __init__(
         self,
         *,
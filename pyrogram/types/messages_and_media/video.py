@@ -74,6 +74,25 @@ class Video(Object):
             Video startpoint, in seconds.
     """
 
+    _file_id_attributes = ("file_id", "file_unique_id")
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "width",
+        "height",
+        "duration",
+        "file_name",
+        "mime_type",
+        "file_size",
+        "supports_streaming",
+        "ttl_seconds",
+        "date",
+        "thumbs",
+        "cover",
+        "start_timestamp",
+    )
+
     def __init__(
         self,
         *,
@@ -127,10 +146,10 @@ class Video(Object):
                 media_id=video.id,
                 access_hash=video.access_hash,
                 file_reference=video.file_reference,
-            ).encode(),
+            ),
             file_unique_id=FileUniqueId(
                 file_unique_type=FileUniqueType.DOCUMENT, media_id=video.id
-            ).encode(),
+            ),
             width=video_attributes.w,
             height=video_attributes.h,
             duration=video_attributes.duration,
@@ -57,6 +57,19 @@ class VideoNote(Object):
             Video thumbnails.
     """
 
+    _file_id_attributes = ("file_id", "file_unique_id")
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "mime_type",
+        "file_size",
+        "date",
+        "length",
+        "duration",
+        "thumbs",
+    )
+
     def __init__(
         self,
         *,
@@ -94,10 +107,10 @@ class VideoNote(Object):
                 media_id=video_note.id,
                 access_hash=video_note.access_hash,
                 file_reference=video_note.file_reference,
-            ).encode(),
+            ),
             file_unique_id=FileUniqueId(
                 file_unique_type=FileUniqueType.DOCUMENT, media_id=video_note.id
-            ).encode(),
+            ),
             length=video_attributes.w,
             duration=video_attributes.duration,
             file_size=video_note.size,
@@ -52,6 +52,18 @@ class Voice(Object):
             Date the voice was sent.
     """
 
+    _file_id_attributes = ("file_id", "file_unique_id")
+
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "duration",
+        "waveform",
+        "mime_type",
+        "file_size",
+        "date",
+    )
+
     def __init__(
         self,
         *,
@@ -87,10 +99,10 @@ class Voice(Object):
                 media_id=voice.id,
                 access_hash=voice.access_hash,
                 file_reference=voice.file_reference,
-            ).encode(),
+            ),
             file_unique_id=FileUniqueId(
                 file_unique_type=FileUniqueType.DOCUMENT, media_id=voice.id
-            ).encode(),
+            ),
             duration=attributes.duration,
             mime_type=voice.mime_type,
             file_size=voice.size,
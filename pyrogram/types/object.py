@@ -23,12 +23,83 @@ from enum import Enum
 from json import dumps
 
 import pyrogram
+from pyrogram.file_id import FileId, FileUniqueId
+
+
+class FileIdAttribute:
+    """Slot that also accepts a FileId or FileUniqueId, encoded into its string form only when first read.
+
+    Parsing a media doesn't need to encode the file ids of it and all of its thumbnails up front, most of them are
+    never accessed at all.
+    """
+
+    __slots__ = ("member",)
+
+    def __init__(self, member):
+        self.member = member
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        value = self.member.__get__(obj, objtype)
+
+        if isinstance(value, (FileId, FileUniqueId)):
+            value = value.encode()
+            self.member.__set__(obj, value)
+
+        return value
+
+    def __set__(self, obj, value):
+        self.member.__set__(obj, value)
+
+    def __delete__(self, obj):
+        self.member.__delete__(obj)
 
 
 class Object:
+    # Types with many attributes declare them in __slots__, so that their instances don't carry a per-instance
+    # dictionary. The __dict__ slot keeps arbitrary attributes working: it is only allocated when one is set.
+    __slots__ = ("_client", "__dict__", "__weakref__")
+
+    _slot_attributes = ()
+
+    # Slots holding file ids, see FileIdAttribute
+    _file_id_attributes = ()
+
     def __init__(self, client: "pyrogram.Client" = None):
         self._client = client
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        slots = []
+
+        for klass in reversed(cls.__mro__):
+            klass_slots = klass.__dict__.get("__slots__", ())
+
+            if isinstance(klass_slots, str):
+                klass_slots = (klass_slots,)
+
+            slots.extend(
+                i
+                for i in klass_slots
+                if i not in ("_client", "__dict__", "__weakref__") and i not in slots
+            )
+
+        cls._slot_attributes = tuple(slots)
+
+        for attr in cls.__dict__.get("_file_id_attributes", ()):
+            setattr(cls, attr, FileIdAttribute(cls.__dict__[attr]))
+
+    def _attributes(self) -> typing.Iterator[str]:
+        """Iterate over the names of the attributes set on this object, in definition order."""
+        for attr in self._slot_attributes:
+            if hasattr(self, attr):
+                yield attr
+
+        yield from getattr(self, "__dict__", ())
+
     def bind(self, client: "pyrogram.Client"):
         """Bind a Client instance to this and to all nested Pyrogram objects.
 
@@ -39,7 +110,7 @@ class Object:
         """
         self._client = client
 
-        for i in self.__dict__:
+        for i in self._attributes():
             o = getattr(self, i)
 
             if isinstance(o, Object):
@@ -67,7 +138,7 @@ class Object:
             attr: ("*" * 9 if attr == "phone_number" else getattr(obj, attr))
             for attr in filter(
                 lambda x: not x.startswith("_") and x not in attributes_to_hide,
-                obj.__dict__,
+                obj._attributes(),
             )
             if getattr(obj, attr) is not None
         }
@@ -82,13 +153,13 @@ class Object:
             self.__class__.__name__,
             ", ".join(
                 f"{attr}={repr(getattr(self, attr))}"
-                for attr in filter(lambda x: not x.startswith("_"), self.__dict__)
+                for attr in filter(lambda x: not x.startswith("_"), self._attributes())
                 if getattr(self, attr) is not None
             ),
         )
 
     def __eq__(self, other: "Object") -> bool:
-        for attr in self.__dict__:
+        for attr in self._attributes():
             try:
                 if attr.startswith("_"):
                     continue
@@ -106,12 +177,12 @@ class Object:
 
             # Maybe a better alternative would be https://docs.python.org/3/library/inspect.html#inspect.signature
             if isinstance(obj, tuple) and len(obj) == 2 and obj[0] == "dt":
-                state[attr] = datetime.fromtimestamp(obj[1])
+                obj = datetime.fromtimestamp(obj[1])
 
-        self.__dict__ = state
+            setattr(self, attr, obj)
 
     def __getstate__(self):
-        state = self.__dict__.copy()
+        state = {attr: getattr(self, attr) for attr in self._attributes()}
         state.pop("_client", None)
 
         for attr in state:
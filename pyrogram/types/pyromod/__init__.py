@@ -19,5 +19,6 @@
 
 from .identifier import Identifier
 from .listener import Listener
+from .listener_registry import ListenerRegistry
 
-__all__ = ["Identifier", "Listener"]
+__all__ = ["Identifier", "Listener", "ListenerRegistry"]
@@ -0,0 +1,158 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from itertools import count
+from typing import Dict, Iterator, List
+
+from .identifier import Identifier
+from .listener import Listener
+
+
+class ListenerRegistry:
+    """The listeners of one type, indexed by the values of their identifiers.
+
+    Finding the listeners an update matches only checks the ones registered for its chat, user, message or inline
+    message, plus the ones with an empty identifier, instead of every listener. It can be used like a list of
+    :obj:`~pyrogram.types.Listener`.
+    """
+
+    FIELDS = ("chat_id", "from_user_id", "message_id", "inline_message_id")
+
+    def __init__(self):
+        self.listeners: Dict[int, Listener] = {}
+        self.sequence: Dict[int, int] = {}
+        self.counter = count()
+        # Listeners that can't be indexed, because their identifier is empty or has unhashable values
+        self.wildcards: Dict[int, Listener] = {}
+        self.index: Dict[str, dict] = {field: {} for field in self.FIELDS}
+        self.keys: Dict[int, list] = {}
+
+    @staticmethod
+    def values(value) -> list:
+        if value is None:
+            return []
+
+        return value if isinstance(value, list) else [value]
+
+    def append(self, listener: Listener):
+        key = id(listener)
+
+        if key in self.listeners:
+            return
+
+        self.listeners[key] = listener
+        self.sequence[key] = next(self.counter)
+        keys = []
+
+        try:
+            for field in self.FIELDS:
+                for value in self.values(getattr(listener.identifier, field)):
+                    self.index[field].setdefault(value, {})[key] = listener
+                    keys.append((field, value))
+        except TypeError:
+            self.wildcards[key] = listener
+
+        if not keys:
+            self.wildcards[key] = listener
+
+        self.keys[key] = keys
+
+    def remove(self, listener: Listener):
+        key = id(listener)
+
+        if key not in self.listeners:
+            raise ValueError("Listener not registered")
+
+        del self.listeners[key]
+        del self.sequence[key]
+        self.wildcards.pop(key, None)
+
+        for field, value in self.keys.pop(key):
+            listeners = self.index[field][value]
+            listeners.pop(key, None)
+
+            if not listeners:
+                del self.index[field][value]
+
+    def candidates(self, field: str, values: list) -> Dict[int, Listener]:
+        candidates = {}
+        index = self.index[field]
+
+        for value in values:
+            try:
+                listeners = index.get(value)
+            except TypeError:
+                continue
+
+            if listeners:
+                candidates.update(listeners)
+
+        return candidates
+
+    def sorted(self, candidates: Dict[int, Listener]) -> List[Listener]:
+        # In registration order, as if the listeners were scanned one by one
+        return [candidates[key] for key in sorted(candidates, key=self.sequence.__getitem__)]
+
+    def match(self, data: Identifier) -> List[Listener]:
+        """Get the listeners the given update data matches with, in registration order."""
+        if not self.listeners:
+            return []
+
+        candidates = dict(self.wildcards)
+
+        # A listener matches only if each of its fields does, any of them leads to it
+        for field in self.FIELDS:
+            candidates.update(self.candidates(field, self.values(getattr(data, field))))
+
+        return [
+            listener
+            for listener in self.sorted(candidates)
+            if listener.identifier.matches(data)
+        ]
+
+    def match_pattern(self, pattern: Identifier) -> List[Listener]:
+        """Get the listeners whose identifier matches the given (partial) identifier pattern, in registration order."""
+        for field in self.FIELDS:
+            values = self.values(getattr(pattern, field))
+
+            if values:
+                # Matching listeners must share at least a value with the pattern, for each field the pattern has
+                candidates = self.candidates(field, values)
+                candidates.update(self.wildcards)
+                break
+        else:
+            candidates = self.listeners
+
+        return [
+            listener
+            for listener in self.sorted(candidates)
+            if pattern.matches(listener.identifier)
+        ]
+
+    def __iter__(self) -> Iterator[Listener]:
+        return iter(list(self.listeners.values()))
+
+    def __len__(self) -> int:
+        return len(self.listeners)
+
+    def __contains__(self, listener: Listener) -> bool:
+        return id(listener) in self.listeners
+
+    def __getitem__(self, index):
+        return list(self.listeners.values())[index]
@@ -21,6 +21,8 @@ import pyrogram
 
 
 class Update:
+    __slots__ = ()
+
     @staticmethod
     def stop_propagation():
         raise pyrogram.StopPropagation
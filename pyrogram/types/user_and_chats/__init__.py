@@ -40,6 +40,10 @@ from .chat_photo import ChatPhoto
 from .chat_preview import ChatPreview
 from .chat_privileges import ChatPrivileges
 from .chat_reactions import ChatReactions
+from .compact_chat import CompactChat
+from .compact_chat_member import CompactChatMember
+from .compact_dialog import CompactDialog
+from .compact_user import CompactUser
 from .dialog import Dialog
 from .emoji_status import EmojiStatus
 from .folder import Folder
@@ -107,4 +111,8 @@ __all__ = [
     "ChatJoiner",
     "EmojiStatus",
     "ChatReactions",
+    "CompactChat",
+    "CompactChatMember",
+    "CompactDialog",
+    "CompactUser",
 ]
@@ -17,6 +17,7 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
 from datetime import datetime
 from typing import Union, List, Optional, AsyncGenerator, BinaryIO, Dict
 
@@ -216,6 +217,60 @@ class Chat(Object):
             Information about bot verification.
     """
 
+    __slots__ = (
+        "id",
+        "type",
+        "is_verified",
+        "is_restricted",
+        "is_creator",
+        "is_scam",
+        "is_fake",
+        "is_support",
+        "is_forum",
+        "is_participants_hidden",
+        "is_join_request",
+        "is_join_to_send",
+        "is_antispam",
+        "is_paid_reactions_available",
+        "is_slowmode_enabled",
+        "is_gifts_available",
+        "title",
+        "username",
+        "first_name",
+        "last_name",
+        "photo",
+        "stories",
+        "wallpaper",
+        "bio",
+        "description",
+        "dc_id",
+        "folder_id",
+        "has_protected_content",
+        "invite_link",
+        "pinned_message",
+        "sticker_set_name",
+        "can_set_sticker_set",
+        "members_count",
+        "join_requests_count",
+        "slow_mode_delay",
+        "restrictions",
+        "permissions",
+        "distance",
+        "linked_chat",
+        "send_as_chat",
+        "available_reactions",
+        "usernames",
+        "reply_color",
+        "profile_color",
+        "business_info",
+        "birthday",
+        "personal_chat",
+        "max_reaction_count",
+        "subscription_until_date",
+        "gifts_count",
+        "bot_verification",
+    )
+
     def __init__(
         self,
         *,
@@ -321,6 +376,7 @@ class Chat(Object):
         self.business_info = business_info
         self.birthday = birthday
         self.personal_chat = personal_chat
+        self.max_reaction_count = max_reaction_count
         self.subscription_until_date = subscription_until_date
         self.gifts_count = gifts_count
         self.bot_verification = bot_verification
@@ -473,12 +529,20 @@ class Chat(Object):
         chat_id = (peer_id or from_id) if is_chat else (from_id or peer_id)
 
         if isinstance(message.peer_id, raw.types.PeerUser):
-            return Chat._parse_user_chat(client, users[chat_id])
+            key, peer, parse = "user", users[chat_id], Chat._parse_user_chat
+        elif isinstance(message.peer_id, raw.types.PeerChat):
+            key, peer, parse = "chat", chats[chat_id], Chat._parse_chat_chat
+        else:
+            key, peer, parse = "channel", chats[chat_id], Chat._parse_channel_chat
 
-        if isinstance(message.peer_id, raw.types.PeerChat):
-            return Chat._parse_chat_chat(client, chats[chat_id])
+        parsed_peers_cache = getattr(client, "parsed_peers_cache", None)
 
-        return Chat._parse_channel_chat(client, chats[chat_id])
+        if parsed_peers_cache is None:
+            return parse(client, peer)
+
+        return parsed_peers_cache.get(
+            (key + "_chat", chat_id), peer, functools.partial(parse, client, peer)
+        )
 
     @staticmethod
     def _parse_dialog(
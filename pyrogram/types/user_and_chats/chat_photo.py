@@ -62,6 +62,23 @@ class ChatPhoto(Object):
 
     """
 
+    _file_id_attributes = (
+        "small_file_id",
+        "small_photo_unique_id",
+        "big_file_id",
+        "big_photo_unique_id",
+    )
+
+    __slots__ = (
+        "small_file_id",
+        "small_photo_unique_id",
+        "big_file_id",
+        "big_photo_unique_id",
+        "has_animation",
+        "is_personal",
+        "minithumbnail",
+    )
+
     def __init__(
         self,
         *,
@@ -107,10 +124,10 @@ class ChatPhoto(Object):
                 local_id=0,
                 chat_id=peer_id,
                 chat_access_hash=peer_access_hash,
-            ).encode(),
+            ),
             small_photo_unique_id=FileUniqueId(
                 file_unique_type=FileUniqueType.DOCUMENT, media_id=chat_photo.photo_id
-            ).encode(),
+            ),
             big_file_id=FileId(
                 file_type=FileType.CHAT_PHOTO,
                 dc_id=chat_photo.dc_id,
@@ -121,10 +138,10 @@ class ChatPhoto(Object):
                 local_id=0,
                 chat_id=peer_id,
                 chat_access_hash=peer_access_hash,
-            ).encode(),
+            ),
             big_photo_unique_id=FileUniqueId(
                 file_unique_type=FileUniqueType.DOCUMENT, media_id=chat_photo.photo_id
-            ).encode(),
+            ),
             has_animation=chat_photo.has_video,
             is_personal=getattr(chat_photo, "personal", False),
             minithumbnail=(
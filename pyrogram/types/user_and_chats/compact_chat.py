@@ -0,0 +1,91 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import Dict, NamedTuple, Optional, Union
+
+from pyrogram import enums, raw, utils
+
+
+class CompactChat(NamedTuple):
+    """A lightweight chat record built directly from the raw Telegram object.
+
+    Returned by bulk listing methods when ``compact=True`` is passed, instead of :obj:`~pyrogram.types.Chat`.
+
+    Parameters:
+        id (``int``):
+            Unique identifier for this chat.
+
+        type (:obj:`~pyrogram.enums.ChatType`):
+            Type of chat.
+
+        title (``str``):
+            Title, for supergroups, channels and basic group chats.
+            First and last name, for private chats.
+
+        username (``str``):
+            Username, for private chats, bots, supergroups and channels if available.
+    """
+
+    id: int
+    type: "enums.ChatType"
+    title: Optional[str] = None
+    username: Optional[str] = None
+
+    @staticmethod
+    def _parse(
+        peer: Union["raw.base.User", "raw.base.Chat"]
+    ) -> Optional["CompactChat"]:
+        if isinstance(peer, raw.types.User):
+            return CompactChat(
+                id=peer.id,
+                type=enums.ChatType.BOT if peer.bot else enums.ChatType.PRIVATE,
+                title=" ".join(filter(None, (peer.first_name, peer.last_name)))
+                or None,
+                username=utils.get_username(peer),
+            )
+
+        if isinstance(peer, (raw.types.Chat, raw.types.ChatForbidden)):
+            return CompactChat(id=-peer.id, type=enums.ChatType.GROUP, title=peer.title)
+
+        if isinstance(peer, (raw.types.Channel, raw.types.ChannelForbidden)):
+            return CompactChat(
+                id=utils.get_channel_id(peer.id),
+                type=(
+                    enums.ChatType.CHANNEL
+                    if peer.broadcast
+                    else enums.ChatType.SUPERGROUP
+                ),
+                title=peer.title,
+                username=utils.get_username(peer),
+            )
+
+        return None
+
+    @staticmethod
+    def _parse_peer(
+        peer: "raw.base.Peer",
+        users: Dict[int, "raw.base.User"],
+        chats: Dict[int, "raw.base.Chat"],
+    ) -> Optional["CompactChat"]:
+        if isinstance(peer, raw.types.PeerUser):
+            return CompactChat._parse(users.get(peer.user_id))
+
+        if isinstance(peer, raw.types.PeerChat):
+            return CompactChat._parse(chats.get(peer.chat_id))
+
+        return CompactChat._parse(chats.get(peer.channel_id))
@@ -0,0 +1,105 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+from datetime import datetime
+from typing import Dict, NamedTuple, Optional, Union
+
+from pyrogram import enums, raw, utils
+from .compact_chat import CompactChat
+
+
+class CompactChatMember(NamedTuple):
+    """A lightweight chat member record built directly from the raw Telegram object.
+
+    Returned by :meth:`~pyrogram.Client.get_chat_members` when ``compact=True`` is passed, instead of
+    :obj:`~pyrogram.types.ChatMember`.
+
+    Parameters:
+        id (``int``):
+            Unique identifier of the member.
+            Banned or left chats have a negative identifier.
+
+        username (``str``):
+            Username of the member, if available.
+
+        status (:obj:`~pyrogram.enums.ChatMemberStatus`):
+            The member's status in the chat.
+
+        joined_date (:py:obj:`~datetime.datetime`):
+            Date when the user joined.
+            Not available for the owner.
+
+        until_date (:py:obj:`~datetime.datetime`):
+            Restricted and banned only.
+            Date when restrictions will be lifted for this user.
+    """
+
+    id: int
+    username: Optional[str]
+    status: "enums.ChatMemberStatus"
+    joined_date: Optional[datetime] = None
+    until_date: Optional[datetime] = None
+
+    @staticmethod
+    def _parse(
+        member: Union["raw.base.ChatParticipant", "raw.base.ChannelParticipant"],
+        users: Dict[int, "raw.base.User"],
+        chats: Dict[int, "raw.base.Chat"],
+    ) -> "CompactChatMember":
+        peer = getattr(member, "peer", None)
+
+        if peer is None:
+            peer_id = member.user_id
+            username = utils.get_username(users.get(peer_id))
+        elif isinstance(peer, raw.types.PeerUser):
+            peer_id = peer.user_id
+            username = utils.get_username(users.get(peer_id))
+        else:
+            chat = CompactChat._parse_peer(peer, users, chats)
+            peer_id = chat.id if chat else utils.get_peer_id(peer)
+            username = chat.username if chat else None
+
+        until_date = None
+
+        if isinstance(
+            member, (raw.types.ChatParticipantCreator, raw.types.ChannelParticipantCreator)
+        ):
+            status = enums.ChatMemberStatus.OWNER
+        elif isinstance(
+            member, (raw.types.ChatParticipantAdmin, raw.types.ChannelParticipantAdmin)
+        ):
+            status = enums.ChatMemberStatus.ADMINISTRATOR
+        elif isinstance(member, raw.types.ChannelParticipantBanned):
+            status = (
+                enums.ChatMemberStatus.BANNED
+                if member.banned_rights.view_messages
+                else enums.ChatMemberStatus.RESTRICTED
+            )
+            until_date = utils.timestamp_to_datetime(member.banned_rights.until_date)
+        elif isinstance(member, raw.types.ChannelParticipantLeft):
+            status = enums.ChatMemberStatus.LEFT
+        else:
+            status = enums.ChatMemberStatus.MEMBER
+
+        return CompactChatMember(
+            id=peer_id,
+            username=username,
+            status=status,
+            joined_date=utils.timestamp_to_datetime(getattr(member, "date", None)),
+            until_date=until_date,
+        )
@@ -0,0 +1,73 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+from datetime import datetime
+from typing import Dict, NamedTuple, Optional
+
+from pyrogram import raw, utils
+from .compact_chat import CompactChat
+
+
+class CompactDialog(NamedTuple):
+    """A lightweight dialog record built directly from the raw Telegram object.
+
+    Returned by :meth:`~pyrogram.Client.get_dialogs` when ``compact=True`` is passed, instead of
+    :obj:`~pyrogram.types.Dialog`.
+
+    Parameters:
+        chat (:obj:`~pyrogram.types.CompactChat`):
+            Conversation the dialog belongs to.
+
+        top_message_id (``int``):
+            The id of the last message sent in the dialog.
+
+        top_message_date (:py:obj:`~datetime.datetime`):
+            Date of the last message sent in the dialog.
+
+        unread_messages_count (``int``):
+            Amount of unread messages in this dialog.
+
+        is_pinned (``bool``):
+            True, if the dialog is pinned.
+    """
+
+    chat: "CompactChat"
+    top_message_id: int
+    top_message_date: Optional[datetime] = None
+    unread_messages_count: int = 0
+    is_pinned: bool = False
+
+    @staticmethod
+    def _parse(
+        dialog: "raw.types.Dialog",
+        messages: Dict[int, "raw.base.Message"],
+        users: Dict[int, "raw.base.User"],
+        chats: Dict[int, "raw.base.Chat"],
+    ) -> "CompactDialog":
+        chat = CompactChat._parse_peer(dialog.peer, users, chats)
+        top_message = messages.get(utils.get_peer_id(dialog.peer))
+
+        return CompactDialog(
+            chat=chat,
+            top_message_id=dialog.top_message,
+            top_message_date=utils.timestamp_to_datetime(
+                getattr(top_message, "date", None)
+            ),
+            unread_messages_count=dialog.unread_count,
+            is_pinned=dialog.pinned,
+        )
@@ -0,0 +1,76 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+from typing import NamedTuple, Optional
+
+from pyrogram import raw, utils
+
+
+class CompactUser(NamedTuple):
+    """A lightweight user record built directly from the raw Telegram object.
+
+    Returned by bulk listing methods when ``compact=True`` is passed, instead of :obj:`~pyrogram.types.User`.
+
+    Parameters:
+        id (``int``):
+            Unique identifier for this user or bot.
+
+        username (``str``):
+            User's or bot's username.
+
+        first_name (``str``):
+            User's or bot's first name.
+
+        last_name (``str``):
+            User's or bot's last name.
+
+        phone_number (``str``):
+            User's phone number.
+
+        is_bot (``bool``):
+            True, if this user is a bot.
+
+        is_deleted (``bool``):
+            True, if this user is deleted.
+    """
+
+    id: int
+    username: Optional[str] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    phone_number: Optional[str] = None
+    is_bot: Optional[bool] = None
+    is_deleted: Optional[bool] = None
+
+    @staticmethod
+    def _parse(user: "raw.base.User") -> Optional["CompactUser"]:
+        if user is None:
+            return None
+
+        if isinstance(user, raw.types.UserEmpty):
+            return CompactUser(id=user.id)
+
+        return CompactUser(
+            id=user.id,
+            username=utils.get_username(user),
+            first_name=user.first_name,
+            last_name=user.last_name,
+            phone_number=user.phone,
+            is_bot=user.bot,
+            is_deleted=user.deleted,
+        )
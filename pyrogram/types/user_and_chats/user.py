@@ -17,6 +17,7 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
 import html
 from datetime import datetime
 from typing import List, Optional
@@ -170,6 +171,39 @@ class User(Object, Update):
             Bot's active users count.
     """
 
+    __slots__ = (
+        "id",
+        "is_self",
+        "is_contact",
+        "is_mutual_contact",
+        "is_deleted",
+        "is_bot",
+        "is_verified",
+        "is_restricted",
+        "is_scam",
+        "is_fake",
+        "is_support",
+        "is_premium",
+        "is_contacts_only",
+        "is_bot_business",
+        "first_name",
+        "last_name",
+        "status",
+        "last_online_date",
+        "next_offline_date",
+        "username",
+        "usernames",
+        "language_code",
+        "emoji_status",
+        "dc_id",
+        "phone_number",
+        "photo",
+        "restrictions",
+        "reply_color",
+        "profile_color",
+        "active_users",
+    )
+
     def __init__(
         self,
         *,
@@ -254,6 +288,18 @@ class User(Object, Update):
     def _parse(client, user: "raw.base.User") -> Optional["User"]:
         if user is None or isinstance(user, raw.types.UserEmpty):
             return None
+
+        parsed_peers_cache = getattr(client, "parsed_peers_cache", None)
+
+        if parsed_peers_cache is None:
+            return User._parse_user(client, user)
+
+        return parsed_peers_cache.get(
+            ("user", user.id), user, functools.partial(User._parse_user, client, user)
+        )
+
+    @staticmethod
+    def _parse_user(client, user: "raw.types.User") -> "User":
         user_name = user.username
         active_usernames = getattr(user, "usernames", [])
         active_users = getattr(user, "bot_active_users", None)
@@ -317,6 +317,16 @@ def get_peer_id(peer: Union[raw.base.Peer, raw.base.InputPeer]) -> int:
     raise ValueError(f"Peer type invalid: {peer}")
 
 
+def get_username(peer) -> Optional[str]:
+    """The username of a raw user or chat, falling back to the first of its collectible usernames."""
+    username = getattr(peer, "username", None)
+
+    if username is None and getattr(peer, "usernames", None):
+        username = peer.usernames[0].username
+
+    return username
+
+
 def get_peer_type(peer_id: int) -> str:
     if peer_id < 0:
         if MIN_CHAT_ID <= peer_id:
@@ -427,6 +437,10 @@ async def parse_text_entities(
     parse_mode: enums.ParseMode,
     entities: List["types.MessageEntity"],
 ) -> Dict[str, Union[str, List[raw.base.MessageEntity]]]:
+    if isinstance(text, types.TextTemplate):
+        # Already parsed
+        return {"message": text.text, "entities": text.entities or None}
+
     if entities:
         # Inject the client instance because parsing user mentions requires it
         for entity in entities:
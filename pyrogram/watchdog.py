@@ -0,0 +1,282 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Callable, Optional
+
+import pyrogram
+
+log = logging.getLogger(__name__)
+
+
+class Execution:
+    """A handler callback or filter being run by the dispatcher."""
+
+    __slots__ = ("kind", "name", "code", "update_type", "start", "task", "frame", "reported")
+
+    def __init__(self, kind: str, handler, update):
+        callback = getattr(handler, "original_callback", handler.callback)
+
+        # Filters are mostly Filter instances, running the code of their __call__ method
+        function = callback if kind == "handler" else handler.filters
+
+        self.kind = kind
+        self.name = getattr(callback, "__qualname__", repr(callback))
+        self.code = getattr(function, "__code__", None) or getattr(
+            getattr(function, "__call__", None), "__code__", None
+        )
+        self.update_type = type(update).__name__
+        self.start = time.perf_counter()
+        self.task = None
+        self.frame = None
+        self.reported = False
+
+
+class Watchdog:
+    """Detect handlers that block the event loop or take too long, opt-in with :obj:`~pyrogram.Client` ``watchdog``.
+
+    A thread watches the event loop of the client. When the loop doesn't get to run for longer than the stall
+    threshold, the stack of the loop thread is sampled, showing the code blocking it (e.g. a synchronous database call
+    in a handler or filter), along with the handler that was running. Handlers and filters running longer than the
+    slow threshold are reported too, with the stack they are at. The loop lag is also recorded in the
+    ``loop_lag`` metric of the client.
+
+    Reports are dicts with the *type* of event (``"loop_stall"``, ``"slow_handler"`` or ``"slow_filter"``), the
+    *client* name, the *duration* in seconds so far, the *handler* (qualified name of its callback or filter), the
+    *update_type* and the *stack*. They are logged as warnings, with the dict in the ``watchdog`` attribute of the log
+    record, or passed to the given callback instead.
+
+    Parameters:
+        stall_threshold (``float``, *optional*):
+            Seconds the event loop can be blocked for before it's reported.
+            Defaults to 0.5.
+
+        slow_threshold (``float``, *optional*):
+            Seconds a handler or filter can run for before it's reported.
+            Defaults to 10.
+
+        callback (``Callable``, *optional*):
+            Function called with each report, from the watchdog thread.
+
+    Example:
+        .. code-block:: python
+
+            from pyrogram import Client
+            from pyrogram.watchdog import Watchdog
+
+            app = Client("my_account", watchdog=Watchdog(stall_threshold=0.25))
+    """
+
+    def __init__(
+        self,
+        stall_threshold: float = 0.5,
+        slow_threshold: float = 10,
+        callback: Optional[Callable[[dict], None]] = None,
+    ):
+        self.stall_threshold = stall_threshold
+        self.slow_threshold = slow_threshold
+        self.callback = callback
+        self.interval = min(stall_threshold, slow_threshold) / 2
+
+        self.client: Optional["pyrogram.Client"] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread_id = None
+        # Executions are added and removed in the loop thread, and read in the watchdog thread
+        self.running = {}
+        self.lock = threading.Lock()
+        self.beat = 0.0
+        self.stall_reported = False
+
+        self.heartbeat_task = None
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def start(self, client: "pyrogram.Client"):
+        self.client = client
+        self.loop = asyncio.get_running_loop()
+        self.loop_thread_id = threading.get_ident()
+        self.beat = time.perf_counter()
+        self.stop_event.clear()
+
+        self.heartbeat_task = self.loop.create_task(self.heartbeat())
+        self.thread = threading.Thread(target=self.monitor, name="Watchdog", daemon=True)
+        self.thread.start()
+
+    async def stop(self):
+        self.stop_event.set()
+        self.heartbeat_task.cancel()
+
+        try:
+            await self.heartbeat_task
+        except asyncio.CancelledError:
+            pass
+
+        await self.loop.run_in_executor(None, self.thread.join)
+
+    def watch(self, kind: str, handler, update) -> "Watch":
+        """Context manager timing a handler callback (*kind* ``"handler"``) or its filters (``"filter"``)."""
+        return Watch(self, Execution(kind, handler, update))
+
+    async def heartbeat(self):
+        while True:
+            await asyncio.sleep(self.interval)
+
+            now = time.perf_counter()
+            self.client.metrics.observe("loop_lag", max(now - self.beat - self.interval, 0))
+            self.beat = now
+            self.stall_reported = False
+
+    def monitor(self):
+        while not self.stop_event.wait(self.interval):
+            now = time.perf_counter()
+            stall = now - self.beat - self.interval
+
+            if stall > self.stall_threshold and not self.stall_reported:
+                self.stall_reported = True
+                self.report_stall(stall)
+
+            with self.lock:
+                executions = list(self.running.values())
+
+            for execution in executions:
+                if not execution.reported and now - execution.start > self.slow_threshold:
+                    execution.reported = True
+
+                    frame = self.find_thread(execution.code) if execution.code else None
+
+                    if frame is not None:
+                        # A sync callback or filter, running in the executor
+                        self.report_slow(execution, frame)
+                    else:
+                        # The stack of a task can only be taken in the loop
+                        self.loop.call_soon_threadsafe(self.report_slow, execution)
+
+    def report_stall(self, duration: float):
+        frame = sys._current_frames().get(self.loop_thread_id)
+        stack = set()
+        f = frame
+
+        while f is not None:
+            stack.add(f)
+            f = f.f_back
+
+        # The task blocking the loop is the one whose coroutine is on the stack of the loop thread
+        with self.lock:
+            executions = [e for e in self.running.values() if e.frame is not None and e.frame in stack]
+
+        execution = max(executions, key=lambda e: e.start, default=None)
+
+        self.report(
+            {
+                "type": "loop_stall",
+                "client": self.client.name,
+                "duration": duration,
+                "handler": execution.name if execution else None,
+                "update_type": execution.update_type if execution else None,
+                "stack": "".join(traceback.format_stack(frame)) if frame else None,
+            }
+        )
+
+    def report_slow(self, execution: Execution, frame=None):
+        if frame is not None:
+            stack = traceback.format_stack(frame)
+        elif execution.task is not None and not execution.task.done():
+            stack = traceback.format_list(
+                traceback.StackSummary.extract(
+                    (f, f.f_lineno) for f in execution.task.get_stack()
+                )
+            )
+        else:
+            return
+
+        self.report(
+            {
+                "type": f"slow_{execution.kind}",
+                "client": self.client.name,
+                "duration": time.perf_counter() - execution.start,
+                "handler": execution.name,
+                "update_type": execution.update_type,
+                "stack": "".join(stack),
+            }
+        )
+
+    @staticmethod
+    def find_thread(code):
+        """The innermost frame running the given code in a thread other than this one, if any."""
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == threading.get_ident():
+                continue
+
+            f = frame
+
+            while f is not None:
+                if f.f_code is code:
+                    return frame
+
+                f = f.f_back
+
+        return None
+
+    def report(self, event: dict):
+        if self.callback is not None:
+            try:
+                self.callback(event)
+            except Exception as e:
+                log.exception(e)
+        else:
+            log.warning(
+                "[%s] %s: %s (%s) running for %.3f seconds\n%s",
+                event["client"],
+                event["type"],
+                event["handler"],
+                event["update_type"],
+                event["duration"],
+                event["stack"],
+                extra={"watchdog": event},
+            )
+
+
+class Watch:
+    __slots__ = ("watchdog", "execution")
+
+    def __init__(self, watchdog: Watchdog, execution: Execution):
+        self.watchdog = watchdog
+        self.execution = execution
+
+    def __enter__(self):
+        # Stalls are matched with the running handler through the frame of its task coroutine, as the current
+        # task of the loop can't be queried from the watchdog thread
+        self.execution.task = asyncio.current_task()
+
+        if self.execution.task is not None:
+            self.execution.frame = getattr(self.execution.task.get_coro(), "cr_frame", None)
+
+        with self.watchdog.lock:
+            self.watchdog.running[id(self.execution)] = self.execution
+
+        return self.execution
+
+    def __exit__(self, *exc_info):
+        with self.watchdog.lock:
+            del self.watchdog.running[id(self.execution)]
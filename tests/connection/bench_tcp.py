@@ -0,0 +1,71 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Measure TCP transport throughput against a local echo server.
+
+Run with ``python -m tests.connection.bench_tcp [frames] [size]``.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+from pyrogram.connection.transport import TCPAbridged, TCPFull, TCPIntermediate
+from .echo_server import EchoServer
+
+
+async def bench(protocol_factory, frames: int, size: int) -> float:
+    server = EchoServer(protocol_factory)
+    address = await server.start()
+    protocol = protocol_factory(ipv6=False, proxy=None)
+    payload = os.urandom(size)
+
+    await protocol.connect(address)
+
+    async def receive():
+        for _ in range(frames):
+            await protocol.recv()
+
+    try:
+        start = time.perf_counter()
+        receiver = asyncio.create_task(receive())
+
+        for _ in range(frames):
+            await protocol.send(payload)
+
+        await receiver
+
+        return frames / (time.perf_counter() - start)
+    finally:
+        await protocol.close()
+        await server.stop()
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+
+    for protocol_factory in (TCPAbridged, TCPIntermediate, TCPFull):
+        rate = asyncio.run(bench(protocol_factory, frames, size))
+        print(f"{protocol_factory.__name__:<20} {size:>8} B {rate:>12,.0f} frames/s")
+
+
+if __name__ == "__main__":
+    main()
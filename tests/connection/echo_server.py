@@ -0,0 +1,85 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import asyncio
+from typing import Tuple, Type
+
+from pyrogram.connection.transport import (
+    TCP,
+    TCPAbridged,
+    TCPAbridgedO,
+    TCPFull,
+    TCPIntermediate,
+    TCPIntermediateO,
+)
+from pyrogram.crypto import aes
+
+# Length of the bytes each framing sends right after connecting
+INIT_LENGTHS = {
+    TCPAbridged: 1,
+    TCPIntermediate: 4,
+    TCPFull: 0,
+    TCPAbridgedO: 64,
+    TCPIntermediateO: 64,
+}
+
+
+class EchoServer:
+    """A local server that sends every frame back to the client, using the same framing."""
+
+    def __init__(self, protocol_factory: Type[TCP]):
+        self.init_length = INIT_LENGTHS[protocol_factory]
+        self.obfuscated = self.init_length == 64
+        self.server = None
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            init = await reader.readexactly(self.init_length)
+
+            if self.obfuscated:
+                temp = init[55:7:-1]
+                # The client encrypts with the nonce and decrypts with the reversed nonce
+                decrypt = (init[8:40], bytearray(init[40:56]), bytearray(1))
+                encrypt = (temp[0:32], bytearray(temp[32:48]), bytearray(1))
+
+                aes.ctr256_decrypt(init, *decrypt)
+
+            while True:
+                data = await reader.read(64 * 1024)
+
+                if not data:
+                    break
+
+                if self.obfuscated:
+                    data = aes.ctr256_encrypt(aes.ctr256_decrypt(data, *decrypt), *encrypt)
+
+                writer.write(data)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self) -> Tuple[str, int]:
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
@@ -0,0 +1,94 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import asyncio
+import os
+
+import pytest
+
+from pyrogram.connection.transport import (
+    TCP,
+    TCPAbridged,
+    TCPAbridgedO,
+    TCPFull,
+    TCPIntermediate,
+    TCPIntermediateO,
+)
+from .echo_server import EchoServer
+
+FRAMINGS = [TCPAbridged, TCPAbridgedO, TCPFull, TCPIntermediate, TCPIntermediateO]
+
+
+async def echo(protocol_factory, payloads):
+    server = EchoServer(protocol_factory)
+    address = await server.start()
+    protocol = protocol_factory(ipv6=False, proxy=None)
+
+    try:
+        await protocol.connect(address)
+
+        for payload in payloads:
+            await protocol.send(payload)
+
+        return [await protocol.recv() for _ in payloads]
+    finally:
+        await protocol.close()
+        await server.stop()
+
+
+@pytest.mark.parametrize("protocol_factory", FRAMINGS)
+def test_echo_frames(protocol_factory):
+    # Small, 3-byte-length abridged and larger-than-one-read frames
+    payloads = [os.urandom(16), os.urandom(1024), os.urandom(128 * 1024), b"\x00" * 4]
+
+    assert asyncio.run(echo(protocol_factory, payloads)) == payloads
+
+
+def test_recv_returns_none_when_idle(monkeypatch):
+    monkeypatch.setattr(TCP, "TIMEOUT", 0.2)
+
+    async def main():
+        server = await asyncio.start_server(lambda r, w: None, "127.0.0.1", 0)
+        protocol = TCPIntermediate(ipv6=False, proxy=None)
+
+        try:
+            await protocol._connect(server.sockets[0].getsockname()[:2])
+            return await protocol.recv(4)
+        finally:
+            await protocol.close()
+            server.close()
+
+    assert asyncio.run(main()) is None
+
+
+def test_recv_returns_none_when_closed():
+    async def main():
+        server = await asyncio.start_server(
+            lambda r, w: w.write(b"\x01\x02") or w.close(), "127.0.0.1", 0
+        )
+        protocol = TCPIntermediate(ipv6=False, proxy=None)
+
+        try:
+            await protocol._connect(server.sockets[0].getsockname()[:2])
+            return await protocol.recv(4)
+        finally:
+            await protocol.close()
+            server.close()
+
+    assert asyncio.run(main()) is None
@@ -0,0 +1,72 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import pytest
+
+from pyrogram import errors, raw
+from pyrogram.errors import rpc_error
+from pyrogram.errors.rpc_error import RPCError, UnknownErrorsWriter
+
+
+def raise_it(code: int, message: str):
+    with pytest.raises(RPCError) as e:
+        RPCError.raise_it(
+            raw.types.RpcError(error_code=code, error_message=message),
+            raw.functions.messages.SendMessage,
+        )
+
+    return e.value
+
+
+def test_plain():
+    e = raise_it(400, "PEER_ID_INVALID")
+
+    assert type(e) is errors.PeerIdInvalid
+    assert e.value is None
+
+
+def test_value():
+    e = raise_it(420, "FLOOD_WAIT_35")
+
+    assert type(e) is errors.FloodWait
+    assert e.value == 35
+
+    e = raise_it(406, "PREVIOUS_CHAT_IMPORT_ACTIVE_WAIT_5MIN")
+
+    assert type(e) is errors.PreviousChatImportActiveWaitMin
+    assert e.value == 5
+
+
+def test_unknown(tmp_path, monkeypatch):
+    writer = UnknownErrorsWriter(str(tmp_path / "unknown_errors.txt"))
+    monkeypatch.setattr(rpc_error, "unknown_errors_writer", writer)
+
+    assert type(raise_it(400, "SOMETHING_NEW")) is errors.BadRequest
+    assert type(raise_it(-503, "OTHER_THING_3")) is errors.ServiceUnavailable
+    assert type(raise_it(499, "WHATEVER")) is errors.UnknownError
+
+    writer.stop()
+
+    lines = (tmp_path / "unknown_errors.txt").read_text().splitlines()
+
+    assert [line.split("\t")[1:] for line in lines] == [
+        ["[400 SOMETHING_NEW]", "messages.SendMessage"],
+        ["[503 OTHER_THING_3]", "messages.SendMessage"],
+        ["[499 WHATEVER]", "messages.SendMessage"],
+    ]
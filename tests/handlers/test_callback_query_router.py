@@ -0,0 +1,133 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import re
+
+import pytest
+
+from pyrogram import filters
+from pyrogram.handlers import CallbackQueryRouter
+from pyrogram.handlers.callback_query_router import literal_prefix
+
+
+class Query:
+    def __init__(self, data):
+        self.data = data
+        self.matches = None
+
+
+async def routed(router, routes, data):
+    query = Query(data)
+    passed = [i for i, route in enumerate(routes) if await route(None, query)]
+    return passed, query
+
+
+def test_literal_prefix():
+    assert literal_prefix(re.compile(r"^buy:(\d+)")) == "buy:"
+    assert literal_prefix(re.compile(r"^a\.b\d")) == "a.b"
+    assert literal_prefix(re.compile(r"^items?")) == "item"
+    assert literal_prefix(re.compile(r"^ab+")) == "ab"
+    assert literal_prefix(re.compile(r"^a|b")) is None
+    assert literal_prefix(re.compile(r"^(a|b)")) is None
+    assert literal_prefix(re.compile(r"buy")) is None
+    assert literal_prefix(re.compile(r"^buy", re.IGNORECASE)) is None
+    assert literal_prefix(re.compile(rb"^buy")) is None
+
+
+@pytest.mark.asyncio
+async def test_routes_pass_what_regex_filters_would():
+    router = CallbackQueryRouter()
+    routes = [
+        router.route(r"^buy:(?P<item>\w+)"),
+        router.route(r"^buy"),
+        router.route(r"page=(\d+)"),
+        router.route(r"^sell:"),
+        router.route(r".*"),
+    ]
+
+    passed, query = await routed(router, routes[:1], "buy:apple")
+    assert passed == [0]
+    assert query.matches[0]["item"] == "apple"
+
+    passed, _ = await routed(router, routes, "buy:apple")
+    assert passed == [0, 1, 4]
+
+    passed, query = await routed(router, routes[2:3], "sell:page=3&page=4")
+    assert [m.group(1) for m in query.matches] == ["3", "4"]
+
+    passed, _ = await routed(router, routes, "other")
+    assert passed == [4]
+
+
+@pytest.mark.asyncio
+async def test_same_as_regex_search():
+    patterns = [r"^a:(\d+)", r"^a", r"b$", r"^ab{2}", r"(?P<x>c)|(?P<y>d)", r"^abc?d", r"(?P<x>e)"]
+    router = CallbackQueryRouter()
+    routes = [router.route(p) for p in patterns]
+    regexes = [re.compile(p) for p in patterns]
+
+    for data in ["a:1", "a", "ab", "abb", "abd", "acd", "xyz", "cb", "e", "ba", "abcd"]:
+        expected = [i for i, f in enumerate(regexes) if f.search(data)]
+
+        passed, query = await routed(router, routes, data)
+        assert passed == expected, data
+
+
+@pytest.mark.asyncio
+async def test_group_numbers_not_combined():
+    patterns = [r"(y)", r"(\w)\1", r"(a)?(?(1)b|c)", rb"(z)\1"]
+    router = CallbackQueryRouter()
+    routes = [router.route(p) for p in patterns]
+
+    # Joined after the first pattern, the backreference and the condition would refer to its group
+    assert router.combined.pattern == "(?-i:(y))"
+
+    for data in ["zz", "ab", "c", "y", "yy", b"zz"]:
+        expected = [i for i, p in enumerate(patterns) if isinstance(data, type(p)) and re.search(p, data)]
+
+        passed, _ = await routed(router, routes, data)
+        assert passed == expected, data
+
+
+@pytest.mark.asyncio
+async def test_combined_with_other_filters():
+    async def is_admin(_, __, query):
+        return query.from_user == "admin"
+
+    router = CallbackQueryRouter()
+    admin = router.route(r"^menu") & filters.create(is_admin)
+    anyone = router.route(r"^menu")
+
+    query = Query("menu")
+    query.from_user = "user"
+
+    # The first route failing on another filter doesn't hide the query from the second one
+    assert not await admin(None, query)
+    assert await anyone(None, query)
+
+
+@pytest.mark.asyncio
+async def test_no_data():
+    router = CallbackQueryRouter()
+    route = router.route(r".*")
+    bytes_route = router.route(rb"^\x00")
+
+    assert not await route(None, Query(None))
+    assert not await route(None, Query(b"\x00"))
+    assert await bytes_route(None, Query(b"\x00"))
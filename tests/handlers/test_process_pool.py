@@ -0,0 +1,155 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import asyncio
+import os
+import pickle
+import re
+
+import pytest
+
+from pyrogram import enums, raw, types
+from pyrogram.handlers import MessageHandler, run_in_process
+from pyrogram.handlers.process_pool import ProcessPool, dumps
+from ..mtproto.fake_server import CHAT_ID, FakeServer
+
+
+class Client:
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.name = "test"
+        self.me = None
+        self.process_workers = 1
+        self.process_pool = ProcessPool(self)
+        self.sent = []
+
+    async def send_message(self, chat_id, text, **kwargs):
+        self.sent.append((chat_id, text))
+
+
+@run_in_process
+def reply(client, message):
+    message.reply_text(message.matches[0].group(1) * 2, quote=False)
+    client.send_message(message.chat.id, str(sum(range(10 ** 5))))
+
+
+@run_in_process(timeout=0.1)
+def slow(client, message):
+    import time
+    time.sleep(1)
+
+
+@run_in_process
+def answer_with_pid(client, message):
+    message.reply_text(str(os.getpid()), quote=False)
+
+
+@run_in_process
+def fail(client, message):
+    client.send_message(1, "before")
+    raise ValueError("in process")
+
+
+def message(text):
+    msg = types.Message(id=1, chat=types.Chat(id=42, type=enums.ChatType.PRIVATE), text=text)
+    msg.matches = [re.compile(r"(\w+)!").search(text)]
+    return msg
+
+
+@pytest.mark.asyncio
+async def test_calls_are_carried_out():
+    client = Client()
+
+    try:
+        await reply(client, message("hi, ho!"))
+        await fail(client, message("x"))
+    except ValueError as e:
+        assert str(e) == "in process"
+    else:
+        assert False
+    finally:
+        client.process_pool.stop()
+
+    assert client.sent == [(42, "hoho"), (42, "4999950000"), (1, "before")]
+
+
+@pytest.mark.asyncio
+async def test_timeout():
+    client = Client()
+
+    try:
+        with pytest.raises(TimeoutError):
+            await slow(client, message("x"))
+    finally:
+        client.process_pool.stop()
+
+
+def test_matches_survive_pickling():
+    text = "ab ab\nab"
+    matches = [
+        *re.compile(r"(?<=a)b|(a)", re.M).finditer(text),
+        *re.compile(r"^(a)b", re.M).finditer(text),
+        re.compile(r"a|ab").fullmatch(text, 3, 5),
+        re.compile(r"b").search(text, 2),
+    ]
+
+    for match, rebuilt in zip(matches, pickle.loads(dumps(matches))):
+        assert (rebuilt.regs, rebuilt.pos, rebuilt.endpos) == (match.regs, match.pos, match.endpos)
+        assert rebuilt.re == match.re and rebuilt.string == match.string
+
+
+def test_async_callbacks_rejected():
+    with pytest.raises(TypeError):
+        @run_in_process
+        async def callback(client, message):
+            pass
+
+
+def test_handler_runs_in_a_spawned_process():
+    async def main():
+        server = FakeServer(history_size=1, file_size=1)
+        await server.start()
+        client = server.client(process_workers=1)
+        client.add_handler(MessageHandler(answer_with_pid))
+        sent = asyncio.Event()
+        texts = []
+        send_message = server.send_message
+
+        def record(query):
+            texts.append(query.message)
+            sent.set()
+            return send_message(query)
+
+        server.responses[raw.functions.messages.SendMessage] = record
+
+        try:
+            await client.start()
+            server.push_updates([server.message(1)])
+            await asyncio.wait_for(sent.wait(), 30)
+
+            return client.process_pool.executor._mp_context.get_start_method(), texts, server.sent
+        finally:
+            await client.stop()
+            await server.stop()
+
+    start_method, texts, sent = asyncio.run(main())
+
+    assert start_method == "spawn"
+    assert texts != [str(os.getpid())] and texts[0].isdigit()
+    assert sent == {CHAT_ID: 1}
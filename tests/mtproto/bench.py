@@ -0,0 +1,183 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+"""Measure end-to-end client performance against a local fake MTProto server, without network.
+
+Run with ``python -m tests.mtproto.bench [updates] [rpcs] [file size]``.
+
+Without TgCrypto installed, encryption dominates every figure (on both sides, as the server runs in-process too).
+"""
+
+import asyncio
+import io
+import sys
+import time
+import tracemalloc
+
+from pyrogram import handlers, raw
+from pyrogram.file_id import FileId, FileType
+from .fake_server import FakeServer
+
+BATCH = 100
+
+
+async def updates_per_second(server: FakeServer, client, updates: int) -> float:
+    handled = 0
+    done = asyncio.Event()
+
+    async def on_message(_, __):
+        nonlocal handled
+        handled += 1
+
+        if handled == updates:
+            done.set()
+
+    handler = handlers.MessageHandler(on_message)
+    client.add_handler(handler)
+
+    try:
+        start = time.perf_counter()
+
+        for i in range(0, updates, BATCH):
+            server.push_updates([server.message(j) for j in range(i + 1, min(i + BATCH, updates) + 1)])
+
+        await done.wait()
+
+        return updates / (time.perf_counter() - start)
+    finally:
+        client.remove_handler(handler)
+
+
+async def rpc_round_trip(client, rpcs: int) -> float:
+    start = time.perf_counter()
+
+    for _ in range(rpcs):
+        await client.invoke(raw.functions.updates.GetState())
+
+    return (time.perf_counter() - start) / rpcs
+
+
+async def rpc_concurrent(client, rpcs: int) -> float:
+    start = time.perf_counter()
+
+    await asyncio.gather(*(client.invoke(raw.functions.updates.GetState()) for _ in range(rpcs)))
+
+    return rpcs / (time.perf_counter() - start)
+
+
+async def download_throughput(server: FakeServer, client) -> float:
+    file_id = FileId(
+        file_type=FileType.DOCUMENT,
+        dc_id=await client.storage.dc_id(),
+        media_id=1,
+        access_hash=1,
+        file_reference=b"",
+    )
+    start = time.perf_counter()
+
+    async for _ in client.get_file(file_id):
+        pass
+
+    return len(server.file) / (time.perf_counter() - start)
+
+
+async def upload_throughput(server: FakeServer, client) -> float:
+    start = time.perf_counter()
+
+    await client.save_file(io.BytesIO(server.file))
+
+    return len(server.file) / (time.perf_counter() - start)
+
+
+async def memory_per_queued_update(server: FakeServer, client, updates: int) -> float:
+    # Handlers are held so that updates pile up in the dispatcher queue
+    release = asyncio.Event()
+    queue = client.dispatcher.updates_queue
+
+    async def on_message(_, __):
+        await release.wait()
+
+    handler = handlers.MessageHandler(on_message)
+    client.add_handler(handler)
+
+    try:
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        queued = queue.qsize()
+
+        for i in range(0, updates, BATCH):
+            server.push_updates([server.message(j) for j in range(i + 1, min(i + BATCH, updates) + 1)])
+
+        # Wait until the updates are in the queue, minus those taken by the (held) workers
+        while queue.qsize() - queued < updates - client.workers:
+            await asyncio.sleep(0.01)
+
+        size = tracemalloc.get_traced_memory()[0] - before
+
+        return size / (queue.qsize() - queued)
+    finally:
+        tracemalloc.stop()
+        release.set()
+        await queue.join()
+        client.remove_handler(handler)
+
+
+async def bench(updates: int, rpcs: int, file_size: int):
+    server = FakeServer(file_size=file_size)
+    await server.start()
+    client = server.client()
+
+    try:
+        await client.start()
+
+        rate = await updates_per_second(server, client, updates)
+        print(f"{'updates':<24} {rate:>14,.0f} updates/s")
+
+        latency = await rpc_round_trip(client, rpcs)
+        print(f"{'rpc round trip':<24} {latency * 1e6:>14,.0f} us")
+
+        rate = await rpc_concurrent(client, rpcs)
+        print(f"{'rpc concurrent':<24} {rate:>14,.0f} rpcs/s")
+
+        rate = await download_throughput(server, client)
+        print(f"{'download':<24} {rate / 1024 / 1024:>14,.2f} MiB/s")
+
+        rate = await upload_throughput(server, client)
+        print(f"{'upload':<24} {rate / 1024 / 1024:>14,.2f} MiB/s")
+
+        size = await memory_per_queued_update(server, client, updates)
+        print(f"{'memory per queued update':<24} {size:>14,.0f} B")
+    finally:
+        if client.is_connected:
+            await client.stop()
+
+        await server.stop()
+
+
+def main():
+    updates = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    rpcs = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    file_size = int(sys.argv[3]) if len(sys.argv) > 3 else 2 * 1024 * 1024
+
+    asyncio.run(bench(updates, rpcs, file_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,482 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""A local stand-in for a Telegram data center, speaking MTProto over TCP (abridged framing).
+
+It performs the auth key exchange with a throwaway RSA key and serves a synthetic account: a bot signing in, users
+looked up by id, one chat with a message history, messages sent (counted per user), a file to download, file uploads
+and streams of new messages pushed as updates. Requests it
+doesn't know about fail with METHOD_INVALID. Clients connect to it through :meth:`FakeServer.connection_factory`.
+"""
+
+import asyncio
+import functools
+import inspect
+import os
+import random
+import time
+from collections import Counter
+from hashlib import sha1, sha256
+from io import BytesIO
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pyrogram import Client, raw
+from pyrogram.connection import Connection
+from pyrogram.crypto import aes, mtproto, prime, rsa
+from pyrogram.raw.core import BoolTrue, Bytes, Int, Long, Message, MsgContainer, TLObject, Vector
+
+BOT_ID = 777000111
+CHAT_ID = 42
+
+# Queries carrying the actual request
+WRAPPERS = (
+    raw.functions.InvokeWithLayer,
+    raw.functions.InitConnection,
+    raw.functions.InvokeWithoutUpdates,
+    raw.functions.InvokeWithTakeout,
+    raw.functions.InvokeAfterMsg,
+)
+
+SMALL_PRIMES = (3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+
+
+def is_probable_prime(n: int) -> bool:
+    if any(n % p == 0 for p in SMALL_PRIMES):
+        return n in SMALL_PRIMES
+
+    d, s = n - 1, 0
+
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+
+    for _ in range(20):
+        x = pow(random.randrange(2, n - 1), d, n)
+
+        if x in (1, n - 1):
+            continue
+
+        for _ in range(s - 1):
+            x = pow(x, 2, n)
+
+            if x == n - 1:
+                break
+        else:
+            return False
+
+    return True
+
+
+def random_prime(bits: int) -> int:
+    while True:
+        n = random.getrandbits(bits) | (1 << (bits - 1)) | 1
+
+        if is_probable_prime(n):
+            return n
+
+
+@functools.lru_cache()
+def rsa_key() -> Tuple[int, rsa.PublicKey, int]:
+    """A 2048-bit RSA key as (fingerprint, public key, private exponent), generated once per process."""
+    e = 0x10001
+
+    while True:
+        p, q = random_prime(1024), random_prime(1024)
+        n = p * q
+
+        if n.bit_length() == 2048 and (p - 1) % e and (q - 1) % e:
+            break
+
+    d = pow(e, -1, (p - 1) * (q - 1))
+    fingerprint = int.from_bytes(
+        sha1(Bytes(n.to_bytes(256, "big")) + Bytes(e.to_bytes(3, "big"))).digest()[-8:], "little", signed=True
+    )
+
+    return fingerprint, rsa.PublicKey(n, e), d
+
+
+class RawResult(TLObject):
+    """Already serialized result, such as a Vector."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def write(self, *args) -> bytes:
+        return self.data
+
+
+class LocalConnection(Connection):
+    """Connection to a :class:`FakeServer` instead of the data center it's asked for."""
+
+    def __init__(self, server_address: Tuple[str, int], **kwargs):
+        super().__init__(**kwargs)
+        self.address = server_address
+
+
+class ServerConnection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.auth_key: Optional[bytes] = None
+        self.auth_key_id: Optional[bytes] = None
+        self.session_id: Optional[bytes] = None
+        self.salt = 0
+        self.seq = 0
+        self.last_msg_id = 0
+        self.dh = None
+        self.wants_updates = True
+
+    async def recv(self) -> bytes:
+        length = (await self.reader.readexactly(1))[0]
+
+        if length == 0x7F:
+            length = int.from_bytes(await self.reader.readexactly(3), "little")
+
+        return await self.reader.readexactly(length * 4)
+
+    def send(self, data: bytes):
+        length = len(data) // 4
+
+        if length < 0x7F:
+            self.writer.write(bytes((length,)) + data)
+        else:
+            self.writer.write(b"\x7f" + length.to_bytes(3, "little") + data)
+
+    def next_msg_id(self, response: bool) -> int:
+        msg_id = max(int(time.time() * 2 ** 32) & ~3, (self.last_msg_id & ~3) + 4) | (1 if response else 3)
+        self.last_msg_id = msg_id
+
+        return msg_id
+
+    def send_plain(self, body: TLObject):
+        data = body.write()
+        self.send(bytes(8) + Long(self.next_msg_id(True)) + Int(len(data)) + data)
+
+    def send_encrypted(self, body: TLObject, response: bool = True):
+        body = body.write()
+        data = Long(self.salt) + self.session_id + Long(self.next_msg_id(response)) + Int(self.seq * 2 + 1)
+        data += Int(len(body)) + body
+        self.seq += 1
+
+        padding = os.urandom(-(len(data) + 12) % 16 + 12)
+
+        # 96 = 88 + 8 (incoming message, from the client's point of view)
+        msg_key = sha256(self.auth_key[96 : 96 + 32] + data + padding).digest()[8:24]
+        aes_key, aes_iv = mtproto.kdf(self.auth_key, msg_key, False)
+
+        self.send(self.auth_key_id + msg_key + aes.ige256_encrypt(data + padding, aes_key, aes_iv))
+
+    def decrypt(self, packet: bytes) -> Message:
+        msg_key = packet[8:24]
+        aes_key, aes_iv = mtproto.kdf(self.auth_key, msg_key, True)
+        data = aes.ige256_decrypt(packet[24:], aes_key, aes_iv)
+
+        self.salt = int.from_bytes(data[:8], "little", signed=True)
+        self.session_id = data[8:16]
+
+        return Message.read(BytesIO(data[16:]))
+
+
+class FakeServer:
+    """A local MTProto server for tests and benchmarks.
+
+    Parameters:
+        history_size (``int``, *optional*):
+            Messages in the history of the chat served to ``messages.GetHistory``.
+
+        file_size (``int``, *optional*):
+            Size of the file served to ``upload.GetFile``, whatever location is asked for.
+
+    Example:
+        .. code-block:: python
+
+            server = FakeServer()
+            await server.start()
+
+            client = server.client()
+            await client.start()
+    """
+
+    def __init__(self, history_size: int = 10000, file_size: int = 8 * 1024 * 1024):
+        self.history_size = history_size
+        self.file = os.urandom(1024 * 1024) * (file_size // (1024 * 1024)) + os.urandom(file_size % (1024 * 1024))
+
+        self.auth_keys: Dict[bytes, bytes] = {}
+        self.connections: List[ServerConnection] = []
+        self.requests = Counter()
+        self.uploaded = Counter()
+        self.sent = Counter()
+        self.pts = 1
+        self.server = None
+        self.address = None
+
+        self.me = raw.types.User(
+            id=BOT_ID, is_self=True, bot=True, bot_info_version=1, access_hash=1, first_name="Bench",
+            username="bench_bot"
+        )
+
+        self.responses: Dict[type, Callable] = {
+            raw.functions.help.GetConfig: lambda q: RawResult(BoolTrue()),
+            raw.functions.auth.ImportBotAuthorization: lambda q: raw.types.auth.Authorization(user=self.me),
+            raw.functions.auth.ExportAuthorization: lambda q: raw.types.auth.ExportedAuthorization(
+                id=BOT_ID, bytes=os.urandom(32)
+            ),
+            raw.functions.auth.ImportAuthorization: lambda q: raw.types.auth.Authorization(user=self.me),
+            raw.functions.updates.GetState: lambda q: raw.types.updates.State(
+                pts=self.pts, qts=0, date=int(time.time()), seq=0, unread_count=0
+            ),
+            raw.functions.updates.GetDifference: lambda q: raw.types.updates.DifferenceEmpty(
+                date=int(time.time()), seq=0
+            ),
+            raw.functions.users.GetUsers: lambda q: RawResult(
+                Vector([self.me if isinstance(u, raw.types.InputUserSelf) else self.user(u.user_id) for u in q.id])
+            ),
+            raw.functions.users.GetFullUser: lambda q: raw.types.users.UserFull(
+                full_user=raw.types.UserFull(
+                    id=BOT_ID,
+                    settings=raw.types.PeerSettings(),
+                    notify_settings=raw.types.PeerNotifySettings(),
+                    common_chats_count=0,
+                ),
+                chats=[],
+                users=[self.me],
+            ),
+            raw.functions.messages.GetHistory: self.get_history,
+            raw.functions.messages.SendMessage: self.send_message,
+            raw.functions.upload.GetFile: self.get_file,
+            raw.functions.upload.SaveFilePart: self.save_file_part,
+            raw.functions.upload.SaveBigFilePart: self.save_file_part,
+        }
+
+    async def start(self):
+        fingerprint, public_key, _ = rsa_key()
+        rsa.server_public_keys[fingerprint] = public_key
+
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.address = self.server.sockets[0].getsockname()[:2]
+
+    async def stop(self):
+        for connection in self.connections:
+            connection.writer.close()
+
+        self.server.close()
+        await self.server.wait_closed()
+
+        rsa.server_public_keys.pop(rsa_key()[0], None)
+
+    def connection_factory(self, **kwargs) -> LocalConnection:
+        """Use as the ``connection_factory`` of a Client, to connect all of its sessions to this server."""
+        return LocalConnection(self.address, **kwargs)
+
+    def client(self, **kwargs) -> Client:
+        """An in-memory bot Client connected to this server; keyword arguments are passed to :class:`Client`."""
+        client = Client("fake", api_id=1, api_hash="fake", bot_token="1:fake", in_memory=True, **kwargs)
+        client.connection_factory = self.connection_factory
+
+        return client
+
+    def message(self, id: int, text: str = None) -> raw.types.Message:
+        return raw.types.Message(
+            id=id,
+            peer_id=raw.types.PeerUser(user_id=CHAT_ID),
+            from_id=raw.types.PeerUser(user_id=CHAT_ID),
+            date=int(time.time()),
+            message=text if text is not None else f"Message {id}",
+        )
+
+    def user(self, id: int = CHAT_ID) -> raw.types.User:
+        return raw.types.User(id=id, access_hash=id, first_name="Chat", username=f"chat{id}")
+
+    def updates(self, messages: List[raw.types.Message]) -> raw.types.Updates:
+        """New messages as an Updates, each taking the next pts."""
+        updates = []
+
+        for message in messages:
+            self.pts += 1
+            updates.append(raw.types.UpdateNewMessage(message=message, pts=self.pts, pts_count=1))
+
+        return raw.types.Updates(updates=updates, users=[self.user()], chats=[], date=int(time.time()), seq=0)
+
+    def push_updates(self, messages: List[raw.types.Message]):
+        """Send new messages as an Updates to the client connection receiving updates."""
+        updates = self.updates(messages)
+
+        for connection in self.connections:
+            if connection.wants_updates and connection.auth_key is not None:
+                connection.send_encrypted(updates, response=False)
+                return
+
+        raise ConnectionError("No client connection receives updates")
+
+    def get_history(self, query: raw.functions.messages.GetHistory):
+        top = min(query.offset_id - 1 if query.offset_id else self.history_size, self.history_size) - query.add_offset
+
+        if query.max_id:
+            top = min(top, query.max_id - 1)
+
+        ids = range(top, max(top - query.limit, query.min_id, 0), -1)
+
+        return raw.types.messages.Messages(
+            messages=[self.message(i) for i in ids], chats=[], users=[self.user()]
+        )
+
+    def send_message(self, query: raw.functions.messages.SendMessage):
+        self.sent[query.peer.user_id] += 1
+        self.pts += 1
+
+        return raw.types.UpdateShortSentMessage(
+            id=sum(self.sent.values()), pts=self.pts, pts_count=1, date=int(time.time())
+        )
+
+    def get_file(self, query: raw.functions.upload.GetFile):
+        return raw.types.upload.File(
+            type=raw.types.storage.FilePartial(),
+            mtime=0,
+            bytes=self.file[query.offset : query.offset + query.limit],
+        )
+
+    def save_file_part(self, query):
+        self.uploaded[query.file_id] += len(query.bytes)
+
+        return RawResult(BoolTrue())
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connection = ServerConnection(reader, writer)
+        self.connections.append(connection)
+
+        try:
+            # TCPAbridged sends 0xef first
+            await reader.readexactly(1)
+
+            while True:
+                packet = await connection.recv()
+
+                if packet[:8] == bytes(8):
+                    self.auth_key_exchange(connection, TLObject.read(BytesIO(packet[20:])))
+                else:
+                    connection.auth_key_id = packet[:8]
+                    connection.auth_key = self.auth_keys.get(connection.auth_key_id)
+
+                    if connection.auth_key is None:
+                        # Transport error: auth key not found
+                        connection.send(Int(-404))
+                    else:
+                        await self.process(connection, connection.decrypt(packet))
+
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.connections.remove(connection)
+            writer.close()
+
+    def auth_key_exchange(self, connection: ServerConnection, query: TLObject):
+        # https://core.telegram.org/mtproto/auth_key, from the server side
+        if isinstance(query, raw.functions.ReqPqMulti):
+            server_nonce = int.from_bytes(os.urandom(16), "little", signed=True)
+            pq = random_prime(31) * random_prime(31)
+            connection.dh = {"nonce": query.nonce, "server_nonce": server_nonce}
+
+            connection.send_plain(
+                raw.types.ResPQ(
+                    nonce=query.nonce,
+                    server_nonce=server_nonce,
+                    pq=pq.to_bytes(8, "big"),
+                    server_public_key_fingerprints=[rsa_key()[0]],
+                )
+            )
+        elif isinstance(query, raw.functions.ReqDHParams):
+            _, public_key, d = rsa_key()
+            data = pow(int.from_bytes(query.encrypted_data, "big"), d, public_key.m).to_bytes(255, "big")
+            inner = TLObject.read(BytesIO(data[20:]))
+
+            server_nonce = connection.dh["server_nonce"].to_bytes(16, "little", signed=True)
+            new_nonce = inner.new_nonce.to_bytes(32, "little", signed=True)
+            tmp_aes_key = sha1(new_nonce + server_nonce).digest() + sha1(server_nonce + new_nonce).digest()[:12]
+            tmp_aes_iv = (
+                sha1(server_nonce + new_nonce).digest()[12:] + sha1(new_nonce + new_nonce).digest() + new_nonce[:4]
+            )
+
+            a = int.from_bytes(os.urandom(256), "big")
+            answer = raw.types.ServerDHInnerData(
+                nonce=query.nonce,
+                server_nonce=query.server_nonce,
+                g=3,
+                dh_prime=prime.CURRENT_DH_PRIME.to_bytes(256, "big"),
+                g_a=pow(3, a, prime.CURRENT_DH_PRIME).to_bytes(256, "big"),
+                server_time=int(time.time()),
+            ).write()
+            answer_with_hash = sha1(answer).digest() + answer
+            answer_with_hash += os.urandom(-len(answer_with_hash) % 16)
+
+            connection.dh.update(a=a, new_nonce=new_nonce, tmp_aes_key=tmp_aes_key, tmp_aes_iv=tmp_aes_iv)
+            connection.send_plain(
+                raw.types.ServerDHParamsOk(
+                    nonce=query.nonce,
+                    server_nonce=query.server_nonce,
+                    encrypted_answer=aes.ige256_encrypt(answer_with_hash, tmp_aes_key, tmp_aes_iv),
+                )
+            )
+        elif isinstance(query, raw.functions.SetClientDHParams):
+            dh = connection.dh
+            data = aes.ige256_decrypt(query.encrypted_data, dh["tmp_aes_key"], dh["tmp_aes_iv"])
+            inner = TLObject.read(BytesIO(data[20:]))
+
+            auth_key = pow(int.from_bytes(inner.g_b, "big"), dh["a"], prime.CURRENT_DH_PRIME).to_bytes(256, "big")
+            auth_key_hash = sha1(auth_key).digest()
+            self.auth_keys[auth_key_hash[-8:]] = auth_key
+
+            connection.send_plain(
+                raw.types.DhGenOk(
+                    nonce=query.nonce,
+                    server_nonce=query.server_nonce,
+                    new_nonce_hash1=int.from_bytes(
+                        sha1(dh["new_nonce"] + b"\x01" + auth_key_hash[:8]).digest()[-16:], "little", signed=True
+                    ),
+                )
+            )
+
+    async def process(self, connection: ServerConnection, message: Message):
+        body = message.body
+
+        if isinstance(body, MsgContainer):
+            for inner in body.messages:
+                await self.process(connection, inner)
+        elif isinstance(body, (raw.functions.Ping, raw.functions.PingDelayDisconnect)):
+            connection.send_encrypted(raw.types.Pong(msg_id=message.msg_id, ping_id=body.ping_id))
+        elif body.QUALNAME.startswith("functions."):
+            query = body
+
+            while isinstance(query, WRAPPERS):
+                if isinstance(query, raw.functions.InvokeWithoutUpdates):
+                    connection.wants_updates = False
+
+                query = query.query
+
+            self.requests[query.QUALNAME] += 1
+            response = self.responses.get(type(query))
+
+            if response is None:
+                result = raw.types.RpcError(error_code=400, error_message="METHOD_INVALID")
+            else:
+                result = response(query)
+
+                if inspect.isawaitable(result):
+                    result = await result
+
+            connection.send_encrypted(raw.types.RpcResult(req_msg_id=message.msg_id, result=result))
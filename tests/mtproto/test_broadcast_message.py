@@ -0,0 +1,131 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+
+import asyncio
+import os
+from collections import Counter
+
+from pyrogram import raw
+from .fake_server import FakeServer
+
+RECIPIENTS = list(range(1000, 1300))
+WORKERS = 4
+
+
+def test_killed_broadcast_resumes_without_resending(tmp_path):
+    checkpoint_path = str(tmp_path / "broadcast.json")
+
+    def broadcast(client):
+        return client.broadcast_message(
+            RECIPIENTS, "Hi", workers=WORKERS, rate=1000, checkpoint_path=checkpoint_path
+        )
+
+    async def main():
+        server = FakeServer(history_size=1, file_size=1)
+        await server.start()
+        send_message = server.responses[raw.functions.messages.SendMessage]
+        stalled = asyncio.Event()
+        release = asyncio.Event()
+
+        async def stall(query):
+            result = send_message(query)
+
+            # The server takes the message, but the process dies before seeing the result
+            if sum(server.sent.values()) == 150:
+                stalled.set()
+                await release.wait()
+
+            return result
+
+        try:
+            server.responses[raw.functions.messages.SendMessage] = stall
+            client = server.client()
+            await client.start()
+            task = asyncio.create_task(broadcast(client))
+
+            await asyncio.wait_for(stalled.wait(), 30)
+
+            # A killed process leaves the checkpoint as it is now: the finally block never runs
+            with open(checkpoint_path, "rb") as f:
+                on_disk = f.read()
+
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            release.set()
+            await client.stop()
+
+            with open(checkpoint_path, "wb") as f:
+                f.write(on_disk)
+
+            first_run = Counter(server.sent)
+            server.sent.clear()
+            server.responses[raw.functions.messages.SendMessage] = send_message
+
+            client = server.client()
+            await client.start()
+            result = await broadcast(client)
+            await client.stop()
+
+            return first_run, Counter(server.sent), result
+        finally:
+            await server.stop()
+
+    first_run, second_run, result = asyncio.run(main())
+    resent = first_run & second_run
+
+    assert sorted(first_run + second_run) == RECIPIENTS
+    assert len(resent) <= WORKERS
+    assert result.sent_count >= len(RECIPIENTS) and not result.failed
+    assert not os.path.exists(checkpoint_path)
+
+
+def test_network_errors_fail_only_their_recipient():
+    async def main():
+        server = FakeServer(history_size=1, file_size=1)
+        await server.start()
+
+        try:
+            client = server.client()
+            await client.start()
+            invoke = client.invoke
+
+            async def flaky(query, *args, **kwargs):
+                if isinstance(query, raw.functions.messages.SendMessage):
+                    if query.peer.user_id == 1010:
+                        raise ConnectionResetError
+                    if query.peer.user_id == 1020:
+                        raise asyncio.TimeoutError
+
+                return await invoke(query, *args, **kwargs)
+
+            client.invoke = flaky
+            result = await client.broadcast_message(RECIPIENTS[:50], "Hi", workers=WORKERS, rate=1000)
+            await client.stop()
+
+            return Counter(server.sent), result
+        finally:
+            await server.stop()
+
+    sent, result = asyncio.run(main())
+
+    assert sorted(sent) == [i for i in RECIPIENTS[:50] if i not in (1010, 1020)]
+    assert result.sent_count == 48
+    assert result.failed == {1010: "ConnectionResetError", 1020: "TimeoutError"}
@@ -0,0 +1,91 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+import asyncio
+import json
+import os
+
+from pyrogram import raw
+from pyrogram.methods.messages.export_chat_history import split_ranges
+from .fake_server import CHAT_ID, FakeServer
+
+
+def test_split_ranges():
+    assert split_ranges(0, 10, 4) == [[7, 10, 11], [3, 6, 7], [1, 2, 3]]
+    assert split_ranges(100, 110, 5) == [[106, 110, 111], [101, 105, 106]]
+    assert split_ranges(0, 3, 10) == [[1, 3, 4]]
+    assert split_ranges(5, 5, 10) == []
+
+
+def test_interrupted_export_resumes(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+
+    def export(client):
+        return client.export_chat_history(CHAT_ID, path, workers=3, shard_size=250)
+
+    async def main():
+        server = FakeServer(history_size=1000, file_size=1)
+        await server.start()
+        get_history = server.responses[raw.functions.messages.GetHistory]
+        stalled = asyncio.Event()
+
+        async def stall(query):
+            if server.requests["functions.messages.GetHistory"] > 5:
+                stalled.set()
+                await asyncio.Event().wait()
+
+            return get_history(query)
+
+        try:
+            server.responses[raw.functions.messages.GetHistory] = stall
+            client = server.client()
+            await client.start()
+            task = asyncio.create_task(export(client))
+
+            await asyncio.wait_for(stalled.wait(), 30)
+            # Let the pages already fetched be written
+            await asyncio.sleep(0.2)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            await client.stop()
+
+            with open(path + ".checkpoint") as f:
+                checkpoint = json.load(f)
+
+            server.responses[raw.functions.messages.GetHistory] = get_history
+            client = server.client()
+            await client.start()
+            exported = await export(client)
+            await client.stop()
+
+            return checkpoint, exported
+        finally:
+            await server.stop()
+
+    checkpoint, exported = asyncio.run(main())
+
+    with open(path, encoding="utf-8") as f:
+        ids = [json.loads(line)["id"] for line in f]
+
+    # Some shards were left and the export picked up from there, without writing a message twice
+    assert checkpoint["ranges"]
+    assert exported < 1000
+    assert sorted(ids) == list(range(1, 1001))
+    assert not os.path.exists(path + ".checkpoint")
@@ -0,0 +1,134 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+import asyncio
+import io
+
+import pytest
+
+from pyrogram import handlers, raw
+from pyrogram.errors import MethodInvalid
+from pyrogram.file_id import FileId, FileType
+from .fake_server import FakeServer
+
+
+async def session(test, **server_kwargs):
+    server = FakeServer(**server_kwargs)
+    await server.start()
+    client = server.client()
+
+    try:
+        await asyncio.wait_for(client.start(), 30)
+        return server, await asyncio.wait_for(test(server, client), 30)
+    finally:
+        if client.is_connected:
+            await client.stop()
+
+        await server.stop()
+
+
+def test_sign_in_and_history():
+    async def test(server, client):
+        return client.me, [m async for m in client.get_chat_history(42)]
+
+    server, (me, messages) = asyncio.run(session(test, history_size=250))
+
+    assert me.id == server.me.id and me.is_bot
+    assert [m.id for m in messages] == list(range(250, 0, -1))
+    assert messages[0].text == "Message 250"
+
+
+def test_download_and_upload():
+    async def test(server, client):
+        file_id = FileId(
+            file_type=FileType.DOCUMENT,
+            dc_id=await client.storage.dc_id(),
+            media_id=1,
+            access_hash=1,
+            file_reference=b"",
+        )
+        downloaded = b"".join([chunk async for chunk in client.get_file(file_id)])
+        uploaded = await client.save_file(io.BytesIO(server.file))
+
+        return downloaded, uploaded
+
+    server, (downloaded, uploaded) = asyncio.run(session(test, file_size=64 * 1024 + 5))
+
+    assert downloaded == server.file
+    assert server.uploaded[uploaded.id] == len(server.file)
+
+
+def test_pushed_updates_reach_handlers():
+    async def test(server, client):
+        received = []
+        done = asyncio.Event()
+
+        async def on_message(_, message):
+            received.append(message.id)
+
+            if len(received) == 20:
+                done.set()
+
+        client.add_handler(handlers.MessageHandler(on_message))
+        server.push_updates([server.message(i) for i in range(1, 11)])
+        server.push_updates([server.message(i) for i in range(11, 21)])
+
+        await done.wait()
+
+        return sorted(received)
+
+    _, received = asyncio.run(session(test))
+
+    assert received == list(range(1, 21))
+
+
+def test_stop_fails_pending_requests_at_once():
+    async def test(server, client):
+        received = asyncio.Event()
+
+        async def never(query):
+            received.set()
+            await asyncio.Event().wait()
+
+        server.responses[raw.functions.updates.GetState] = never
+        request = asyncio.create_task(client.invoke(raw.functions.updates.GetState()))
+        await received.wait()
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await client.session.stop()
+
+        with pytest.raises(ConnectionError):
+            await request
+
+        return loop.time() - start
+
+    _, elapsed = asyncio.run(session(test, history_size=1))
+
+    # Not retried until the session starts again, which would take WAIT_TIMEOUT per retry
+    assert elapsed < 5
+
+
+def test_unknown_requests_fail():
+    async def test(server, client):
+        with pytest.raises(MethodInvalid):
+            await client.invoke(raw.functions.help.GetNearestDc())
+
+    asyncio.run(session(test))
@@ -0,0 +1,58 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+
+import asyncio
+
+from pyrogram import raw
+from pyrogram.methods.messages.inline_session import get_session
+from pyrogram.session import Session
+from .fake_server import FakeServer
+
+
+def test_rejected_stored_key_is_replaced(monkeypatch):
+    monkeypatch.setattr(Session, "START_TIMEOUT", 0.5)
+
+    async def main():
+        server = FakeServer(history_size=1, file_size=1)
+        await server.start()
+        client = server.client()
+
+        try:
+            await client.start()
+
+            # A key the server doesn't know about, e.g. one dropped after a long time unused
+            await client.storage.dc_auth_key(4, bytes(256))
+
+            session = await get_session(client, 4)
+            auth_key = await client.storage.dc_auth_key(4)
+
+            await session.invoke(raw.functions.updates.GetState())
+            await session.stop()
+
+            return auth_key, server.auth_keys.values()
+        finally:
+            await client.stop()
+            await server.stop()
+
+    auth_key, server_keys = asyncio.run(main())
+
+    assert auth_key != bytes(256)
+    assert auth_key in server_keys
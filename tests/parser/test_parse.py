@@ -0,0 +1,120 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import pytest
+
+from pyrogram import enums, raw
+from pyrogram.parser import Parser
+
+parser = Parser(None)
+
+
+@pytest.mark.asyncio
+async def test_markdown():
+    result = await parser.parse(
+        "**bold** __italic__ `code` 😀 ||spoiler||", enums.ParseMode.MARKDOWN
+    )
+
+    assert result["message"] == "bold italic code 😀 spoiler"
+    assert result["entities"] == [
+        raw.types.MessageEntityBold(offset=0, length=4),
+        raw.types.MessageEntityItalic(offset=5, length=6),
+        raw.types.MessageEntityCode(offset=12, length=4),
+        raw.types.MessageEntitySpoiler(offset=20, length=7),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_markdown_pre_and_links():
+    result = await parser.parse("```python\nprint(1)```", enums.ParseMode.MARKDOWN)
+
+    assert result["message"] == "print(1)"
+    assert result["entities"] == [
+        raw.types.MessageEntityPre(offset=0, length=8, language="python")
+    ]
+
+    result = await parser.parse(
+        "[link](https://pyrogram.org) ![👍](tg://emoji?id=123)",
+        enums.ParseMode.MARKDOWN,
+    )
+
+    assert result["message"] == "link 👍"
+    assert result["entities"] == [
+        raw.types.MessageEntityTextUrl(offset=0, length=4, url="https://pyrogram.org"),
+        raw.types.MessageEntityCustomEmoji(offset=5, length=2, document_id=123),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_markdown_blockquote():
+    result = await parser.parse("> quote\n> line\ntext", enums.ParseMode.MARKDOWN)
+
+    assert result["message"] == "quote\nline\ntext"
+    assert result["entities"] == [
+        raw.types.MessageEntityBlockquote(offset=0, length=11, collapsed=False)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_markdown_delimiters_inside_code():
+    result = await parser.parse("`a**b` **c**", enums.ParseMode.MARKDOWN)
+
+    assert result["message"] == "a**b c"
+    assert result["entities"] == [
+        raw.types.MessageEntityCode(offset=0, length=4),
+        raw.types.MessageEntityBold(offset=5, length=1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_markdown_pre_language_line():
+    result = await parser.parse("```**x**\ncode```", enums.ParseMode.MARKDOWN)
+
+    assert result["message"] == "\ncode"
+    assert result["entities"] == [
+        raw.types.MessageEntityPre(offset=0, length=5, language="**x**")
+    ]
+
+    for text, message in [
+        ("````", ""),
+        ("```b`", ""),
+        ("```py```py```", '">'),
+        ("```py**x\n**", "\n**"),
+        ("```a\n```b\nc```", "b\nc"),
+    ]:
+        result = await parser.parse(text, enums.ParseMode.MARKDOWN)
+
+        assert result["message"] == message
+        assert result["entities"] is None
+
+
+@pytest.mark.asyncio
+async def test_html():
+    result = await parser.parse(
+        '😀 <b>bold</b> <i>a &amp; <u>b</u></i> <a href="https://t.me/👍">x</a>',
+        enums.ParseMode.HTML,
+    )
+
+    assert result["message"] == "😀 bold a & b x"
+    assert result["entities"] == [
+        raw.types.MessageEntityBold(offset=3, length=4),
+        raw.types.MessageEntityItalic(offset=8, length=5),
+        raw.types.MessageEntityUnderline(offset=12, length=1),
+        raw.types.MessageEntityTextUrl(offset=14, length=1, url="https://t.me/👍"),
+    ]
@@ -0,0 +1,77 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from pyrogram import enums
+from pyrogram.types import Identifier, Listener, ListenerRegistry
+
+
+def make_listener(**kwargs) -> Listener:
+    return Listener(
+        listener_type=enums.ListenerTypes.MESSAGE,
+        filters=None,
+        unallowed_click_alert=True,
+        identifier=Identifier(**kwargs),
+    )
+
+
+def update(chat_id=1, user_id=2, message_id=3) -> Identifier:
+    return Identifier(
+        chat_id=[chat_id, None],
+        from_user_id=[user_id, "user"],
+        message_id=message_id,
+    )
+
+
+def test_match():
+    registry = ListenerRegistry()
+    anyone = make_listener()
+    chat = make_listener(chat_id=1)
+    chat_and_user = make_listener(chat_id=[1, 5], from_user_id=2)
+    other_user = make_listener(chat_id=1, from_user_id=9)
+    username = make_listener(from_user_id="user")
+    other_chat = make_listener(chat_id=7)
+
+    for listener in (anyone, chat, chat_and_user, other_user, username, other_chat):
+        registry.append(listener)
+
+    assert registry.match(update()) == [anyone, chat, chat_and_user, username]
+    assert registry.match(update(chat_id=5, user_id=3)) == [anyone, username]
+    assert registry.match(update(chat_id=7)) == [anyone, username, other_chat]
+
+    assert registry.match_pattern(Identifier(chat_id=1)) == [chat, chat_and_user, other_user]
+    assert registry.match_pattern(Identifier(from_user_id=[2, 9])) == [chat_and_user, other_user]
+    assert len(registry.match_pattern(Identifier())) == 6
+
+
+def test_remove():
+    registry = ListenerRegistry()
+    first = make_listener(chat_id=1)
+    second = make_listener(chat_id=1)
+
+    registry.append(first)
+    registry.append(second)
+    registry.remove(first)
+
+    assert first not in registry
+    assert [id(listener) for listener in registry.match(update())] == [id(second)]
+
+    registry.remove(second)
+
+    assert not registry
+    assert registry.index == {field: {} for field in ListenerRegistry.FIELDS}
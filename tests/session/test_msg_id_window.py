@@ -0,0 +1,70 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import time
+
+import pytest
+
+from pyrogram.errors import SecurityCheckMismatch
+from pyrogram.session.internals import MsgIdWindow
+
+
+def server_msg_id(offset: int = 0) -> int:
+    return (int(time.time()) << 32) + offset * 4 + 1
+
+
+def test_duplicates_are_rejected():
+    window = MsgIdWindow(4)
+    window.add(server_msg_id(1))
+
+    window.check(server_msg_id(2))
+
+    with pytest.raises(SecurityCheckMismatch):
+        window.check(server_msg_id(1))
+
+
+def test_evicted_msg_ids_raise_the_floor():
+    window = MsgIdWindow(4)
+
+    for i in range(6):
+        window.check(server_msg_id(i))
+        window.add(server_msg_id(i))
+
+    assert len(window) == 4
+    assert server_msg_id(1) not in window
+
+    with pytest.raises(SecurityCheckMismatch):
+        window.check(server_msg_id(1))
+
+
+def test_time_checks_and_server_time_offset():
+    window = MsgIdWindow(4)
+    window.add(server_msg_id())
+
+    with pytest.raises(SecurityCheckMismatch):
+        window.check(((int(time.time()) + 60) << 32) + 1)
+
+    with pytest.raises(SecurityCheckMismatch):
+        window.check(((int(time.time()) - 600) << 32) + 1)
+
+    # A client clock 60 seconds behind is fine once the offset is known
+    window.check(((int(time.time()) + 60) << 32) + 1, time_offset=60)
+
+    window.add(((int(time.time()) + 60) << 32) + 1)
+    assert 59 <= window.server_time_offset <= 60
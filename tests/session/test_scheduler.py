@@ -0,0 +1,112 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+import asyncio
+
+from pyrogram import raw
+from pyrogram.session import Scheduler
+from pyrogram.session.scheduler import TokenBucket
+
+
+def test_waiters_are_served_by_priority():
+    async def main():
+        bucket = TokenBucket(50)
+        order = []
+
+        async def take(name, priority):
+            await bucket.acquire(priority)
+            order.append(name)
+
+        # The only token goes right away, the rest wait for the next ones
+        await bucket.acquire(Scheduler.DEFAULT)
+
+        await asyncio.gather(
+            take("bulk", Scheduler.BULK),
+            take("default", Scheduler.DEFAULT),
+            take("interactive", Scheduler.INTERACTIVE),
+            take("bulk 2", Scheduler.BULK),
+        )
+
+        return order
+
+    assert asyncio.run(main()) == ["interactive", "default", "bulk", "bulk 2"]
+
+
+def test_pause_slows_down_then_recovers():
+    async def main():
+        bucket = TokenBucket(1000)
+        loop = asyncio.get_running_loop()
+
+        bucket.pause(0.05)
+        paused_rate = bucket.rate
+        start = loop.time()
+        await bucket.acquire(Scheduler.DEFAULT)
+        waited = loop.time() - start
+
+        # Unused afterwards: the rate comes back with time alone
+        await asyncio.sleep(0.1)
+
+        return paused_rate, waited, bucket.is_idle, bucket.rate
+
+    paused_rate, waited, is_idle, rate = asyncio.run(main())
+
+    assert paused_rate == 1000 * TokenBucket.DECREASE_FACTOR
+    assert waited >= 0.05
+    assert is_idle and rate == 1000
+
+
+def test_idle_buckets_are_pruned(monkeypatch):
+    monkeypatch.setattr(Scheduler, "MAX_PEER_BUCKETS", 3)
+
+    async def main():
+        scheduler = Scheduler()
+        flooded = scheduler.get_bucket(("send", "user", 1), 1000)
+        paused = scheduler.get_bucket(("send", "user", 2), 1000)
+        scheduler.get_bucket(("send", "user", 3), 1000)
+
+        flooded.pause(0.01)
+        await asyncio.sleep(0.1)
+        paused.pause(60)
+
+        scheduler.get_bucket(("send", "user", 4), 1000)
+
+        return sorted(key[2] for key in scheduler.buckets)
+
+    # The bucket still paused is kept, the one that recovered from its flood wait isn't
+    assert asyncio.run(main()) == [2, 4]
+
+
+def test_buckets_per_family_and_peer():
+    async def main():
+        scheduler = Scheduler()
+        peer = raw.types.InputPeerUser(user_id=1, access_hash=0)
+        send = raw.functions.messages.SendMessage(peer=peer, message="hi", random_id=1)
+
+        return (
+            scheduler.get_buckets(raw.functions.InvokeWithoutUpdates(query=send)),
+            scheduler.get_buckets(raw.functions.messages.DeleteMessages(id=[1])),
+            scheduler,
+        )
+
+    send_buckets, delete_buckets, scheduler = asyncio.run(main())
+
+    assert [b.rate for b in send_buckets] == [1, 30]
+    assert send_buckets[0] is scheduler.buckets[("send", "user", 1)]
+    assert [b.rate for b in delete_buckets] == [30]
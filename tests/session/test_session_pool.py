@@ -0,0 +1,109 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+
+import asyncio
+
+from pyrogram import Client, handlers, raw
+from pyrogram.session import SessionPool
+from ..mtproto.fake_server import FakeServer
+
+
+def pool(connections: int, priority_lane: bool = False) -> SessionPool:
+    async def main():
+        client = Client("pool", api_id=1, api_hash="x", in_memory=True)
+
+        return SessionPool(client, 2, bytes(256), False, connections, priority_lane)
+
+    # Sessions are bound to the running loop
+    return asyncio.run(main())
+
+
+def test_requests_go_to_the_least_busy_session():
+    sessions = pool(3)
+    main, second, third = sessions.sessions
+    query = raw.functions.updates.GetState()
+
+    # Ties go to the main session
+    assert sessions.get_session(query) is main
+
+    main.results.update(a=None, b=None)
+    second.results.update(a=None)
+
+    assert sessions.get_session(query) is third
+
+    third.results.update(a=None, b=None)
+
+    assert sessions.get_session(query) is second
+    assert [s.no_updates for s in sessions.sessions] == [False, True, True]
+
+
+def test_priority_lane_takes_interactive_requests():
+    sessions = pool(2, priority_lane=True)
+    send = raw.functions.messages.SendMessage(
+        peer=raw.types.InputPeerSelf(), message="hi", random_id=1
+    )
+
+    assert sessions.priority_session.no_updates
+    assert sessions.get_session(send) is sessions.priority_session
+    assert sessions.get_session(raw.functions.InvokeWithoutUpdates(query=send)) is sessions.priority_session
+    assert sessions.get_session(raw.functions.updates.GetState()) is sessions.sessions[0]
+
+
+def test_only_the_main_session_receives_updates():
+    async def main():
+        server = FakeServer(history_size=1, file_size=1)
+        await server.start()
+        client = server.client(connections=3, priority_lane=True)
+        received = []
+
+        async def on_message(_, message):
+            received.append(message.id)
+
+        client.add_handler(handlers.MessageHandler(on_message))
+
+        try:
+            await client.start()
+
+            started = [s.is_started.is_set() for s in client.session.all_sessions]
+            subscribed = [c.wants_updates for c in server.connections if c.auth_key is not None]
+
+            # Even if the server sent the same updates to every connection, they'd be handled once
+            updates = server.updates([server.message(1), server.message(2)])
+
+            for connection in server.connections:
+                if connection.auth_key is not None:
+                    connection.send_encrypted(updates, response=False)
+
+            await asyncio.sleep(0.5)
+        finally:
+            await client.stop()
+            await server.stop()
+
+        stopped = [s.is_started.is_set() for s in client.session.all_sessions]
+
+        return started, subscribed, sorted(received), stopped
+
+    started, subscribed, received, stopped = asyncio.run(main())
+
+    assert started == [True] * 4
+    assert sorted(subscribed) == [False, False, False, True]
+    assert received == [1, 2]
+    assert stopped == [False] * 4
@@ -0,0 +1,47 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import asyncio
+import time
+
+from pyrogram.session.internals import TimerWheel
+
+
+def test_timers_fire_after_their_timeout():
+    async def main():
+        wheel = TimerWheel(resolution=0.02, slots=8)
+        start = time.perf_counter()
+        fired = {}
+
+        # 0.3 seconds needs more than a full turn of the wheel
+        for timeout in (0.05, 0.1, 0.3):
+            wheel.add(timeout, timeout, lambda t=timeout: fired.setdefault(t, time.perf_counter() - start))
+
+        wheel.add("cancelled", 0.05, lambda: fired.setdefault("cancelled", 0))
+        wheel.cancel("cancelled")
+
+        await asyncio.sleep(0.5)
+
+        return wheel, fired
+
+    wheel, fired = asyncio.run(main())
+
+    assert sorted(fired) == [0.05, 0.1, 0.3]
+    assert all(timeout <= elapsed < timeout + 0.1 for timeout, elapsed in fired.items())
+    assert len(wheel) == 0 and wheel.handle is None
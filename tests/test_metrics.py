@@ -0,0 +1,87 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import pytest
+
+from pyrogram.metrics import Histogram, Metrics, TimedQueue
+
+
+def test_snapshot():
+    metrics = Metrics()
+    metrics.increment("bytes_sent", "2", 100)
+    metrics.increment("bytes_sent", "2", 50)
+    metrics.increment("bytes_sent", "4:media", 10)
+    metrics.increment("rpc_in_flight", "2")
+    metrics.increment("rpc_in_flight", "2", -1)
+    metrics.observe("rpc_latency", 0.02, "messages.SendMessage")
+    metrics.observe("rpc_latency", 7, "messages.SendMessage")
+    metrics.observe("updates_queue_wait", 0.0001)
+    metrics.add_gauge("updates_queue_depth", lambda: 3)
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot["bytes_sent"] == {"2": 150, "4:media": 10}
+    assert snapshot["rpc_in_flight"] == {"2": 0}
+    assert snapshot["updates_queue_depth"] == 3
+    assert snapshot["updates_queue_wait"]["count"] == 1
+
+    latency = snapshot["rpc_latency"]["messages.SendMessage"]
+    assert latency["count"] == 2
+    assert latency["sum"] == 7.02
+    assert latency["max"] == 7
+    assert latency["buckets"][0.025] == 1
+    assert latency["buckets"][10] == 1
+    assert sum(latency["buckets"].values()) == 2
+
+
+def test_histogram_overflow():
+    histogram = Histogram()
+    histogram.observe(10 ** 6)
+
+    assert histogram.snapshot()["buckets"][float("inf")] == 1
+
+
+def test_callbacks():
+    metrics = Metrics()
+    values = []
+
+    def broken(name, label, value):
+        raise ValueError
+
+    metrics.add_callback(lambda *args: values.append(args))
+    metrics.add_callback(broken)
+    metrics.increment("reconnects", "2")
+    metrics.increment("reconnects", "2")
+    metrics.observe("handler_time", 0.5, "echo")
+    metrics.remove_callback(broken)
+
+    assert values == [("reconnects", "2", 1), ("reconnects", "2", 2), ("handler_time", "echo", 0.5)]
+
+
+@pytest.mark.asyncio
+async def test_timed_queue():
+    metrics = Metrics()
+    queue = TimedQueue(metrics, "wait")
+
+    queue.put_nowait(1)
+    queue.put_nowait(None)
+
+    assert await queue.get() == 1
+    assert queue.get_nowait() is None
+    assert metrics.snapshot()["wait"]["count"] == 2
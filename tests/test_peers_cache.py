@@ -0,0 +1,101 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+import asyncio
+
+import pytest
+
+from pyrogram import Client, raw
+from pyrogram.client import ParsedPeersCache
+
+
+def user(access_hash=1):
+    return raw.types.User(id=1, access_hash=access_hash, first_name="Pyro")
+
+
+def test_same_raw_peer_is_parsed_once():
+    cache = ParsedPeersCache(10)
+    peer = user()
+    parsed = []
+
+    def parse():
+        parsed.append(peer)
+        return len(parsed)
+
+    assert cache.get(1, peer, parse) == 1
+    assert cache.get(1, peer, parse) == 1
+
+    # An equal object from a later batch is parsed again, unless reuse is enabled
+    assert cache.get(1, user(), parse) == 2
+
+    cache = ParsedPeersCache(10, reuse=True)
+    assert cache.get(1, peer, parse) == 3
+    assert cache.get(1, user(), parse) == 3
+
+
+def test_changed_peer_is_parsed_again():
+    cache = ParsedPeersCache(10, reuse=True)
+
+    assert cache.get(1, user(access_hash=1), lambda: "old") == "old"
+    assert cache.get(1, user(access_hash=2), lambda: "new") == "new"
+    assert cache.get(1, user(access_hash=2), lambda: "newer") == "new"
+
+
+def test_eviction():
+    cache = ParsedPeersCache(4)
+
+    for i in range(5):
+        cache.get(i, i, lambda: i)
+
+    # Going over capacity drops the oldest half
+    assert sorted(cache.store) == [3, 4]
+    assert cache.get(0, 0, lambda: "parsed again") == "parsed again"
+
+
+class FailingStorage:
+    def __init__(self):
+        self.fail = True
+        self.peers = []
+
+    async def update_peers(self, peers):
+        if self.fail:
+            raise OSError("disk full")
+
+        self.peers.extend(peers)
+
+    async def update_usernames(self, usernames):
+        pass
+
+
+def test_peers_are_stored_again_after_a_failed_write():
+    async def main():
+        client = Client("peers", api_id=1, api_hash="x", in_memory=True)
+        client.storage = FailingStorage()
+
+        with pytest.raises(OSError):
+            await client.fetch_peers([user()])
+
+        client.storage.fail = False
+        await client.fetch_peers([user()])
+        await client.fetch_peers([user()])
+
+        return client.storage.peers
+
+    assert asyncio.run(main()) == [(1, 1, "user", None, None)]
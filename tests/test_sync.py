@@ -0,0 +1,113 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import asyncio
+import threading
+
+import pytest
+
+from pyrogram import sync
+
+
+class Source:
+    def __init__(self, count, fail_at=None, page=7):
+        self.count = count
+        self.fail_at = fail_at
+        self.page = page
+        self.closed = False
+
+    async def items(self):
+        try:
+            for i in range(self.count):
+                if i == self.fail_at:
+                    raise ValueError(i)
+
+                # Items come in pages, like get_chat_history
+                if i % self.page == 0:
+                    await asyncio.sleep(0.001)
+
+                yield i
+        finally:
+            self.closed = True
+
+
+def test_main_thread():
+    loop = asyncio.new_event_loop()
+
+    try:
+        source = Source(250)
+        assert list(sync.async_to_sync_gen(source.items(), loop, True)) == list(range(250))
+
+        source = Source(20, fail_at=10)
+        items = []
+
+        with pytest.raises(ValueError):
+            for i in sync.async_to_sync_gen(source.items(), loop, True):
+                items.append(i)
+
+        assert items == list(range(10))
+
+        source = Source(250)
+        gen = sync.async_to_sync_gen(source.items(), loop, True)
+        assert [next(gen) for _ in range(3)] == [0, 1, 2]
+        gen.close()
+        assert source.closed
+    finally:
+        loop.close()
+
+
+def test_other_thread():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+
+    try:
+        source = Source(1000)
+        assert list(sync.async_to_sync_gen(source.items(), loop, False)) == list(range(1000))
+
+        source = Source(300, fail_at=150)
+        items = []
+
+        with pytest.raises(ValueError):
+            for i in sync.async_to_sync_gen(source.items(), loop, False):
+                items.append(i)
+
+        assert items == list(range(150))
+
+        source = Source(10 ** 6, page=1)
+        gen = sync.async_to_sync_gen(source.items(), loop, False)
+        assert [next(gen) for _ in range(3)] == [0, 1, 2]
+        gen.close()
+
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), loop).result()
+        assert source.closed
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def test_lazy_wrap():
+    from pyrogram import types
+    from pyrogram.methods.messages.send_message import SendMessage
+
+    assert isinstance(vars(types.Message)["reply_text"], (sync.SyncMethod, type(sync.idle)))
+    assert types.Message.reply_text.__wrapped__.__name__ == "reply_text"
+    assert vars(types.Message)["reply_text"] is types.Message.reply_text
+    assert SendMessage.send_message.__wrapped__.__name__ == "send_message"
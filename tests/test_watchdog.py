@@ -0,0 +1,134 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import asyncio
+import time
+
+import pytest
+
+from pyrogram.metrics import Metrics
+from pyrogram.watchdog import Watchdog
+
+
+class Client:
+    def __init__(self):
+        self.name = "test"
+        self.metrics = Metrics()
+
+
+class Handler:
+    def __init__(self, callback, filters=None):
+        self.callback = callback
+        self.filters = filters
+
+
+class Update:
+    pass
+
+
+def blocking_callback(client, update):
+    time.sleep(0.4)
+
+
+async def slow_callback(client, update):
+    await asyncio.sleep(0.4)
+
+
+async def run(watchdog, kind, handler, coroutine):
+    reports = []
+    watchdog.callback = reports.append
+    watchdog.start(Client())
+
+    try:
+        with watchdog.watch(kind, handler, Update()):
+            await coroutine
+    finally:
+        await watchdog.stop()
+
+    return reports
+
+
+async def block():
+    blocking_callback(None, None)
+
+    # Let the heartbeat see the lag
+    await asyncio.sleep(0.2)
+
+
+@pytest.mark.asyncio
+async def test_loop_stall():
+    watchdog = Watchdog(stall_threshold=0.1)
+    reports = await run(watchdog, "handler", Handler(blocking_callback), block())
+
+    assert [r["type"] for r in reports] == ["loop_stall"]
+    assert reports[0]["handler"] == "blocking_callback"
+    assert reports[0]["update_type"] == "Update"
+    assert reports[0]["client"] == "test"
+    assert "blocking_callback" in reports[0]["stack"]
+    assert watchdog.client.metrics.snapshot()["loop_lag"]["max"] > 0.2
+
+
+@pytest.mark.asyncio
+async def test_slow_handler():
+    watchdog = Watchdog(slow_threshold=0.1)
+    reports = await run(watchdog, "handler", Handler(slow_callback), slow_callback(None, None))
+
+    assert [r["type"] for r in reports] == ["slow_handler"]
+    assert reports[0]["handler"] == "slow_callback"
+    assert "slow_callback" in reports[0]["stack"]
+
+
+@pytest.mark.asyncio
+async def test_slow_sync_filter():
+    watchdog = Watchdog(slow_threshold=0.1)
+    loop = asyncio.get_running_loop()
+    handler = Handler(slow_callback, blocking_callback)
+    reports = await run(watchdog, "filter", handler, loop.run_in_executor(None, blocking_callback, None, None))
+
+    assert [r["type"] for r in reports] == ["slow_filter"]
+    assert reports[0]["handler"] == "slow_callback"
+    assert "time.sleep" in reports[0]["stack"]
+
+
+@pytest.mark.asyncio
+async def test_loop_stall_blames_the_blocking_task():
+    watchdog = Watchdog(stall_threshold=0.1)
+    reports = []
+    watchdog.callback = reports.append
+    watchdog.start(Client())
+
+    async def watched(handler, coroutine):
+        with watchdog.watch("handler", handler, Update()):
+            await coroutine
+
+    async def late_block():
+        await asyncio.sleep(0.05)
+        await block()
+
+    try:
+        # The blocking handler starts first, and the loop stalls while the other one is waiting
+        blocking = asyncio.create_task(watched(Handler(blocking_callback), late_block()))
+        await asyncio.sleep(0)
+        await watched(Handler(slow_callback), slow_callback(None, None))
+        await blocking
+    finally:
+        await watchdog.stop()
+
+    assert [r["type"] for r in reports] == ["loop_stall"]
+    assert reports[0]["handler"] == "blocking_callback"
@@ -0,0 +1,92 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""Measure how fast media-heavy updates are parsed into Pyrogram types.
+
+Run with ``python -m tests.types.bench_media [count]``.
+"""
+
+import sys
+import time
+
+from pyrogram import raw, types
+
+
+def photo(i: int) -> "raw.types.Photo":
+    return raw.types.Photo(
+        id=i,
+        access_hash=i * 7,
+        file_reference=b"\x01\x00\x00\x00\x00" + i.to_bytes(8, "little"),
+        date=0,
+        dc_id=2,
+        sizes=[
+            raw.types.PhotoSize(type=t, w=w, h=w, size=w * 10)
+            for t, w in (("s", 90), ("m", 320), ("x", 800), ("y", 1280))
+        ],
+    )
+
+
+def video(i: int) -> "raw.types.Document":
+    return raw.types.Document(
+        id=i,
+        access_hash=i * 7,
+        file_reference=b"\x01\x00\x00\x00\x00" + i.to_bytes(8, "little"),
+        date=0,
+        mime_type="video/mp4",
+        size=1 << 20,
+        dc_id=2,
+        attributes=[],
+        thumbs=[
+            raw.types.PhotoSize(type=t, w=w, h=w, size=w * 10)
+            for t, w in (("s", 90), ("m", 320))
+        ],
+    )
+
+
+def parse(count: int, read_ids: bool) -> float:
+    photos = [photo(i) for i in range(count)]
+    videos = [video(i) for i in range(count)]
+    attributes = raw.types.DocumentAttributeVideo(duration=10, w=1280, h=720)
+
+    start = time.perf_counter()
+
+    for p, v in zip(photos, videos):
+        parsed = [
+            types.Photo._parse(None, p),
+            types.Video._parse(None, v, attributes, "video.mp4"),
+        ]
+
+        if read_ids:
+            for media in parsed:
+                for m in [media, *media.thumbs]:
+                    m.file_id, m.file_unique_id
+
+    return 2 * count / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    print(f"{count * 2} media, 6 thumbnails per photo/video pair")
+    print(f"parse only:            {parse(count, False):10.0f} media/s")
+    print(f"parse + read file ids: {parse(count, True):10.0f} media/s")
+
+
+if __name__ == "__main__":
+    main()
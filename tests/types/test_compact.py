@@ -0,0 +1,135 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+from pyrogram import enums, raw, types, utils
+
+
+def user(id=1, **kwargs):
+    return raw.types.User(id=id, access_hash=1, first_name="Pyro", last_name="Gram", **kwargs)
+
+
+def test_user():
+    assert types.CompactUser._parse(user(username="pyro", bot=True)) == types.CompactUser(
+        id=1, username="pyro", first_name="Pyro", last_name="Gram", is_bot=True
+    )
+    assert types.CompactUser._parse(raw.types.UserEmpty(id=2)) == types.CompactUser(id=2)
+    assert types.CompactUser._parse(None) is None
+
+    # Collectible usernames only
+    collectible = user(usernames=[raw.types.Username(username="fragment", active=True)])
+    assert types.CompactUser._parse(collectible).username == "fragment"
+
+
+def test_chat():
+    assert types.CompactChat._parse(user(bot=True)) == types.CompactChat(
+        id=1, type=enums.ChatType.BOT, title="Pyro Gram"
+    )
+
+    group = raw.types.Chat(
+        id=5, title="Group", photo=raw.types.ChatPhotoEmpty(), participants_count=2, date=0, version=1
+    )
+    assert types.CompactChat._parse(group) == types.CompactChat(id=-5, type=enums.ChatType.GROUP, title="Group")
+
+    channel = raw.types.Channel(
+        id=7, title="News", photo=raw.types.ChatPhotoEmpty(), date=0, broadcast=True, username="news"
+    )
+    assert types.CompactChat._parse(channel) == types.CompactChat(
+        id=utils.get_channel_id(7), type=enums.ChatType.CHANNEL, title="News", username="news"
+    )
+
+    users, chats = {1: user()}, {5: group}
+    assert types.CompactChat._parse_peer(raw.types.PeerUser(user_id=1), users, chats).id == 1
+    assert types.CompactChat._parse_peer(raw.types.PeerChat(chat_id=5), users, chats).id == -5
+    assert types.CompactChat._parse_peer(raw.types.PeerChannel(channel_id=7), users, chats) is None
+
+
+def test_chat_member():
+    users = {1: user(username="pyro")}
+    banned = raw.types.ChannelParticipantBanned(
+        peer=raw.types.PeerChannel(channel_id=7),
+        kicked_by=1,
+        date=1700000000,
+        banned_rights=raw.types.ChatBannedRights(until_date=1800000000, view_messages=True),
+    )
+    member = types.CompactChatMember._parse(banned, users, {})
+
+    assert member.id == utils.get_channel_id(7) and member.username is None
+    assert member.status == enums.ChatMemberStatus.BANNED
+    assert member.until_date == utils.timestamp_to_datetime(1800000000)
+
+    owner = types.CompactChatMember._parse(raw.types.ChatParticipantCreator(user_id=1), users, {})
+    assert owner == types.CompactChatMember(id=1, username="pyro", status=enums.ChatMemberStatus.OWNER)
+
+    admin = raw.types.ChannelParticipantAdmin(
+        user_id=1, promoted_by=1, date=1700000000, admin_rights=raw.types.ChatAdminRights()
+    )
+    assert types.CompactChatMember._parse(admin, users, {}).status == enums.ChatMemberStatus.ADMINISTRATOR
+
+
+def test_message():
+    message = raw.types.Message(
+        id=10,
+        peer_id=raw.types.PeerChannel(channel_id=7),
+        from_id=raw.types.PeerUser(user_id=1),
+        date=1700000000,
+        message="Hi",
+        reply_to=raw.types.MessageReplyHeader(reply_to_msg_id=9),
+        media=raw.types.MessageMediaDice(value=3, emoticon="🎲"),
+    )
+
+    assert types.CompactMessage._parse(message) == types.CompactMessage(
+        id=10,
+        chat_id=utils.get_channel_id(7),
+        from_id=1,
+        date=utils.timestamp_to_datetime(1700000000),
+        text="Hi",
+        reply_to_message_id=9,
+        has_media=True,
+    )
+
+    service = raw.types.MessageService(
+        id=11, peer_id=raw.types.PeerUser(user_id=1), date=0, action=raw.types.MessageActionHistoryClear()
+    )
+    assert types.CompactMessage._parse(service).is_service
+    assert types.CompactMessage._parse(service).from_id == 1
+    assert types.CompactMessage._parse(raw.types.MessageEmpty(id=12)) == types.CompactMessage(id=12, empty=True)
+
+
+def test_dialog():
+    dialog = raw.types.Dialog(
+        peer=raw.types.PeerUser(user_id=1),
+        top_message=10,
+        read_inbox_max_id=0,
+        read_outbox_max_id=0,
+        unread_count=3,
+        unread_mentions_count=0,
+        unread_reactions_count=0,
+        notify_settings=raw.types.PeerNotifySettings(),
+        pinned=True,
+    )
+    top_message = raw.types.Message(id=10, peer_id=dialog.peer, date=1700000000, message="")
+
+    record = types.CompactDialog._parse(dialog, {1: top_message}, {1: user()}, {})
+
+    assert record.chat.id == 1 and record.top_message_id == 10
+    assert record.top_message_date == utils.timestamp_to_datetime(1700000000)
+    assert record.unread_messages_count == 3 and record.is_pinned
+
+    assert types.CompactDialog._parse(dialog, {}, {}, {}).chat is None
@@ -0,0 +1,92 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import pickle
+from datetime import datetime
+
+from pyrogram import enums, types
+from pyrogram.file_id import FileId, FileType, FileUniqueId, FileUniqueType
+
+
+def make_message():
+    return types.Message(
+        id=1,
+        from_user=types.User(id=2, first_name="Pyro"),
+        chat=types.Chat(id=2, type=enums.ChatType.PRIVATE, first_name="Pyro"),
+        date=datetime(2024, 1, 1),
+        text="bold",
+        entities=[
+            types.MessageEntity(type=enums.MessageEntityType.BOLD, offset=0, length=4)
+        ],
+    )
+
+
+def test_slotted_objects_have_no_instance_dict():
+    message = make_message()
+
+    assert "text" in types.Message._slot_attributes
+    assert "text" not in message.__dict__
+
+
+def test_pickle_round_trip():
+    message = make_message()
+    unpickled = pickle.loads(pickle.dumps(message))
+
+    assert unpickled == message
+    assert unpickled.date == message.date
+    assert unpickled.photo is None
+
+
+def test_str_skips_empty_attributes():
+    message = make_message()
+
+    assert str(message).startswith('{\n    "_": "Message",\n    "id": 1,')
+    assert "photo" not in str(message)
+    assert repr(message.from_user) == "pyrogram.types.User(id=2, first_name='Pyro')"
+
+
+def test_bind_and_extra_attributes():
+    message = make_message()
+    message.custom = "value"
+    client = object()
+
+    message.bind(client)
+
+    assert message.custom == "value"
+    assert message.from_user._client is client
+    assert pickle.loads(pickle.dumps(message)).custom == "value"
+
+
+def test_file_ids_are_encoded_on_access():
+    file_id = FileId(
+        file_type=FileType.DOCUMENT,
+        dc_id=2,
+        media_id=1,
+        access_hash=3,
+        file_reference=b"\x00\x00ref",
+    )
+    file_unique_id = FileUniqueId(file_unique_type=FileUniqueType.DOCUMENT, media_id=1)
+    document = types.Document(file_id=file_id, file_unique_id=file_unique_id)
+
+    assert document.file_id == file_id.encode()
+    assert document.file_unique_id == file_unique_id.encode()
+    assert document == types.Document(
+        file_id=file_id.encode(), file_unique_id=file_unique_id.encode()
+    )
+    assert f"file_id='{file_id.encode()}'" in repr(document)
@@ -0,0 +1,62 @@
+#  Pyrofork - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2022-present Mayuri-Chan <https://github.com/Mayuri-Chan>
+#
+#  This file is part of Pyrofork.
+#
+#  Pyrofork is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Pyrofork is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Pyrofork.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import pytest
+
+from pyrogram import raw, types, utils
+from pyrogram.parser import Parser
+
+
+async def parse_template(text: str) -> "types.TextTemplate":
+    parsed = await Parser(None).parse(text)
+
+    return types.TextTemplate(text=parsed["message"], entities=parsed["entities"])
+
+
+@pytest.mark.asyncio
+async def test_format_shifts_entities():
+    template = await parse_template("😀 Hi **{name}**, {{total}}: <i>{0:.2f} {1}</i> {missing!r}")
+    rendered = template.format(1.5, "👍", name="<Bob>", missing=None)
+
+    assert rendered.text == "😀 Hi <Bob>, {total}: 1.50 👍 None"
+    assert rendered.entities == [
+        raw.types.MessageEntityBold(offset=6, length=5),
+        raw.types.MessageEntityItalic(offset=22, length=7),
+    ]
+
+    # The template itself is left untouched
+    assert template.entities[0] == raw.types.MessageEntityBold(offset=6, length=6)
+
+
+@pytest.mark.asyncio
+async def test_empty_values_drop_entities():
+    template = await parse_template("**{}**x")
+
+    assert template.format("").entities == []
+    assert template.format("ab").entities == [raw.types.MessageEntityBold(offset=0, length=2)]
+
+
+@pytest.mark.asyncio
+async def test_parse_text_entities():
+    template = await parse_template("**{}**")
+
+    assert await utils.parse_text_entities(None, template.format("a"), None, None) == {
+        "message": "a",
+        "entities": [raw.types.MessageEntityBold(offset=0, length=1)],
+    }